@@ -24,6 +24,39 @@ class Settings:
     SUPABASE_URL: str = os.environ.get("SUPABASE_URL", "")
     SUPABASE_SERVICE_KEY: str = os.environ.get("SUPABASE_SERVICE_KEY", "")
 
+    # Pooled async HTTP client used for Supabase (PostgREST) queries
+    SUPABASE_HTTP2: bool = os.environ.get("SUPABASE_HTTP2", "true").lower() == "true"
+    SUPABASE_POOL_MAX_CONNECTIONS: int = int(os.environ.get("SUPABASE_POOL_MAX_CONNECTIONS", "20"))
+    SUPABASE_POOL_MAX_KEEPALIVE: int = int(os.environ.get("SUPABASE_POOL_MAX_KEEPALIVE", "10"))
+    SUPABASE_POOL_KEEPALIVE_EXPIRY: float = float(
+        os.environ.get("SUPABASE_POOL_KEEPALIVE_EXPIRY", "30")
+    )
+    SUPABASE_QUERY_TIMEOUT: float = float(os.environ.get("SUPABASE_QUERY_TIMEOUT", "30"))
+
+    # Shared keep-alive client for outbound API calls (TikTok, signed storage downloads)
+    HTTP_CLIENT_HTTP2: bool = os.environ.get("HTTP_CLIENT_HTTP2", "true").lower() == "true"
+    HTTP_CLIENT_MAX_CONNECTIONS: int = int(os.environ.get("HTTP_CLIENT_MAX_CONNECTIONS", "50"))
+    HTTP_CLIENT_MAX_KEEPALIVE: int = int(os.environ.get("HTTP_CLIENT_MAX_KEEPALIVE", "20"))
+    HTTP_CLIENT_KEEPALIVE_EXPIRY: float = float(
+        os.environ.get("HTTP_CLIENT_KEEPALIVE_EXPIRY", "60")
+    )
+    HTTP_CLIENT_TIMEOUT: float = float(os.environ.get("HTTP_CLIENT_TIMEOUT", "30"))
+
+    # Seconds a confirmed table presence check is trusted before probing again
+    TABLE_EXISTS_CACHE_TTL: float = float(os.environ.get("TABLE_EXISTS_CACHE_TTL", "3600"))
+
+    # Read-through cache for public campaign and mission listings
+    RESPONSE_CACHE_TTL: float = float(os.environ.get("RESPONSE_CACHE_TTL", "60"))
+    RESPONSE_CACHE_MAXSIZE: int = int(os.environ.get("RESPONSE_CACHE_MAXSIZE", "512"))
+
+    # Shared BrandProfile lookups (id -> profile, userId -> id)
+    BRAND_PROFILE_CACHE_TTL: float = float(os.environ.get("BRAND_PROFILE_CACHE_TTL", "30"))
+    BRAND_PROFILE_CACHE_MAXSIZE: int = int(os.environ.get("BRAND_PROFILE_CACHE_MAXSIZE", "1024"))
+
+    # Creator userId -> CreatorProfile.id mapping used by claim endpoints
+    CREATOR_ID_CACHE_TTL: float = float(os.environ.get("CREATOR_ID_CACHE_TTL", "600"))
+    CREATOR_ID_CACHE_MAXSIZE: int = int(os.environ.get("CREATOR_ID_CACHE_MAXSIZE", "4096"))
+
     # CORS settings - more permissive for App Engine
     ALLOWED_ORIGINS: list[str] = [
         "https://cricher.ai",
@@ -37,12 +70,48 @@ class Settings:
     API_VERSION: str = "1.0.0"
     API_TITLE: str = "Campaign API"
 
+    # Concurrent Supabase storage uploads per worker process (run in threads)
+    STORAGE_MAX_CONCURRENT_UPLOADS: int = int(os.environ.get("STORAGE_MAX_CONCURRENT_UPLOADS", "4"))
+
+    # TikTok Content Posting API (base URL is overridable to point at a local stub)
+    TIKTOK_API_BASE_URL: str = os.environ.get("TIKTOK_API_BASE_URL", "https://open.tiktokapis.com")
+    TIKTOK_UPLOAD_CONCURRENCY: int = int(os.environ.get("TIKTOK_UPLOAD_CONCURRENCY", "3"))
+    TIKTOK_MAX_CONCURRENT_UPLOADS: int = int(os.environ.get("TIKTOK_MAX_CONCURRENT_UPLOADS", "6"))
+    # FILE_UPLOAD chunking (clamped to TikTok's 5-64MB range) and per-chunk retries
+    TIKTOK_CHUNK_SIZE: int = int(os.environ.get("TIKTOK_CHUNK_SIZE", str(10 * 1024 * 1024)))
+    TIKTOK_CHUNK_RETRIES: int = int(os.environ.get("TIKTOK_CHUNK_RETRIES", "3"))
+    # Upload URLs are valid for an hour, so resumable progress is kept that long
+    TIKTOK_UPLOAD_STATE_TTL: float = float(os.environ.get("TIKTOK_UPLOAD_STATE_TTL", "3600"))
+    # Background publish jobs; status polling backs off from the interval up to the max
+    TIKTOK_JOB_WORKERS: int = int(os.environ.get("TIKTOK_JOB_WORKERS", "3"))
+    TIKTOK_JOB_QUEUE_MAXSIZE: int = int(os.environ.get("TIKTOK_JOB_QUEUE_MAXSIZE", "200"))
+    TIKTOK_JOB_TTL: float = float(os.environ.get("TIKTOK_JOB_TTL", "86400"))
+    TIKTOK_STATUS_POLL_INTERVAL: float = float(os.environ.get("TIKTOK_STATUS_POLL_INTERVAL", "3"))
+    TIKTOK_STATUS_POLL_MAX_INTERVAL: float = float(
+        os.environ.get("TIKTOK_STATUS_POLL_MAX_INTERVAL", "30")
+    )
+    TIKTOK_STATUS_POLL_TIMEOUT: float = float(os.environ.get("TIKTOK_STATUS_POLL_TIMEOUT", "900"))
+    # POST /tiktok/publish-status fan-out; final states are cached for a few minutes
+    TIKTOK_STATUS_CONCURRENCY: int = int(os.environ.get("TIKTOK_STATUS_CONCURRENCY", "8"))
+    TIKTOK_STATUS_CACHE_TTL: float = float(os.environ.get("TIKTOK_STATUS_CACHE_TTL", "300"))
+
     # SMTP Settings (for contact form)
     SMTP_HOST: str = os.environ.get("SMTP_HOST", "smtp.gmail.com")
     SMTP_PORT: int = int(os.environ.get("SMTP_PORT", "587"))
     SMTP_SECURE: bool = os.environ.get("SMTP_SECURE", "false").lower() == "true"
     SMTP_USER: str = os.environ.get("SMTP_USER", "")
     SMTP_PASSWORD: str = os.environ.get("SMTP_PASSWORD", "")
+    SMTP_STARTTLS: bool = os.environ.get("SMTP_STARTTLS", "true").lower() == "true"
+    SMTP_TIMEOUT: float = float(os.environ.get("SMTP_TIMEOUT", "30"))
+    # Reopen the persistent SMTP session after this many idle seconds
+    SMTP_IDLE_TIMEOUT: float = float(os.environ.get("SMTP_IDLE_TIMEOUT", "60"))
+
+    # Background mail queue (retries back off exponentially from MAIL_RETRY_BACKOFF seconds)
+    MAIL_WORKERS: int = int(os.environ.get("MAIL_WORKERS", "2"))
+    MAIL_QUEUE_MAXSIZE: int = int(os.environ.get("MAIL_QUEUE_MAXSIZE", "1000"))
+    MAIL_MAX_RETRIES: int = int(os.environ.get("MAIL_MAX_RETRIES", "3"))
+    MAIL_RETRY_BACKOFF: float = float(os.environ.get("MAIL_RETRY_BACKOFF", "1"))
+    MAIL_DRAIN_TIMEOUT: float = float(os.environ.get("MAIL_DRAIN_TIMEOUT", "10"))
 
     def __post_init__(self):
         """Validate critical settings"""
@@ -2,6 +2,16 @@
 Database module for Campaign API
 """
 
+from .async_client import close_async_supabase, create_async_supabase_client, get_async_supabase
 from .connection import create_supabase_client, supabase
+from .storage import remove_objects, upload_object
 
-__all__ = ["supabase", "create_supabase_client"]
+__all__ = [
+    "supabase",
+    "create_supabase_client",
+    "get_async_supabase",
+    "create_async_supabase_client",
+    "close_async_supabase",
+    "upload_object",
+    "remove_objects",
+]
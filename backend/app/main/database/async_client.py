@@ -0,0 +1,80 @@
+"""
+Async, pooled Supabase (PostgREST) client for table queries
+"""
+
+import importlib.util
+import logging
+
+import httpx
+from postgrest import AsyncPostgrestClient
+
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PooledAsyncPostgrestClient(AsyncPostgrestClient):
+    """AsyncPostgrestClient backed by a shared keep-alive (and HTTP/2 when available) pool."""
+
+    def create_session(self, base_url, headers, timeout) -> httpx.AsyncClient:
+        http2 = settings.SUPABASE_HTTP2 and importlib.util.find_spec("h2") is not None
+        if settings.SUPABASE_HTTP2 and not http2:
+            logger.warning("SUPABASE_HTTP2 is enabled but 'h2' is not installed, using HTTP/1.1")
+
+        return httpx.AsyncClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=timeout,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=settings.SUPABASE_POOL_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.SUPABASE_POOL_MAX_KEEPALIVE,
+                keepalive_expiry=settings.SUPABASE_POOL_KEEPALIVE_EXPIRY,
+            ),
+        )
+
+
+def create_async_supabase_client() -> PooledAsyncPostgrestClient | None:
+    """Initialize and return the pooled async PostgREST client."""
+    supabase_url = settings.SUPABASE_URL
+    supabase_key = settings.SUPABASE_SERVICE_KEY
+
+    if not supabase_url or not supabase_key:
+        logger.error(
+            f"Missing Supabase environment variables. URL present: {bool(supabase_url)}, Key present: {bool(supabase_key)}"
+        )
+        return None
+
+    try:
+        client = PooledAsyncPostgrestClient(
+            f"{supabase_url.rstrip('/')}/rest/v1",
+            headers={"apiKey": supabase_key, "Authorization": f"Bearer {supabase_key}"},
+            timeout=settings.SUPABASE_QUERY_TIMEOUT,
+        )
+        logger.info(
+            f"Async Supabase client initialized (max_connections={settings.SUPABASE_POOL_MAX_CONNECTIONS})"
+        )
+        return client
+    except Exception as e:
+        logger.error(f"Failed to initialize async Supabase client: {str(e)}")
+        return None
+
+
+_async_supabase: PooledAsyncPostgrestClient | None = None
+
+
+def get_async_supabase() -> PooledAsyncPostgrestClient | None:
+    """Return the shared async client, creating it on first use."""
+    global _async_supabase
+    if _async_supabase is None:
+        _async_supabase = create_async_supabase_client()
+    return _async_supabase
+
+
+async def close_async_supabase() -> None:
+    """Close the pooled connections of the shared async client."""
+    global _async_supabase
+    if _async_supabase is not None:
+        await _async_supabase.aclose()
+        _async_supabase = None
+        logger.info("Async Supabase client closed")
@@ -0,0 +1,65 @@
+"""
+Batched row loaders for Supabase tables
+"""
+
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+from postgrest import AsyncPostgrestClient
+
+logger = logging.getLogger(__name__)
+
+# PostgREST receives `in.(...)` filters in the query string; keep each request well under
+# common URL length limits when resolving large id sets.
+IN_QUERY_CHUNK_SIZE = 200
+
+
+def _unique_ids(ids: Iterable[Any]) -> list[str]:
+    """Return the distinct, non-empty ids as strings, preserving first-seen order."""
+    return list(dict.fromkeys(str(value) for value in ids if value))
+
+
+async def fetch_rows(
+    supabase_client: AsyncPostgrestClient,
+    table_name: str,
+    column: str,
+    values: Iterable[Any],
+    columns: str = "*",
+) -> list[dict[str, Any]]:
+    """Fetch every row whose `column` matches one of `values` using `in_()` queries."""
+    unique_values = _unique_ids(values)
+    rows: list[dict[str, Any]] = []
+
+    for start in range(0, len(unique_values), IN_QUERY_CHUNK_SIZE):
+        chunk = unique_values[start : start + IN_QUERY_CHUNK_SIZE]
+        response = (
+            await supabase_client.table(table_name).select(columns).in_(column, chunk).execute()
+        )
+        rows.extend(response.data or [])
+
+    logger.info(
+        f"Loaded {len(rows)} rows from {table_name} for {len(unique_values)} distinct {column} values"
+    )
+    return rows
+
+
+async def fetch_rows_by_ids(
+    supabase_client: AsyncPostgrestClient,
+    table_name: str,
+    ids: Iterable[Any],
+    columns: str = "*",
+    key: str = "id",
+) -> dict[str, dict[str, Any]]:
+    """Fetch rows by primary key in bulk and index them by `key` (which must be selected)."""
+    rows = await fetch_rows(supabase_client, table_name, key, ids, columns)
+    return {str(row[key]): row for row in rows if row.get(key) is not None}
+
+
+def group_rows_by(rows: Iterable[dict[str, Any]], key: str) -> dict[str, list[dict[str, Any]]]:
+    """Group rows by the string value of `key`, keeping the original row order."""
+    grouped: dict[str, list[dict[str, Any]]] = {}
+    for row in rows:
+        if row.get(key) is not None:
+            grouped.setdefault(str(row[key]), []).append(row)
+    return grouped
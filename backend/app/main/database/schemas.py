@@ -1,3 +1,68 @@
+# Columns of public.campaigns, in table order (kept in sync with CREATE_TABLE_SQL)
+CAMPAIGN_COLUMNS = (
+    "id",
+    "brand_id",
+    "title",
+    "brief",
+    "requirements",
+    "budget_range",
+    "budget_unit",
+    "commission",
+    "platform",
+    "deadline",
+    "max_creators",
+    "is_open",
+    "created_at",
+    "sample_video_url",
+    "industry_category",
+    "primary_promotion_objectives",
+    "ad_placement",
+    "campaign_execution_mode",
+    "creator_profile_preferences_gender",
+    "creator_profile_preference_ethnicity",
+    "creator_profile_preference_content_niche",
+    "preferred_creator_location",
+    "language_requirement_for_creators",
+    "creator_tier_requirement",
+    "send_to_creator",
+    "approved_by_brand",
+    "kpi_reference_target",
+    "prohibited_content_warnings",
+    "posting_requirements",
+    "product_photo",
+    "script_required",
+    "product_name",
+    "product_highlight",
+    "product_price",
+    "product_sold_number",
+    "paid_promotion_type",
+    "video_buyout_budget_range",
+    "base_fee_budget_range",
+)
+
+# Named column sets accepted by the `fields` query parameter on campaign endpoints
+CAMPAIGN_PROJECTIONS = {
+    # What listing cards render; leaves out the long free-text columns
+    "card": (
+        "id",
+        "brand_id",
+        "title",
+        "budget_range",
+        "budget_unit",
+        "commission",
+        "platform",
+        "deadline",
+        "max_creators",
+        "is_open",
+        "created_at",
+        "sample_video_url",
+        "product_photo",
+        "industry_category",
+        "paid_promotion_type",
+    ),
+    "detail": CAMPAIGN_COLUMNS,
+}
+
 # SQL for table creation
 CREATE_TABLE_SQL = """
 CREATE TABLE IF NOT EXISTS public.campaigns (
@@ -57,4 +122,62 @@ CREATE POLICY "Service role can do everything"
 
 -- Enable row level security
 ALTER TABLE public.campaigns ENABLE ROW LEVEL SECURITY;
+
+-- Campaign search: weighted full-text index on title/brief plus trigram indexes for
+-- substring matches on title and brand name
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS campaigns_search_idx ON public.campaigns USING gin ((
+  setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+  setweight(to_tsvector('english', coalesce(brief, '')), 'B')
+));
+CREATE INDEX IF NOT EXISTS campaigns_title_trgm_idx
+  ON public.campaigns USING gin (title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS brand_profile_company_name_trgm_idx
+  ON public."BrandProfile" USING gin ("companyName" gin_trgm_ops);
+
+-- The earlier 3-argument version would make named RPC calls ambiguous, so drop it
+DROP FUNCTION IF EXISTS public.search_campaigns(text, text, integer);
+
+CREATE OR REPLACE FUNCTION public.search_campaigns(
+  search_query    text,
+  platform_filter text    DEFAULT NULL,
+  result_limit    integer DEFAULT 100,
+  category_filter text    DEFAULT NULL
+)
+RETURNS SETOF public.campaigns
+LANGUAGE sql STABLE
+AS $$
+  -- The substring pattern escapes LIKE's own wildcards so `%` and `_` match literally
+  WITH q AS (
+    SELECT
+      websearch_to_tsquery('english', search_query) AS tsq,
+      '%' || replace(replace(replace(search_query, '\\', '\\\\'), '%', '\\%'), '_', '\\_') || '%'
+        AS pattern
+  )
+  SELECT c.*
+  FROM public.campaigns c
+  CROSS JOIN q
+  LEFT JOIN public."BrandProfile" b ON b.id = c.brand_id
+  WHERE (platform_filter IS NULL OR c.platform = platform_filter)
+    AND (category_filter IS NULL OR c.industry_category = category_filter)
+    AND (
+      (setweight(to_tsvector('english', coalesce(c.title, '')), 'A') ||
+       setweight(to_tsvector('english', coalesce(c.brief, '')), 'B')) @@ q.tsq
+      OR c.title ILIKE q.pattern
+      OR b."companyName" ILIKE q.pattern
+    )
+  ORDER BY
+    ts_rank(
+      setweight(to_tsvector('english', coalesce(c.title, '')), 'A') ||
+      setweight(to_tsvector('english', coalesce(c.brief, '')), 'B'),
+      q.tsq
+    )
+    + greatest(similarity(c.title, search_query), similarity(coalesce(b."companyName", ''), search_query))
+    DESC,
+    c.created_at DESC
+  LIMIT result_limit;
+$$;
+
+GRANT EXECUTE ON FUNCTION public.search_campaigns(text, text, integer, text) TO service_role;
 """
@@ -0,0 +1,79 @@
+"""
+Async gateway for Supabase storage uploads
+"""
+
+import asyncio
+import io
+import logging
+from typing import Any
+
+from ..config.settings import settings
+from ..utils.concurrency import loop_semaphore
+
+logger = logging.getLogger(__name__)
+
+StorageBody = bytes | io.BufferedReader
+
+
+def _file_options(content_type: str | None, upsert: bool) -> dict[str, str]:
+    # storage3 sends file options as request headers, so every value must be a string;
+    # upsert is the `x-upsert` header
+    return {
+        "content-type": content_type or "application/octet-stream",
+        "x-upsert": "true" if upsert else "false",
+    }
+
+
+def _upload_blocking(
+    client: Any,
+    bucket: str,
+    path: str,
+    content: StorageBody,
+    content_type: str | None,
+    upsert: bool,
+) -> None:
+    storage = client.storage.from_(bucket)
+    try:
+        storage.upload(path, content, _file_options(content_type, upsert))
+        logger.info(f"Uploaded {path} to {bucket} bucket")
+        return
+    except Exception as upload_err:
+        logger.error(f"Upload error for {bucket}/{path}: {str(upload_err)}")
+
+    # Remove whatever is at the path and try once more
+    try:
+        storage.remove([path])
+        logger.info(f"Removed existing object at {bucket}/{path} before retry")
+    except Exception:
+        pass
+
+    if isinstance(content, io.BufferedReader):
+        content.seek(0)
+    storage.upload(path, content, _file_options(content_type, upsert))
+    logger.info(f"Retry upload succeeded for {bucket}/{path}")
+
+
+async def upload_object(
+    client: Any,
+    bucket: str,
+    path: str,
+    content: StorageBody,
+    content_type: str | None = None,
+    upsert: bool = True,
+) -> None:
+    """Upload to storage off the event loop; a failed upload is retried once after a remove.
+
+    The sync storage client runs in a worker thread, and at most
+    STORAGE_MAX_CONCURRENT_UPLOADS uploads run at once per worker process. Raises the
+    storage error if the retry fails too.
+    """
+    async with loop_semaphore("storage_uploads", settings.STORAGE_MAX_CONCURRENT_UPLOADS):
+        await asyncio.to_thread(
+            _upload_blocking, client, bucket, path, content, content_type, upsert
+        )
+
+
+async def remove_objects(client: Any, bucket: str, paths: list[str]) -> None:
+    """Remove objects from storage off the event loop."""
+    if paths:
+        await asyncio.to_thread(client.storage.from_(bucket).remove, paths)
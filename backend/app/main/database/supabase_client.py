@@ -1,20 +1,65 @@
-"""
-Database module for Campaign API
-"""
-
-import logging
-
-from .connection import create_supabase_client, supabase
-
-logger = logging.getLogger(__name__)
-
-__all__ = ["supabase", "create_supabase_client"]
-
-
-def get_supabase_client():
-    """Get Supabase client instance."""
-    try:
-        return create_supabase_client()
-    except Exception as e:
-        logger.error(f"Failed to create Supabase client: {e}")
-        raise
+"""
+Managed registry of shared Supabase clients
+"""
+
+import logging
+
+from supabase import Client
+
+from . import connection
+from .async_client import (
+    PooledAsyncPostgrestClient,
+    close_async_supabase,
+    get_async_supabase,
+)
+from .connection import create_supabase_client, supabase
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "supabase",
+    "create_supabase_client",
+    "get_supabase_client",
+    "get_async_supabase",
+    "startup_clients",
+    "shutdown_clients",
+]
+
+
+def get_supabase_client() -> Client | None:
+    """Get the shared Supabase client, creating it only if none is registered yet."""
+    if connection.supabase is None:
+        try:
+            connection.supabase = create_supabase_client()
+        except Exception as e:
+            logger.error(f"Failed to create Supabase client: {e}")
+            raise
+    return connection.supabase
+
+
+async def startup_clients() -> tuple[Client | None, PooledAsyncPostgrestClient | None]:
+    """Create the shared clients up front so the first requests reuse warm connections."""
+    sync_client = get_supabase_client()
+    async_client = get_async_supabase()
+    logger.info(
+        f"Supabase clients ready (sync: {sync_client is not None}, async: {async_client is not None})"
+    )
+    return sync_client, async_client
+
+
+async def shutdown_clients() -> None:
+    """Close the pooled connections held by the shared clients."""
+    await close_async_supabase()
+
+    sync_client = connection.supabase
+    if sync_client is None:
+        return
+    # supabase.Client builds its PostgREST/storage sessions lazily; only close the ones in use.
+    try:
+        if sync_client._postgrest is not None:
+            sync_client._postgrest.aclose()
+        if sync_client._storage is not None:
+            sync_client._storage.aclose()
+    except Exception as e:
+        logger.warning(f"Error closing Supabase client sessions: {e}")
+    logger.info("Supabase clients closed")
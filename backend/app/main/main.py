@@ -1,4 +1,5 @@
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -41,12 +42,45 @@ try:
 except ImportError as e:
     logger.error(f"Import error: {e}")
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open shared connection pools on startup and release them on shutdown"""
+    try:
+        from .database.supabase_client import shutdown_clients, startup_clients
+        from .services.mail_service import mail_service
+        from .services.tiktok_job_service import tiktok_job_service
+        from .utils.email_templates import load_email_templates
+        from .utils.http_client import close_http_client, get_http_client
+        from .utils.validators import warm_table_exists_cache
+    except ImportError as e:
+        logger.error(f"Supabase client registry unavailable: {e}")
+        yield
+        return
+
+    _, async_client = await startup_clients()
+    if async_client:
+        await warm_table_exists_cache(async_client)
+    load_email_templates()
+    get_http_client()
+    await mail_service.start()
+    await tiktok_job_service.start()
+    try:
+        yield
+    finally:
+        await tiktok_job_service.stop()
+        await mail_service.stop()
+        await close_http_client()
+        await shutdown_clients()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title=getattr(settings, "API_TITLE", "Campaign API"),
     version=getattr(settings, "API_VERSION", "1.0.0"),
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
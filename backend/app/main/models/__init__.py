@@ -3,7 +3,7 @@ Data models for Campaign API
 """
 
 from .ai_video import AiVideoGenerateResponse
-from .campaign import Campaign, CampaignCreate
+from .campaign import Campaign, CampaignCreate, CampaignPage
 from .claim import CampaignClaimCreate, CampaignClaimResponse
 from .contact import ContactFormData, ContactResponse
 from .entertainment_live import (
@@ -18,6 +18,7 @@ __all__ = [
     "AiVideoGenerateResponse",
     "Campaign",
     "CampaignCreate",
+    "CampaignPage",
     "CampaignClaimCreate",
     "CampaignClaimResponse",
     "UploadResponse",
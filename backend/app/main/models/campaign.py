@@ -109,6 +109,14 @@ class CampaignWithApplications(Campaign):
     brand: dict[str, Any] | None = None
 
 
+class CampaignPage(BaseModel):
+    """A page of public campaigns with the cursor for the next page."""
+
+    items: list[Campaign]
+    next_cursor: str | None = None
+    limit: int
+
+
 class CampaignMutationResponse(BaseModel):
     """Standard response envelope for campaign create/update/delete operations."""
 
@@ -1,4 +1,7 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
+
+# Upper bound on campaign ids per batch claim check (one `in_()` query)
+MAX_BATCH_CLAIM_CHECK = 200
 
 
 class CampaignClaimCreate(BaseModel):
@@ -23,6 +26,22 @@ class CampaignClaimExistsResponse(BaseModel):
     exists: bool
 
 
+class CampaignClaimBatchCheck(BaseModel):
+    """Which of these campaigns has the creator (by user ID) already applied to?"""
+
+    model_config = ConfigDict(populate_by_name=True)
+    creator_id: str = Field(..., alias="creatorId")
+    campaign_ids: list[str] = Field(
+        ..., alias="campaignIds", min_length=1, max_length=MAX_BATCH_CLAIM_CHECK
+    )
+
+
+class CampaignClaimBatchCheckResponse(BaseModel):
+    """Campaign ID -> whether the creator has a claim on it."""
+
+    claims: dict[str, bool]
+
+
 class CampaignClaimOperationResponse(BaseModel):
     success: bool | None = None
     status: str
@@ -8,29 +8,50 @@ from ..models.campaign import (
     Campaign,
     CampaignCreate,
     CampaignMutationResponse,
+    CampaignPage,
     CampaignWithApplications,
 )
+from ..services.brand_profile_service import BrandProfileService
 from ..services.brand_service import BrandService
-from ..services.campaign_service import CampaignService
+from ..services.campaign_service import (
+    CAMPAIGN_MAX_PAGE_SIZE,
+    CAMPAIGN_PAGE_SIZE,
+    CampaignService,
+)
+from ..utils.projections import projected_response
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-@router.get("/", response_model=list[Campaign])
+@router.get("/", response_model=CampaignPage)
 async def get_campaigns(
-    search: str | None = Query(None, description="Search term for title or brand"),
+    search: str | None = Query(None, description="Search term for title, brief or brand name"),
     platform: str | None = Query(None, description="Filter by platform"),
     category: str | None = Query(None, description="Filter by category"),
+    limit: int = Query(
+        CAMPAIGN_PAGE_SIZE, ge=1, le=CAMPAIGN_MAX_PAGE_SIZE, description="Page size"
+    ),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    fields: str | None = Query(
+        None, description='Projection name ("card", "detail") or comma-separated columns'
+    ),
 ):
-    """Get all campaigns with optional filtering."""
-    return await CampaignService.get_campaigns(search, platform, category)
+    """Get a page of campaigns with optional filtering, newest first."""
+    result = await CampaignService.get_campaigns(search, platform, category, limit, cursor, fields)
+    return projected_response(result) if fields else result
 
 
 @router.get("/{campaign_id}", response_model=Campaign)
-async def get_campaign_by_id(campaign_id: str = Path(..., description="The ID of the campaign")):
+async def get_campaign_by_id(
+    campaign_id: str = Path(..., description="The ID of the campaign"),
+    fields: str | None = Query(
+        None, description='Projection name ("card", "detail") or comma-separated columns'
+    ),
+):
     """Get a specific campaign by ID for public viewing."""
-    return await CampaignService.get_campaign_by_id(campaign_id)
+    result = await CampaignService.get_campaign_by_id(campaign_id, fields)
+    return projected_response(result) if fields else result
 
 
 # Fix the brand campaigns routes to have proper paths
@@ -41,9 +62,15 @@ async def get_brand_campaigns(
     start_date: str | None = Query(None, description="Filter by start date (format: YYYY-MM-DD)"),
     end_date: str | None = Query(None, description="Filter by end date (format: YYYY-MM-DD)"),
     search: str | None = Query(None, description="Search in campaign title or description"),
+    fields: str | None = Query(
+        None, description='Projection name ("card", "detail") or comma-separated columns'
+    ),
 ):
     """Get all campaigns for a specific brand with optional filtering."""
-    return await BrandService.get_brand_campaigns(brand_id, status, start_date, end_date, search)
+    result = await BrandService.get_brand_campaigns(
+        brand_id, status, start_date, end_date, search, fields
+    )
+    return projected_response(result) if fields else result
 
 
 @router.get("/brand/{brand_id}/campaign/{campaign_id}", response_model=CampaignWithApplications)
@@ -84,29 +111,28 @@ async def add_campaign(
 async def ensure_brand_profile(brand_id: str = Path(..., description="The user ID of the brand")):
     """Ensure a brand profile exists for the given user ID."""
     try:
-        from ..database.connection import supabase
+        from ..database.async_client import get_async_supabase
+
+        supabase = get_async_supabase()
 
         if not supabase:
             raise HTTPException(500, "Database not configured")
 
         # Check if brand profile exists
-        brand_profile_response = (
-            supabase.table("BrandProfile")
-            .select("id, userId, companyName")
-            .eq("userId", brand_id)
-            .execute()
-        )
+        brand_profile = await BrandProfileService.get_by_user_id(brand_id)
 
-        if brand_profile_response.data and len(brand_profile_response.data) > 0:
+        if brand_profile:
             return {
                 "exists": True,
-                "brand_profile": brand_profile_response.data[0],
+                "brand_profile": {
+                    key: brand_profile.get(key) for key in ("id", "userId", "companyName")
+                },
                 "message": "Brand profile already exists",
             }
 
         # Create brand profile if it doesn't exist
         create_response = (
-            supabase.table("BrandProfile")
+            await supabase.table("BrandProfile")
             .insert(
                 {
                     "userId": brand_id,
@@ -116,6 +142,7 @@ async def ensure_brand_profile(brand_id: str = Path(..., description="The user I
             )
             .execute()
         )
+        BrandProfileService.invalidate(user_id=brand_id)
 
         if create_response.data and len(create_response.data) > 0:
             return {
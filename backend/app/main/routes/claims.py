@@ -3,12 +3,15 @@ import logging
 from fastapi import APIRouter, HTTPException, Path, Query, Request
 
 from ..models.claim import (
+    CampaignClaimBatchCheck,
+    CampaignClaimBatchCheckResponse,
     CampaignClaimCreate,
     CampaignClaimExistsResponse,
     CampaignClaimOperationResponse,
     CreatorCampaignClaim,
 )
 from ..services.claim_service import ClaimService
+from ..utils.projections import projected_response
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -33,6 +36,18 @@ async def check_campaign_claim_alt(
     return await ClaimService.check_campaign_claim(creatorId, campaignId)
 
 
+@router.post("/check-batch", response_model=CampaignClaimBatchCheckResponse)
+async def check_campaign_claims_batch(batch: CampaignClaimBatchCheck):
+    """Check which of several campaigns a creator has already applied to."""
+    return await ClaimService.check_campaign_claims(batch.creator_id, batch.campaign_ids)
+
+
+@router.post("/campaign-claims/check-batch", response_model=CampaignClaimBatchCheckResponse)
+async def check_campaign_claims_batch_alt(batch: CampaignClaimBatchCheck):
+    """Check which of several campaigns a creator has already applied to - alternative endpoint."""
+    return await ClaimService.check_campaign_claims(batch.creator_id, batch.campaign_ids)
+
+
 @router.post("/", status_code=201, response_model=CampaignClaimOperationResponse)
 async def create_campaign_claim(request: Request, campaign_claim: CampaignClaimCreate):
     """Create a new campaign claim (application) from a creator."""
@@ -51,9 +66,13 @@ async def get_creator_campaign_claims(
     request: Request,
     creator_id: str = Path(..., description="Creator user ID"),
     limit: int = Query(10, ge=1, le=100, description="Maximum number of claims to return"),
+    fields: str | None = Query(
+        None, description='Projection name ("card", "detail") or comma-separated campaign columns'
+    ),
 ):
     """Get campaign claims for a specific creator using userId."""
-    return await ClaimService.get_creator_campaign_claims(creator_id, limit)
+    result = await ClaimService.get_creator_campaign_claims(creator_id, limit, fields)
+    return projected_response(result) if fields else result
 
 
 @router.patch("/{claim_id}/status", response_model=CampaignClaimOperationResponse)
@@ -1,8 +1,11 @@
 from fastapi import APIRouter
 
 from ..config.settings import settings
-from ..database.connection import supabase
+from ..database.async_client import get_async_supabase
 from ..models.common import GenericStatusResponse, SQLScriptResponse
+from ..services.mail_service import mail_service
+from ..services.tiktok_job_service import tiktok_job_service
+from ..utils.cache import cache_stats
 from ..utils.validators import validate_supabase_connection
 
 router = APIRouter()
@@ -11,6 +14,7 @@ router = APIRouter()
 @router.get("/health", response_model=GenericStatusResponse)
 async def health_check():
     """API health check endpoint."""
+    supabase = get_async_supabase()
     connection_ok, connection_msg = await validate_supabase_connection(supabase)
 
     env_vars = {
@@ -26,6 +30,9 @@ async def health_check():
             "message": connection_msg,
         },
         "environment": env_vars,
+        "caches": cache_stats(),
+        "mail": mail_service.stats(),
+        "tiktok_jobs": tiktok_job_service.stats(),
         "api_version": settings.API_VERSION,
     }
 
@@ -1,17 +1,44 @@
+import asyncio
+import hashlib
 import logging
-import math
 
 import httpx
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field, HttpUrl
 
+from ..config.settings import settings
 from ..database.connection import supabase
+from ..services.tiktok_job_service import tiktok_job_service as tiktok_jobs
+from ..utils.cache import get_cache
+from ..utils.concurrency import loop_semaphore
+from ..utils.http_client import get_http_client
 
 router = APIRouter(prefix="/tiktok", tags=["tiktok"])
 logger = logging.getLogger(__name__)
 
 BUCKET_NAME = "aivideogenerated"
 
+# TikTok FILE_UPLOAD limits: chunks are 5-64MB, the final chunk absorbs the remainder
+# (up to 128MB) and videos under 5MB must be sent as a single chunk
+TIKTOK_MIN_CHUNK_SIZE = 5 * 1024 * 1024
+TIKTOK_MAX_CHUNK_SIZE = 64 * 1024 * 1024
+
+# Publish states after which TikTok's status no longer changes
+TIKTOK_FINAL_STATUSES = frozenset({"PUBLISH_COMPLETE", "FAILED", "SEND_TO_USER_INBOX"})
+
+# Chunk relays run for as long as the transfer takes; only connecting is bounded
+TRANSFER_TIMEOUT = httpx.Timeout(None, connect=settings.HTTP_CLIENT_TIMEOUT)
+
+# publish_id -> chunked upload progress, kept for as long as TikTok's upload_url is valid
+_upload_progress = get_cache(
+    "tiktok_upload_progress", maxsize=1024, ttl=settings.TIKTOK_UPLOAD_STATE_TTL
+)
+
+# (token digest, publish_id) -> status payload, only for publishes in a final state
+_final_publish_status = get_cache(
+    "tiktok_final_publish_status", maxsize=4096, ttl=settings.TIKTOK_STATUS_CACHE_TTL
+)
+
 
 class UploadVideo(BaseModel):
     id: str | None = None
@@ -37,6 +64,10 @@ class UploadRequest(BaseModel):
     videos: list[UploadVideo]
 
 
+class ResumeUploadRequest(BaseModel):
+    access_token: str
+
+
 class PublishStatusRequest(BaseModel):
     access_token: str
     publish_ids: list[str] = Field(default_factory=list)
@@ -81,7 +112,7 @@ async def _init_tiktok_publish(
         },
     }
     resp = await client.post(
-        "https://open.tiktokapis.com/v2/post/publish/video/init/",
+        f"{settings.TIKTOK_API_BASE_URL}/v2/post/publish/video/init/",
         headers={"Authorization": f"Bearer {access_token}"},
         json=payload,
         timeout=30,
@@ -101,7 +132,9 @@ async def _signed_supabase_url(path: str) -> str:
     if not supabase:
         raise HTTPException(status_code=500, detail="Supabase client unavailable")
     try:
-        signed = supabase.storage.from_(BUCKET_NAME).create_signed_url(path, 60 * 30)
+        signed = await asyncio.to_thread(
+            supabase.storage.from_(BUCKET_NAME).create_signed_url, path, 60 * 30
+        )
         if isinstance(signed, dict):
             signed_url = signed.get("signedURL") or signed.get("signed_url")
         else:
@@ -147,44 +180,148 @@ async def _fetch_video_size(client: httpx.AsyncClient, source_url: str) -> int:
     raise HTTPException(status_code=502, detail="Unable to determine video size")
 
 
-async def _stream_upload(upload_url: str, source_url: str, video_size: int) -> None:
-    async with httpx.AsyncClient(timeout=None) as client:
-        async with client.stream("GET", source_url) as src:
-            if src.status_code != 200:
-                text = await src.aread()
+def _chunk_plan(video_size: int, preferred_chunk_size: int) -> tuple[int, int]:
+    """Return a TikTok-compliant (chunk_size, total_chunk_count) for a video."""
+    if video_size < TIKTOK_MIN_CHUNK_SIZE:
+        return video_size, 1
+    chunk_size = min(max(preferred_chunk_size, TIKTOK_MIN_CHUNK_SIZE), TIKTOK_MAX_CHUNK_SIZE)
+    chunk_size = min(chunk_size, video_size)
+    # Trailing bytes ride along with the last chunk, which stays under 2 * chunk_size
+    return chunk_size, video_size // chunk_size
+
+
+def _chunk_ranges(progress: dict) -> list[tuple[int, int]]:
+    """Inclusive byte ranges of every chunk in an upload."""
+    chunk_size = progress["chunk_size"]
+    last = progress["total_chunk_count"] - 1
+    return [
+        (
+            index * chunk_size,
+            progress["video_size"] - 1 if index == last else (index + 1) * chunk_size - 1,
+        )
+        for index in range(last + 1)
+    ]
+
+
+class _SourceReadError(Exception):
+    """The source video could not be read for a chunk (handled like a failed PUT)."""
+
+    def __init__(self, status: int, body: str):
+        super().__init__(f"Source read failed with HTTP {status}")
+        self.status = status
+        self.body = body
+
+
+async def _put_chunk(
+    client: httpx.AsyncClient, upload_url: str, source_url: str, start: int, end: int, total: int
+) -> httpx.Response:
+    """Relay one byte range from the source to TikTok without buffering it."""
+    whole_file = start == 0 and end == total - 1
+    headers = {} if whole_file else {"Range": f"bytes={start}-{end}"}
+
+    async with client.stream("GET", source_url, headers=headers, timeout=TRANSFER_TIMEOUT) as src:
+        if src.status_code not in (200, 206) or (src.status_code == 200 and not whole_file):
+            text = await src.aread()
+            raise _SourceReadError(src.status_code, text.decode(errors="ignore"))
+
+        return await client.put(
+            upload_url,
+            headers={
+                "Content-Type": "video/mp4",
+                "Content-Length": str(end - start + 1),
+                "Content-Range": f"bytes {start}-{end}/{total}",
+            },
+            content=src.aiter_bytes(),
+            timeout=TRANSFER_TIMEOUT,
+        )
+
+
+async def _upload_chunks(source_url: str, progress: dict) -> None:
+    """PUT every chunk not yet acknowledged, retrying only the chunk that failed.
+
+    `progress["next_byte"]` advances after each acknowledged chunk, so a later call
+    (see the resume endpoint) continues where an interrupted upload stopped. Any exit
+    before the last chunk, including cancellation, leaves the upload "interrupted".
+    """
+    progress["status"] = "uploading"
+    try:
+        await _relay_chunks(get_http_client(), source_url, progress)
+    except BaseException:
+        progress["status"] = "interrupted"
+        _upload_progress.set(progress["publish_id"], progress)
+        raise
+
+    progress["status"] = "uploaded"
+    _upload_progress.set(progress["publish_id"], progress)
+
+
+async def _relay_chunks(client: httpx.AsyncClient, source_url: str, progress: dict) -> None:
+    retries = settings.TIKTOK_CHUNK_RETRIES
+    for start, end in _chunk_ranges(progress):
+        if end < progress["next_byte"]:
+            continue
+
+        for attempt in range(retries + 1):
+            try:
+                put_resp = await _put_chunk(
+                    client,
+                    progress["upload_url"],
+                    source_url,
+                    start,
+                    end,
+                    progress["video_size"],
+                )
+                if put_resp.is_success:
+                    break
+                retryable = put_resp.status_code == 429 or put_resp.status_code >= 500
+                resumable = retryable
+                error = {
+                    "message": "TikTok upload failed",
+                    "status": put_resp.status_code,
+                    "body": put_resp.text,
+                }
+            except _SourceReadError as exc:
+                retryable = exc.status in (408, 429) or exc.status >= 500
+                # TikTok still holds the acknowledged chunks; a resume re-signs the source
+                resumable = True
+                error = {
+                    "message": "Failed to read source video",
+                    "status": exc.status,
+                    "body": exc.body,
+                }
+            except httpx.TransportError as exc:
+                retryable = resumable = True
+                error = {"message": "TikTok upload interrupted", "error": str(exc)}
+
+            if not retryable or attempt == retries:
                 raise HTTPException(
                     status_code=502,
                     detail={
-                        "message": "Failed to read source video",
-                        "status": src.status_code,
-                        "body": text.decode(errors="ignore"),
+                        **error,
+                        "publish_id": progress["publish_id"],
+                        "next_byte": progress["next_byte"],
+                        "resumable": resumable,
                     },
                 )
 
-            put_resp = await client.put(
-                upload_url,
-                headers={
-                    "Content-Type": "video/mp4",
-                    "Content-Length": str(video_size),
-                    "Content-Range": f"bytes 0-{video_size - 1}/{video_size}",
-                },
-                content=src.aiter_bytes(),
+            delay = 0.5 * 2**attempt
+            logger.warning(
+                "TikTok chunk %s-%s for %s failed (attempt %s), retrying in %.1fs",
+                start,
+                end,
+                progress["publish_id"],
+                attempt + 1,
+                delay,
             )
+            await asyncio.sleep(delay)
 
-            if not put_resp.is_success:
-                raise HTTPException(
-                    status_code=502,
-                    detail={
-                        "message": "TikTok upload failed",
-                        "status": put_resp.status_code,
-                        "body": put_resp.text,
-                    },
-                )
+        progress["next_byte"] = end + 1
+        _upload_progress.set(progress["publish_id"], progress)
 
 
 async def _fetch_publish_status(client: httpx.AsyncClient, access_token: str, publish_id: str):
     resp = await client.post(
-        "https://open.tiktokapis.com/v2/post/publish/status/fetch/",
+        f"{settings.TIKTOK_API_BASE_URL}/v2/post/publish/status/fetch/",
         headers={"Authorization": f"Bearer {access_token}"},
         json={"publish_id": publish_id},
         timeout=30,
@@ -193,89 +330,295 @@ async def _fetch_publish_status(client: httpx.AsyncClient, access_token: str, pu
     if not resp.is_success:
         raise HTTPException(
             status_code=502,
-            detail={"message": "TikTok publish status fetch failed", "payload": data},
+            detail={
+                "message": "TikTok publish status fetch failed",
+                "status": resp.status_code,
+                "payload": data,
+            },
         )
     return data
 
 
+def _token_digest(access_token: str) -> str:
+    return hashlib.sha256(access_token.encode()).hexdigest()
+
+
+def _publish_state(payload: dict) -> str | None:
+    return (payload.get("data") or {}).get("status")
+
+
+async def _cached_publish_status(
+    client: httpx.AsyncClient, access_token: str, publish_id: str
+) -> dict:
+    """Fetch a publish status, answering from cache once TikTok reports a final state.
+
+    Entries are keyed by a digest of the token too, so a cached payload is only served to
+    a caller that was already allowed to read it.
+    """
+    key = (_token_digest(access_token), publish_id)
+    cached = _final_publish_status.get(key)
+    if cached is not None:
+        return cached
+
+    payload = await _fetch_publish_status(client, access_token, publish_id)
+    if _publish_state(payload) in TIKTOK_FINAL_STATUSES:
+        _final_publish_status.set(key, payload)
+    return payload
+
+
+async def _relay_video(client: httpx.AsyncClient, access_token: str, video: UploadVideo) -> str:
+    """Init a FILE_UPLOAD publish and relay the video's chunks; returns the publish_id."""
+    async with loop_semaphore("tiktok_uploads", settings.TIKTOK_MAX_CONCURRENT_UPLOADS):
+        source_url: str | None = None
+        if video.video_url:
+            source_url = str(video.video_url)
+        elif video.video_path:
+            source_url = await _signed_supabase_url(video.video_path)
+
+        if not source_url:
+            raise HTTPException(status_code=400, detail="Missing video_url or video_path")
+
+        video_size = await _fetch_video_size(client, source_url)
+        chunk_size, total_chunk_count = _chunk_plan(video_size, settings.TIKTOK_CHUNK_SIZE)
+
+        upload_url, publish_id = await _init_tiktok_publish(
+            client,
+            access_token,
+            video.title,
+            video_size,
+            chunk_size,
+            total_chunk_count,
+            video,
+        )
+
+        # Only the source reference and a digest of the token are kept (never the token
+        # itself), so a resume can re-sign an expired storage URL and verify its caller
+        progress = {
+            "publish_id": publish_id,
+            "owner": _token_digest(access_token),
+            "upload_url": upload_url,
+            "video_url": str(video.video_url) if video.video_url else None,
+            "video_path": video.video_path,
+            "video_size": video_size,
+            "chunk_size": chunk_size,
+            "total_chunk_count": total_chunk_count,
+            "next_byte": 0,
+            "status": "initialized",
+        }
+        _upload_progress.set(publish_id, progress)
+
+        await _upload_chunks(source_url, progress)
+        return publish_id
+
+
+async def _upload_one(
+    client: httpx.AsyncClient,
+    access_token: str,
+    video: UploadVideo,
+    request_slots: asyncio.Semaphore,
+) -> dict:
+    """Run the full relay for one video; failures are reported in its result, not raised."""
+    async with request_slots:
+        try:
+            publish_id = await _relay_video(client, access_token, video)
+            publish_status = await _fetch_publish_status(client, access_token, publish_id)
+
+            return {
+                "id": video.id,
+                "status": "ok",
+                "publish_id": publish_id,
+                "publish_status": publish_status,
+            }
+        except HTTPException as exc:
+            return {"id": video.id, "status": "error", "error": exc.detail}
+        except Exception as exc:  # pragma: no cover - unexpected
+            logger.error("Unexpected TikTok upload error: %s", exc)
+            return {"id": video.id, "status": "error", "error": "Unexpected server error"}
+
+
+async def _poll_publish_status(access_token: str, job: dict) -> dict:
+    """Poll TikTok until the publish reaches a final state, backing off between calls.
+
+    Transient failures (429, 5xx, transport errors) are retried until
+    TIKTOK_STATUS_POLL_TIMEOUT runs out; any other error (an expired token, an unknown
+    publish_id) is raised straight away.
+    """
+    client = get_http_client()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.TIKTOK_STATUS_POLL_TIMEOUT
+    delay = settings.TIKTOK_STATUS_POLL_INTERVAL
+
+    while True:
+        try:
+            payload = await _cached_publish_status(client, access_token, job["publish_id"])
+            tiktok_jobs.update(job["job_id"], publish_status=payload)
+            if _publish_state(payload) in TIKTOK_FINAL_STATUSES:
+                return payload
+        except HTTPException as exc:
+            upstream = exc.detail.get("status") if isinstance(exc.detail, dict) else None
+            if upstream != 429 and (upstream is None or upstream < 500):
+                raise
+            logger.warning("Publish status poll for %s failed: %s", job["publish_id"], exc)
+        except httpx.TransportError as exc:
+            logger.warning("Publish status poll for %s failed: %s", job["publish_id"], exc)
+
+        if loop.time() + delay > deadline:
+            raise HTTPException(
+                status_code=504,
+                detail={
+                    "message": "TikTok publish did not reach a final state in time",
+                    "publish_id": job["publish_id"],
+                },
+            )
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, settings.TIKTOK_STATUS_POLL_MAX_INTERVAL)
+
+
+def _publish_job_runner(access_token: str, video: UploadVideo):
+    async def run(job: dict) -> None:
+        try:
+            tiktok_jobs.update(job["job_id"], status="uploading")
+            publish_id = await _relay_video(get_http_client(), access_token, video)
+            tiktok_jobs.update(job["job_id"], status="processing", publish_id=publish_id)
+
+            payload = await _poll_publish_status(access_token, job)
+            if _publish_state(payload) == "FAILED":
+                tiktok_jobs.update(job["job_id"], status="failed", error=payload.get("data"))
+            else:
+                tiktok_jobs.update(job["job_id"], status="completed")
+        except HTTPException as exc:
+            tiktok_jobs.update(job["job_id"], status="failed", error=exc.detail)
+        except httpx.HTTPError as exc:
+            logger.error("TikTok publish job %s failed: %s", job["job_id"], exc)
+            tiktok_jobs.update(
+                job["job_id"],
+                status="failed",
+                error={"message": "TikTok request failed", "error": str(exc) or repr(exc)},
+            )
+
+    return run
+
+
 @router.post("/upload-ai-video")
 async def upload_ai_video(body: UploadRequest):
     if not body.videos:
         raise HTTPException(status_code=400, detail="No videos provided")
 
-    results = []
-    async with httpx.AsyncClient(timeout=30) as client:
-        for video in body.videos:
-            try:
-                source_url: str | None = None
-                if video.video_url:
-                    source_url = str(video.video_url)
-                elif video.video_path:
-                    source_url = await _signed_supabase_url(video.video_path)
+    # Videos are relayed concurrently, bounded per request and across the worker;
+    # gather keeps results in the order the videos were submitted
+    request_slots = asyncio.Semaphore(max(1, settings.TIKTOK_UPLOAD_CONCURRENCY))
+    client = get_http_client()
+    results = await asyncio.gather(
+        *(_upload_one(client, body.access_token, video, request_slots) for video in body.videos)
+    )
 
-                if not source_url:
-                    raise HTTPException(status_code=400, detail="Missing video_url or video_path")
+    return {"results": results}
 
-                video_size = await _fetch_video_size(client, source_url)
-                # Single-chunk upload to TikTok; chunk size equals the video size
-                chunk_size = video_size
-                total_chunk_count = max(1, math.ceil(video_size / chunk_size))
 
-                upload_url, publish_id = await _init_tiktok_publish(
-                    client,
-                    body.access_token,
-                    video.title,
-                    video_size,
-                    chunk_size,
-                    total_chunk_count,
-                    video,
-                )
+@router.post("/jobs", status_code=202)
+async def create_publish_jobs(body: UploadRequest):
+    """Queue each video as a background publish job and return the job ids right away.
 
-                await _stream_upload(upload_url, source_url, video_size)
-                publish_status = await _fetch_publish_status(client, body.access_token, publish_id)
+    Workers relay the video, then poll TikTok until the publish is final; progress is
+    read back from GET /tiktok/jobs/{job_id}.
+    """
+    if not body.videos:
+        raise HTTPException(status_code=400, detail="No videos provided")
 
-                results.append(
-                    {
-                        "id": video.id,
-                        "status": "ok",
-                        "publish_id": publish_id,
-                        "publish_status": publish_status,
-                    }
-                )
-            except HTTPException as exc:
-                results.append({"id": video.id, "status": "error", "error": exc.detail})
-            except Exception as exc:  # pragma: no cover - unexpected
-                logger.error("Unexpected TikTok upload error: %s", exc)
-                results.append(
-                    {"id": video.id, "status": "error", "error": "Unexpected server error"}
-                )
+    results = []
+    for video in body.videos:
+        job = tiktok_jobs.enqueue(_publish_job_runner(body.access_token, video), id=video.id)
+        if job is None:
+            results.append({"id": video.id, "status": "error", "error": "TikTok job queue is full"})
+        else:
+            results.append({"id": video.id, "status": job["status"], "job_id": job["job_id"]})
 
     return {"results": results}
 
 
+@router.get("/jobs/{job_id}")
+async def get_publish_job(job_id: str):
+    job = tiktok_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="TikTok publish job not found")
+    return job
+
+
+@router.post("/upload-ai-video/{publish_id}/resume")
+async def resume_ai_video_upload(publish_id: str, body: ResumeUploadRequest):
+    """Continue an interrupted chunked upload from the last acknowledged byte.
+
+    Only the token that started the upload may resume it, and only once it has been
+    interrupted, so a single relay ever owns the upload at a time.
+    """
+    progress = _upload_progress.get(publish_id)
+    if not progress:
+        raise HTTPException(status_code=404, detail="No resumable upload for this publish_id")
+    if progress["owner"] != _token_digest(body.access_token):
+        raise HTTPException(status_code=403, detail="Upload was started with a different token")
+    if progress["status"] != "interrupted":
+        raise HTTPException(
+            status_code=409,
+            detail={"message": "Upload is not interrupted", "status": progress["status"]},
+        )
+
+    # Claimed before the first await, so a concurrent resume sees "uploading" and gets 409
+    progress["status"] = "uploading"
+    try:
+        try:
+            source_url = progress["video_url"] or await _signed_supabase_url(progress["video_path"])
+        except BaseException:
+            progress["status"] = "interrupted"
+            raise
+        # Resumed relays count against the same worker-wide cap as new uploads
+        async with loop_semaphore("tiktok_uploads", settings.TIKTOK_MAX_CONCURRENT_UPLOADS):
+            await _upload_chunks(source_url, progress)
+
+        publish_status = await _fetch_publish_status(
+            get_http_client(), body.access_token, publish_id
+        )
+    except HTTPException as exc:
+        return {"publish_id": publish_id, "status": "error", "error": exc.detail}
+
+    return {
+        "publish_id": publish_id,
+        "status": "ok",
+        "next_byte": progress["next_byte"],
+        "publish_status": publish_status,
+    }
+
+
+async def _publish_status_result(
+    client: httpx.AsyncClient, access_token: str, publish_id: str, slots: asyncio.Semaphore
+) -> dict:
+    async with slots:
+        try:
+            payload = await _cached_publish_status(client, access_token, publish_id)
+            return {"publish_id": publish_id, "status": "ok", "payload": payload}
+        except HTTPException as exc:
+            return {"publish_id": publish_id, "status": "error", "error": exc.detail}
+        except Exception as exc:  # pragma: no cover
+            logger.error("Unexpected publish status error: %s", exc)
+            return {
+                "publish_id": publish_id,
+                "status": "error",
+                "error": "Unexpected server error",
+            }
+
+
 @router.post("/publish-status")
 async def publish_status(body: PublishStatusRequest):
     if not body.publish_ids:
         raise HTTPException(status_code=400, detail="No publish_ids provided")
 
-    results = []
-    async with httpx.AsyncClient(timeout=30) as client:
-        for publish_id in body.publish_ids:
-            try:
-                status_payload = await _fetch_publish_status(client, body.access_token, publish_id)
-                results.append(
-                    {"publish_id": publish_id, "status": "ok", "payload": status_payload}
-                )
-            except HTTPException as exc:
-                results.append({"publish_id": publish_id, "status": "error", "error": exc.detail})
-            except Exception as exc:  # pragma: no cover
-                logger.error("Unexpected publish status error: %s", exc)
-                results.append(
-                    {
-                        "publish_id": publish_id,
-                        "status": "error",
-                        "error": "Unexpected server error",
-                    }
-                )
+    # Status fetches fan out over the shared client; results keep the request order
+    slots = asyncio.Semaphore(max(1, settings.TIKTOK_STATUS_CONCURRENCY))
+    client = get_http_client()
+    results = await asyncio.gather(
+        *(
+            _publish_status_result(client, body.access_token, publish_id, slots)
+            for publish_id in body.publish_ids
+        )
+    )
 
     return {"results": results}
@@ -83,7 +83,7 @@ async def upload_verification(
         logger.info("Starting verification process...")
 
         # Check if ID number already exists
-        if verification_service.check_id_exists(id_number):
+        if await verification_service.check_id_exists(id_number):
             raise HTTPException(400, "This ID number has already been submitted.")
 
         # Create verification data object
@@ -113,10 +113,10 @@ async def upload_verification(
         }
 
         # Upload files and get paths
-        file_paths = verification_service.upload_files(id_number, files)
+        file_paths = await verification_service.upload_files(id_number, files)
 
         # Create verification record
-        result = verification_service.create_verification(verification_data, file_paths)
+        result = await verification_service.create_verification(verification_data, file_paths)
 
         return TikTokVerificationResponse(
             success=True, message="Verification submitted successfully", data=result.get("data")
@@ -159,11 +159,11 @@ async def submit_verification_with_paths(verification_data: TikTokVerificationWi
         logger.info(f"Processing verification with paths for ID: {verification_data.id_number}")
 
         # Check if ID already exists
-        if verification_service.check_id_exists(verification_data.id_number):
+        if await verification_service.check_id_exists(verification_data.id_number):
             raise HTTPException(400, f"ID number {verification_data.id_number} already exists")
 
         # Create verification record with the provided file paths
-        result = verification_service.create_verification_with_paths(verification_data)
+        result = await verification_service.create_verification_with_paths(verification_data)
 
         return TikTokVerificationResponse(
             success=True, message="Verification submitted successfully", data=result.get("data")
@@ -181,7 +181,7 @@ async def submit_verification_with_paths(verification_data: TikTokVerificationWi
 async def get_verification(verification_id: str):
     """Get verification by ID"""
     try:
-        verification = verification_service.get_verification_by_id(verification_id)
+        verification = await verification_service.get_verification_by_id(verification_id)
         if not verification:
             raise HTTPException(404, "Verification not found")
 
@@ -197,7 +197,7 @@ async def get_verification(verification_id: str):
 async def get_verifications(limit: int = 50, offset: int = 0):
     """Get all verifications with pagination"""
     try:
-        verifications = verification_service.get_verifications(limit, offset)
+        verifications = await verification_service.get_verifications(limit, offset)
         return {
             "success": True,
             "data": verifications,
@@ -225,9 +225,12 @@ async def setup_database():
     try:
         # Check if table exists by trying a simple query
         try:
-            verification_service.supabase.table("influencer_verifications").select("id").limit(
-                1
-            ).execute()
+            await (
+                verification_service.db.table("influencer_verifications")
+                .select("id")
+                .limit(1)
+                .execute()
+            )
             return {"message": "Table 'influencer_verifications' exists and is accessible"}
         except Exception as table_error:
             logger.error(f"Table check error: {str(table_error)}")
@@ -243,7 +246,7 @@ async def setup_database():
 async def diagnose_database():
     """Diagnose database and storage status"""
     try:
-        result = verification_service.diagnose_database()
+        result = await verification_service.diagnose_database()
         return result
     except Exception as e:
         logger.error(f"Error diagnosing database: {str(e)}")
@@ -258,9 +261,12 @@ async def health_check():
         db_status = "healthy"
         db_message = "Database connection successful"
         try:
-            verification_service.supabase.table("influencer_verifications").select("id").limit(
-                1
-            ).execute()
+            await (
+                verification_service.db.table("influencer_verifications")
+                .select("id")
+                .limit(1)
+                .execute()
+            )
         except Exception as db_error:
             db_status = "unhealthy"
             db_message = f"Database connection failed: {str(db_error)}"
@@ -5,7 +5,9 @@ import uuid
 from fastapi import HTTPException, UploadFile
 
 from ..config.settings import settings
+from ..database.async_client import get_async_supabase
 from ..database.connection import supabase
+from ..database.storage import upload_object
 from ..models.ai_video import AiVideoGenerateResponse, AiVideoLibraryItem
 
 logger = logging.getLogger(__name__)
@@ -89,7 +91,7 @@ class AiVideoService:
         }
 
         try:
-            client.table("AiVideoRequest").insert(payload).execute()
+            await cls._require_async_supabase().table("AiVideoRequest").insert(payload).execute()
             logger.info("Stored AiVideoRequest record %s", request_id)
         except Exception as exc:
             logger.error("Failed to insert AiVideoRequest record: %s", exc)
@@ -108,11 +110,12 @@ class AiVideoService:
 
     @classmethod
     async def get_video_library(cls, creator_id: str | None = None) -> list[AiVideoLibraryItem]:
-        if not supabase:
+        db = get_async_supabase()
+        if not supabase or not db:
             logger.warning("Supabase not available, returning empty AI video list")
             return []
         client = supabase
-        query = client.table("AiVideo").select("*").order("generated_time", desc=True)
+        query = db.table("AiVideo").select("*").order("generated_time", desc=True)
         if creator_id:
             query = query.eq("creator_id", creator_id)
 
@@ -122,7 +125,7 @@ class AiVideoService:
         logger.info("Supabase AiVideo query: %s", query_url)
 
         try:
-            response = query.execute()
+            response = await query.execute()
         except Exception as exc:
             logger.warning("Failed to fetch AiVideos (returning empty list): %s", exc)
             return []
@@ -160,6 +163,14 @@ class AiVideoService:
             raise HTTPException(status_code=500, detail="Supabase client not configured")
         return supabase
 
+    @classmethod
+    def _require_async_supabase(cls):
+        db = get_async_supabase()
+        if not db:
+            logger.error("Async Supabase client is not configured")
+            raise HTTPException(status_code=500, detail="Supabase client not configured")
+        return db
+
     @classmethod
     async def _store_optional_asset(
         cls,
@@ -179,12 +190,11 @@ class AiVideoService:
         raw_content = await cls._read_file(file)
         extension = cls._extract_extension(file.filename, default_extension)
         storage_path = f"{folder}/{filename_prefix}.{extension}"
-        options = {
-            "content-type": file.content_type or cls._guess_content_type(extension),
-            "upsert": True,
-        }
+        content_type = file.content_type or cls._guess_content_type(extension)
 
-        cls._upload_to_bucket(client, storage_path, raw_content, options, filename_prefix)
+        await cls._upload_to_bucket(
+            client, storage_path, raw_content, content_type, filename_prefix
+        )
         return cls._get_public_url(client, storage_path)
 
     @classmethod
@@ -234,31 +244,17 @@ class AiVideoService:
             return f"{base_url}/storage/v1/object/public/{cls.BUCKET_NAME}/{path}"
 
     @classmethod
-    def _upload_to_bucket(
-        cls, client, path: str, content: bytes, file_options: dict, asset_label: str
+    async def _upload_to_bucket(
+        cls, client, path: str, content: bytes, content_type: str, asset_label: str
     ) -> None:
-        """Mirror upload logic from UploadService for consistent behavior."""
         try:
-            client.storage.from_(cls.BUCKET_NAME).upload(path, content, file_options)
-            logger.info("Uploaded %s to %s bucket", path, cls.BUCKET_NAME)
+            await upload_object(client, cls.BUCKET_NAME, path, content, content_type)
         except Exception as exc:
-            logger.error("Upload error for %s: %s", path, exc)
-            # Attempt to remove stale file then retry, similar to UploadService
-            try:
-                client.storage.from_(cls.BUCKET_NAME).remove([path])
-                logger.info("Removed existing object at %s before retry", path)
-            except Exception:
-                pass
-
-            try:
-                client.storage.from_(cls.BUCKET_NAME).upload(path, content)
-                logger.info("Fallback upload succeeded for %s", path)
-            except Exception as retry_exc:
-                logger.error("Retry upload failed for %s: %s", path, retry_exc)
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Unable to upload {asset_label.replace('-', ' ')} asset to storage",
-                )
+            logger.error("Upload failed for %s: %s", path, exc)
+            raise HTTPException(
+                status_code=500,
+                detail=f"Unable to upload {asset_label.replace('-', ' ')} asset to storage",
+            )
 
     @staticmethod
     def _deserialize_tags(raw_value: str | None) -> list[str]:
@@ -0,0 +1,109 @@
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+from ..config.settings import settings
+from ..database.async_client import get_async_supabase
+from ..database.loaders import fetch_rows_by_ids
+from ..utils.cache import get_cache
+
+logger = logging.getLogger(__name__)
+
+# BrandProfile rows keyed by id, and the userId -> id mapping used by brand mutations.
+# Only found profiles are cached so a newly created profile is picked up immediately.
+_profiles_by_id = get_cache(
+    "brand_profiles",
+    maxsize=settings.BRAND_PROFILE_CACHE_MAXSIZE,
+    ttl=settings.BRAND_PROFILE_CACHE_TTL,
+    copy_values=True,
+)
+_ids_by_user_id = get_cache(
+    "brand_profile_user_ids",
+    maxsize=settings.BRAND_PROFILE_CACHE_MAXSIZE,
+    ttl=settings.BRAND_PROFILE_CACHE_TTL,
+)
+
+
+class BrandProfileService:
+    @staticmethod
+    def _remember(profile: dict[str, Any]) -> dict[str, Any]:
+        """Store a BrandProfile row under its id and userId."""
+        _profiles_by_id.set(str(profile["id"]), profile)
+        if profile.get("userId"):
+            _ids_by_user_id.set(str(profile["userId"]), str(profile["id"]))
+        return profile
+
+    @staticmethod
+    async def get_many(brand_ids: Iterable[Any]) -> dict[str, dict[str, Any]]:
+        """Return BrandProfile rows keyed by id, fetching only the ids not already cached."""
+        profiles: dict[str, dict[str, Any]] = {}
+        missing: list[str] = []
+
+        for brand_id in dict.fromkeys(str(value) for value in brand_ids if value):
+            profile = _profiles_by_id.get(brand_id)
+            if profile is None:
+                missing.append(brand_id)
+            else:
+                profiles[brand_id] = profile
+
+        if missing:
+            fetched = await fetch_rows_by_ids(get_async_supabase(), "BrandProfile", missing)
+            for brand_id, profile in fetched.items():
+                profiles[brand_id] = BrandProfileService._remember(profile)
+
+        return profiles
+
+    @staticmethod
+    async def get_by_id(brand_id: Any) -> dict[str, Any] | None:
+        """Return the BrandProfile with the given id, or None if it does not exist."""
+        if not brand_id:
+            return None
+        profiles = await BrandProfileService.get_many([brand_id])
+        return profiles.get(str(brand_id))
+
+    @staticmethod
+    async def get_by_user_id(user_id: str) -> dict[str, Any] | None:
+        """Return the BrandProfile owned by the given user, or None if there is none."""
+        brand_id = _ids_by_user_id.get(user_id)
+        if brand_id is not None:
+            profile = await BrandProfileService.get_by_id(brand_id)
+            if profile is not None:
+                return profile
+
+        response = (
+            await get_async_supabase()
+            .table("BrandProfile")
+            .select("*")
+            .eq("userId", user_id)
+            .limit(1)
+            .execute()
+        )
+        if not response.data:
+            return None
+        return BrandProfileService._remember(response.data[0])
+
+    @staticmethod
+    async def resolve_brand_id(user_id: str) -> str | None:
+        """Map a brand user's id to their BrandProfile id."""
+        brand_id = _ids_by_user_id.get(user_id)
+        if brand_id is not None:
+            return brand_id
+        profile = await BrandProfileService.get_by_user_id(user_id)
+        return str(profile["id"]) if profile else None
+
+    @staticmethod
+    async def resolve_profile_or_user_id(brand_id: str) -> str | None:
+        """Accept either a BrandProfile id or its owner's user id and return the profile id."""
+        if await BrandProfileService.get_by_id(brand_id):
+            return brand_id
+        return await BrandProfileService.resolve_brand_id(brand_id)
+
+    @staticmethod
+    def invalidate(brand_id: str | None = None, user_id: str | None = None) -> None:
+        """Forget a cached profile (by id and/or owner user id) after it is written."""
+        if user_id is not None:
+            brand_id = brand_id or _ids_by_user_id.get(user_id)
+            _ids_by_user_id.invalidate(user_id)
+        if brand_id is not None:
+            _profiles_by_id.invalidate(str(brand_id))
+        logger.info(f"Invalidated brand profile cache (brand_id={brand_id}, user_id={user_id})")
@@ -4,13 +4,99 @@ from typing import Any
 
 from fastapi import HTTPException
 
-from ..database.connection import supabase
+from ..database.async_client import get_async_supabase
+from ..database.loaders import fetch_rows, fetch_rows_by_ids, group_rows_by
+from ..database.schemas import CAMPAIGN_COLUMNS, CAMPAIGN_PROJECTIONS
+from ..utils.projections import resolve_columns
 from ..utils.validators import validate_uuid
+from .brand_profile_service import BrandProfileService
+from .campaign_service import CampaignService
 
 logger = logging.getLogger(__name__)
 
+# Columns every brand campaign projection keeps: model identity and application lookup
+BRAND_CAMPAIGN_REQUIRED_COLUMNS = ("id", "title", "brand_id")
+
 
 class BrandService:
+    @staticmethod
+    async def _attach_applications(campaigns: list[dict[str, Any]]) -> None:
+        """Load every claim and creator for the given campaigns in bulk and stitch them in memory."""
+        supabase = get_async_supabase()
+
+        campaign_ids = [campaign["id"] for campaign in campaigns]
+
+        try:
+            claims = await fetch_rows(supabase, "campaignclaims", "campaign_id", campaign_ids)
+        except Exception as e:
+            logger.error(f"Error fetching claims for campaign IDs {campaign_ids}: {str(e)}")
+            if "invalid input syntax for type uuid" in str(e).lower():
+                logger.warning("UUID format issue while fetching brand campaign claims")
+            for campaign in campaigns:
+                campaign["applications"] = []
+            return
+
+        try:
+            creators = await fetch_rows_by_ids(
+                supabase, "CreatorProfile", [claim.get("creator_id") for claim in claims]
+            )
+        except Exception as e:
+            logger.error(f"Error fetching creator details for {len(claims)} claims: {str(e)}")
+            creators = {}
+
+        for claim in claims:
+            creator = creators.get(str(claim.get("creator_id")))
+            if creator:
+                claim["creator"] = creator
+
+        claims_by_campaign = group_rows_by(claims, "campaign_id")
+        for campaign in campaigns:
+            campaign["applications"] = claims_by_campaign.get(str(campaign["id"]), [])
+            logger.info(
+                f"Found {len(campaign['applications'])} claims/applications for campaign ID: {campaign['id']}"
+            )
+
+    @staticmethod
+    async def _hydrate_application_creators(applications: list[dict[str, Any]]) -> None:
+        """Attach creator profiles and their user accounts to applications with bulk lookups."""
+        supabase = get_async_supabase()
+
+        creator_ids = [a["creator_id"] for a in applications if a.get("creator_id")]
+
+        try:
+            creators = await fetch_rows_by_ids(supabase, "CreatorProfile", creator_ids)
+        except Exception as e:
+            logger.error(f"Error fetching creator details: {str(e)}")
+            for application in applications:
+                if application.get("creator_id"):
+                    application["creator"] = {"id": application["creator_id"]}
+            return
+
+        try:
+            users = await fetch_rows_by_ids(
+                supabase,
+                "User",
+                [creator.get("userId") for creator in creators.values()],
+                "id, name, email, image",
+            )
+        except Exception as user_error:
+            logger.error(f"Error fetching user data: {str(user_error)}")
+            users = {}
+
+        for application in applications:
+            creator = creators.get(str(application.get("creator_id")))
+            if not creator:
+                continue
+
+            creator_data = dict(creator)
+            user_data = users.get(str(creator.get("userId")))
+            if user_data:
+                creator_data["username"] = user_data.get("name")
+                creator_data["email"] = user_data.get("email")
+                creator_data["image"] = user_data.get("image")
+                creator_data["user"] = user_data
+            application["creator"] = creator_data
+
     @staticmethod
     async def get_brand_campaigns(
         brand_id: str,
@@ -18,8 +104,15 @@ class BrandService:
         start_date: str | None = None,
         end_date: str | None = None,
         search: str | None = None,
+        fields: str | None = None,
     ) -> list[dict[str, Any]]:
         """Get all campaigns for a specific brand with optional filtering."""
+        supabase = get_async_supabase()
+
+        columns = resolve_columns(
+            fields, CAMPAIGN_COLUMNS, CAMPAIGN_PROJECTIONS, BRAND_CAMPAIGN_REQUIRED_COLUMNS
+        )
+
         logger.info(
             f"Fetching campaigns for brand profile ID: {brand_id} with filters: status={status}, start_date={start_date}, end_date={end_date}, search={search}"
         )
@@ -31,7 +124,7 @@ class BrandService:
 
             logger.info(f"Using brand profile ID directly: {brand_id}")
 
-            query = supabase.table("campaigns").select("*").eq("brand_id", brand_id)
+            query = supabase.table("campaigns").select(columns).eq("brand_id", brand_id)
 
             if status:
                 query = query.eq("status", status.upper())
@@ -50,7 +143,7 @@ class BrandService:
                 except ValueError:
                     logger.warning(f"Invalid end_date format: {end_date}")
 
-            response = query.execute()
+            response = await query.execute()
 
             if not response.data:
                 logger.info(f"No campaigns found for brand profile ID: {brand_id}")
@@ -69,52 +162,12 @@ class BrandService:
                 ]
                 logger.info(f"After search filter, found {len(campaigns)} campaigns")
 
-            for campaign in campaigns:
-                try:
-                    claims_response = (
-                        supabase.table("campaignclaims")
-                        .select("*")
-                        .eq("campaign_id", campaign["id"])
-                        .execute()
-                    )
-
-                    campaign["applications"] = claims_response.data or []
-                    logger.info(
-                        f"Found {len(campaign['applications'])} claims/applications for campaign ID: {campaign['id']}"
-                    )
-
-                    for claim in campaign["applications"]:
-                        try:
-                            if claim.get("creator_id"):
-                                creator_response = (
-                                    supabase.table("CreatorProfile")
-                                    .select("*")
-                                    .eq("id", claim["creator_id"])
-                                    .execute()
-                                )
-                                if creator_response.data and len(creator_response.data) > 0:
-                                    claim["creator"] = creator_response.data[0]
-                        except Exception as e:
-                            logger.error(
-                                f"Error fetching creator details for claim {claim.get('id')}: {str(e)}"
-                            )
-
-                except Exception as e:
-                    logger.error(
-                        f"Error fetching claims for campaign ID {campaign['id']}: {str(e)}"
-                    )
-                    if "invalid input syntax for type uuid" in str(e).lower():
-                        logger.warning(f"UUID format issue for campaign {campaign['id']}")
-                    campaign["applications"] = []
+            await BrandService._attach_applications(campaigns)
 
             try:
-                brand_response = (
-                    supabase.table("BrandProfile").select("*").eq("id", brand_id).execute()
-                )
-
-                if brand_response.data and len(brand_response.data) > 0:
-                    brand_info = brand_response.data[0]
+                brand_info = await BrandProfileService.get_by_id(brand_id)
 
+                if brand_info:
                     for campaign in campaigns:
                         campaign["brand"] = brand_info
                 else:
@@ -133,6 +186,8 @@ class BrandService:
     @staticmethod
     async def get_brand_campaign(brand_id: str, campaign_id: str) -> dict[str, Any]:
         """Get a specific campaign by ID with all its applications."""
+        supabase = get_async_supabase()
+
         logger.info(f"Fetching campaign {campaign_id} for brand ID: {brand_id}")
 
         try:
@@ -143,26 +198,15 @@ class BrandService:
                 logger.error(f"Invalid UUID format for campaign_id: {campaign_id}")
                 raise HTTPException(status_code=400, detail="Invalid campaign ID format")
 
-            brand_profile_response = (
-                supabase.table("BrandProfile").select("id").eq("id", brand_id).execute()
-            )
-
-            if brand_profile_response.data and len(brand_profile_response.data) > 0:
-                actual_brand_id = brand_id
-            else:
-                user_brand_response = (
-                    supabase.table("BrandProfile").select("id").eq("userId", brand_id).execute()
-                )
-
-                if not user_brand_response.data or len(user_brand_response.data) == 0:
-                    logger.warning(f"Brand profile not found for ID: {brand_id}")
-                    raise HTTPException(status_code=404, detail="Brand profile not found")
+            actual_brand_id = await BrandProfileService.resolve_profile_or_user_id(brand_id)
 
-                actual_brand_id = user_brand_response.data[0]["id"]
+            if not actual_brand_id:
+                logger.warning(f"Brand profile not found for ID: {brand_id}")
+                raise HTTPException(status_code=404, detail="Brand profile not found")
 
             try:
                 campaign_response = (
-                    supabase.table("campaigns")
+                    await supabase.table("campaigns")
                     .select("*")
                     .eq("id", campaign_id)
                     .eq("brand_id", actual_brand_id)
@@ -184,7 +228,7 @@ class BrandService:
 
             try:
                 claims_response = (
-                    supabase.table("campaignclaims")
+                    await supabase.table("campaignclaims")
                     .select("*")
                     .eq("campaign_id", campaign_id)
                     .execute()
@@ -193,43 +237,7 @@ class BrandService:
                 applications = claims_response.data or []
                 campaign["applications"] = applications
 
-                for application in campaign["applications"]:
-                    try:
-                        if application.get("creator_id"):
-                            creator_response = (
-                                supabase.table("CreatorProfile")
-                                .select("*")
-                                .eq("id", application["creator_id"])
-                                .execute()
-                            )
-
-                            if creator_response.data and len(creator_response.data) > 0:
-                                creator_data = creator_response.data[0]
-                                application["creator"] = creator_data
-
-                                if creator_data.get("userId"):
-                                    try:
-                                        user_response = (
-                                            supabase.table("User")
-                                            .select("id, name, email, image")
-                                            .eq("id", creator_data["userId"])
-                                            .execute()
-                                        )
-
-                                        if user_response.data and len(user_response.data) > 0:
-                                            user_data = user_response.data[0]
-                                            application["creator"]["username"] = user_data.get(
-                                                "name"
-                                            )
-                                            application["creator"]["email"] = user_data.get("email")
-                                            application["creator"]["image"] = user_data.get("image")
-                                            application["creator"]["user"] = user_data
-                                    except Exception as user_error:
-                                        logger.error(f"Error fetching user data: {str(user_error)}")
-
-                    except Exception as e:
-                        logger.error(f"Error fetching creator details: {str(e)}")
-                        application["creator"] = {"id": application["creator_id"]}
+                await BrandService._hydrate_application_creators(applications)
 
             except Exception as e:
                 logger.error(f"Error fetching applications: {str(e)}")
@@ -248,6 +256,8 @@ class BrandService:
     @staticmethod
     async def delete_brand_campaign(brand_id: str, campaign_id: str) -> dict[str, Any]:
         """Delete a specific campaign for a brand."""
+        supabase = get_async_supabase()
+
         logger.info(f"Deleting campaign {campaign_id} for brand ID: {brand_id}")
 
         try:
@@ -259,27 +269,16 @@ class BrandService:
                 raise HTTPException(status_code=400, detail="Invalid campaign ID format")
 
             # Determine if brand_id is a profile ID or user ID
-            brand_profile_response = (
-                supabase.table("BrandProfile").select("id").eq("id", brand_id).execute()
-            )
-
-            if brand_profile_response.data and len(brand_profile_response.data) > 0:
-                actual_brand_id = brand_id
-            else:
-                user_brand_response = (
-                    supabase.table("BrandProfile").select("id").eq("userId", brand_id).execute()
-                )
-
-                if not user_brand_response.data or len(user_brand_response.data) == 0:
-                    logger.warning(f"Brand profile not found for ID: {brand_id}")
-                    raise HTTPException(status_code=404, detail="Brand profile not found")
+            actual_brand_id = await BrandProfileService.resolve_profile_or_user_id(brand_id)
 
-                actual_brand_id = user_brand_response.data[0]["id"]
+            if not actual_brand_id:
+                logger.warning(f"Brand profile not found for ID: {brand_id}")
+                raise HTTPException(status_code=404, detail="Brand profile not found")
 
             # Verify the campaign exists and belongs to this brand
             try:
                 existing_campaign = (
-                    supabase.table("campaigns")
+                    await supabase.table("campaigns")
                     .select("id, title")
                     .eq("id", campaign_id)
                     .eq("brand_id", actual_brand_id)
@@ -301,7 +300,12 @@ class BrandService:
 
             # Delete related campaign claims first (cascade delete)
             try:
-                (supabase.table("campaignclaims").delete().eq("campaign_id", campaign_id).execute())
+                (
+                    await supabase.table("campaignclaims")
+                    .delete()
+                    .eq("campaign_id", campaign_id)
+                    .execute()
+                )
                 logger.info(f"Deleted campaign claims for campaign {campaign_id}")
             except Exception as claims_error:
                 logger.warning(
@@ -312,12 +316,13 @@ class BrandService:
             # Delete the campaign
             try:
                 (
-                    supabase.table("campaigns")
+                    await supabase.table("campaigns")
                     .delete()
                     .eq("id", campaign_id)
                     .eq("brand_id", actual_brand_id)
                     .execute()
                 )
+                CampaignService.invalidate_cache()
 
                 logger.info(
                     f"Successfully deleted campaign {campaign_id} ({campaign_title}) for brand {actual_brand_id}"
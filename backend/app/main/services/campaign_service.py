@@ -1,30 +1,199 @@
 import json
 import logging
+import re
 from datetime import datetime
 from typing import Any
 
 from fastapi import HTTPException
 
-from ..database.connection import supabase
-from ..models.campaign import Campaign, CampaignCreate
+from ..config.settings import settings
+from ..database.async_client import get_async_supabase
+from ..database.loaders import IN_QUERY_CHUNK_SIZE
+from ..database.schemas import CAMPAIGN_COLUMNS, CAMPAIGN_PROJECTIONS
+from ..models.campaign import CampaignCreate
+from ..utils.cache import get_cache, normalize_text
+from ..utils.pagination import apply_keyset, decode_cursor, paginate
+from ..utils.projections import resolve_columns
 from ..utils.validators import check_table_exists, validate_uuid
+from .brand_profile_service import BrandProfileService
 
 logger = logging.getLogger(__name__)
 
+# Default and maximum page sizes for the public campaign listing
+CAMPAIGN_PAGE_SIZE = 20
+CAMPAIGN_MAX_PAGE_SIZE = 100
+
+# Maximum number of ranked rows returned for a search
+CAMPAIGN_SEARCH_LIMIT = CAMPAIGN_MAX_PAGE_SIZE
+
+# Columns every campaign projection keeps: model identity, brand lookup and cursor ordering
+CAMPAIGN_REQUIRED_COLUMNS = ("id", "title", "brand_id", "created_at")
+
+# Public listing/detail responses, cleared whenever a campaign is created, updated or deleted
+_response_cache = get_cache(
+    "campaign_responses",
+    maxsize=settings.RESPONSE_CACHE_MAXSIZE,
+    ttl=settings.RESPONSE_CACHE_TTL,
+    copy_values=True,
+)
+
+# Characters with meaning inside PostgREST filter values (list separators, its * wildcard)
+_FILTER_SPECIAL_CHARS = re.compile(r"[,()*]")
+
+# LIKE wildcards and the escape character, backslash-escaped so they match literally
+_LIKE_SPECIAL_CHARS = re.compile(r"([\\%_])")
+
 
 class CampaignService:
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Drop every cached campaign response after a write."""
+        _response_cache.clear()
+
+    @staticmethod
+    async def _attach_brand_names(campaigns: list[dict[str, Any]]) -> bool:
+        """Fill `brand_name` on every campaign using one bulk (cached) BrandProfile lookup.
+
+        Returns False if the lookup failed and placeholder names were used instead.
+        """
+        brand_ids = [c["brand_id"] for c in campaigns if c.get("brand_id")]
+
+        try:
+            brands = await BrandProfileService.get_many(brand_ids)
+        except Exception as e:
+            logger.error(f"Error fetching brand details: {str(e)}")
+            for campaign in campaigns:
+                campaign["brand_name"] = (
+                    f"Brand {campaign['brand_id']}" if campaign.get("brand_id") else "Unknown Brand"
+                )
+            return False
+
+        for campaign in campaigns:
+            brand = brands.get(str(campaign.get("brand_id")))
+            campaign["brand_name"] = (
+                brand.get("companyName", "Unknown Brand") if brand else "Unknown Brand"
+            )
+        return True
+
+    @staticmethod
+    async def _search_campaigns(
+        search: str,
+        platform: str | None,
+        category: str | None = None,
+        limit: int = CAMPAIGN_SEARCH_LIMIT,
+        columns: str = "*",
+    ) -> list[dict[str, Any]]:
+        """Search title, brief and brand name in Postgres and return ranked matches.
+
+        Uses the `search_campaigns` function from CREATE_TABLE_SQL; if it has not been
+        installed yet, falls back to server-side ilike matches on title and brand name,
+        ordered by recency.
+        """
+        supabase = get_async_supabase()
+        platform_filter = platform.lower() if platform and platform != "all" else None
+
+        try:
+            rpc = supabase.rpc(
+                "search_campaigns",
+                {
+                    "search_query": search,
+                    "platform_filter": platform_filter,
+                    "result_limit": limit,
+                    "category_filter": category,
+                },
+            )
+            if columns != "*":
+                rpc.params = rpc.params.add("select", columns)
+            response = await rpc.execute()
+            return response.data or []
+        except Exception as e:
+            logger.warning(f"search_campaigns RPC failed, falling back to ilike search: {str(e)}")
+
+        term = " ".join(_FILTER_SPECIAL_CHARS.sub(" ", search).split())
+        if not term:
+            return []
+        pattern = "*" + _LIKE_SPECIAL_CHARS.sub(r"\\\1", term) + "*"
+
+        def base_query():
+            query = supabase.table("campaigns").select(columns)
+            if platform_filter:
+                query = query.eq("platform", platform_filter)
+            if category:
+                query = query.eq("industry_category", category)
+            return query.order("created_at", desc=True).limit(limit)
+
+        title_response = await base_query().ilike("title", pattern).execute()
+        matches = {row["id"]: row for row in title_response.data or []}
+
+        brand_response = (
+            await supabase.table("BrandProfile")
+            .select("id")
+            .ilike("companyName", pattern)
+            .limit(IN_QUERY_CHUNK_SIZE)
+            .execute()
+        )
+        brand_ids = [brand["id"] for brand in brand_response.data or []]
+        if brand_ids:
+            brand_campaigns = await base_query().in_("brand_id", brand_ids).execute()
+            for row in brand_campaigns.data or []:
+                matches.setdefault(row["id"], row)
+
+        campaigns = sorted(
+            matches.values(), key=lambda row: row.get("created_at") or "", reverse=True
+        )
+        return campaigns[:limit]
+
     @staticmethod
     async def get_campaigns(
-        search: str | None = None, platform: str | None = None, category: str | None = None
-    ) -> list[Campaign]:
-        """Get all campaigns with optional filtering."""
+        search: str | None = None,
+        platform: str | None = None,
+        category: str | None = None,
+        limit: int = CAMPAIGN_PAGE_SIZE,
+        cursor: str | None = None,
+        fields: str | None = None,
+    ) -> dict[str, Any]:
+        """Get a page of campaigns with optional filtering.
+
+        Listings are keyset-paginated on (created_at, id), newest first. Searches return
+        the top `limit` ranked matches as a single page, so they take no cursor. `category`
+        matches `industry_category` exactly. `fields` selects a projection.
+        """
+        supabase = get_async_supabase()
+
         logger.info(
-            f"Getting campaigns with params: search={search}, platform={platform}, category={category}"
+            f"Getting campaigns with params: search={search}, platform={platform}, category={category}, limit={limit}, cursor={cursor}"
         )
 
+        empty_page = {"items": [], "next_cursor": None, "limit": limit}
+
         if not supabase:
             logger.warning("Supabase client not available, returning empty list")
-            return []
+            return empty_page
+
+        search = search.strip() if search else None
+        category = category if category and category != "all" else None
+        if cursor:
+            if search:
+                raise HTTPException(
+                    status_code=400, detail="Search results are not paginated; omit the cursor"
+                )
+            decode_cursor(cursor)
+        columns = resolve_columns(
+            fields, CAMPAIGN_COLUMNS, CAMPAIGN_PROJECTIONS, CAMPAIGN_REQUIRED_COLUMNS
+        )
+
+        cache_key = (
+            "list",
+            normalize_text(search),
+            normalize_text(platform) if platform != "all" else None,
+            category,
+            limit,
+            cursor,
+            columns,
+        )
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
             table_exists = await check_table_exists(supabase, "campaigns")
@@ -32,16 +201,25 @@ class CampaignService:
                 logger.warning(
                     "Campaigns table does not exist or is inaccessible, returning empty list"
                 )
-                return []
+                return empty_page
 
-            query = supabase.table("campaigns").select("*")
+            next_cursor = None
+            try:
+                if search:
+                    campaigns = await CampaignService._search_campaigns(
+                        search, platform, category, limit, columns
+                    )
+                else:
+                    query = supabase.table("campaigns").select(columns)
 
-            if platform and platform != "all":
-                query = query.eq("platform", platform.lower())
+                    if platform and platform != "all":
+                        query = query.eq("platform", platform.lower())
+                    if category:
+                        query = query.eq("industry_category", category)
 
-            try:
-                response = query.execute()
-                campaigns = response.data or []
+                    query = apply_keyset(query, cursor).limit(limit + 1)
+                    response = await query.execute()
+                    campaigns, next_cursor = paginate(response.data or [], limit)
                 logger.info(f"Retrieved {len(campaigns)} campaigns from Supabase")
             except Exception as e:
                 error_msg = str(e)
@@ -51,50 +229,26 @@ class CampaignService:
                     logger.error(
                         "Permission denied error. Check your Supabase RLS policies and service key permissions."
                     )
-                    return []
+                    return empty_page
                 raise HTTPException(status_code=500, detail=f"Database query error: {error_msg}")
 
-            if search and campaigns:
-                search_lower = search.lower()
-                filtered_campaigns = []
-                for c in campaigns:
-                    title = c.get("title", "").lower()
-                    brand_id = str(c.get("brand_id", "")).lower()
-                    if search_lower in title or search_lower in brand_id:
-                        filtered_campaigns.append(c)
-                campaigns = filtered_campaigns
-                logger.info(f"Filtered to {len(campaigns)} campaigns after search")
+            brands_resolved = await CampaignService._attach_brand_names(campaigns)
 
-            for campaign in campaigns:
-                if campaign.get("brand_id"):
-                    try:
-                        brand_response = (
-                            supabase.table("BrandProfile")
-                            .select("companyName")
-                            .eq("id", campaign["brand_id"])
-                            .execute()
-                        )
-                        if brand_response.data and len(brand_response.data) > 0:
-                            campaign["brand_name"] = brand_response.data[0].get(
-                                "companyName", "Unknown Brand"
-                            )
-                        else:
-                            campaign["brand_name"] = "Unknown Brand"
-                    except Exception as e:
-                        logger.error(f"Error fetching brand details: {str(e)}")
-                        campaign["brand_name"] = f"Brand {campaign['brand_id']}"
-                else:
-                    campaign["brand_name"] = "Unknown Brand"
-
-            return campaigns
+            page = {"items": campaigns, "next_cursor": next_cursor, "limit": limit}
+            # Placeholder brand names from a failed lookup are served once, never cached
+            if brands_resolved:
+                _response_cache.set(cache_key, page)
+            return page
 
         except Exception as e:
             logger.error(f"Error processing request: {str(e)}")
-            return []
+            return empty_page
 
     @staticmethod
-    async def get_campaign_by_id(campaign_id: str) -> dict[str, Any]:
+    async def get_campaign_by_id(campaign_id: str, fields: str | None = None) -> dict[str, Any]:
         """Get a specific campaign by ID for public viewing."""
+        supabase = get_async_supabase()
+
         logger.info(f"Fetching public campaign details for ID: {campaign_id}")
 
         if not supabase:
@@ -104,10 +258,19 @@ class CampaignService:
             logger.error(f"Invalid UUID format for campaign_id: {campaign_id}")
             raise HTTPException(status_code=400, detail="Invalid campaign ID format")
 
+        columns = resolve_columns(
+            fields, CAMPAIGN_COLUMNS, CAMPAIGN_PROJECTIONS, CAMPAIGN_REQUIRED_COLUMNS
+        )
+
+        cache_key = ("detail", campaign_id.lower(), columns)
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             campaign_response = (
-                supabase.table("campaigns")
-                .select("*")
+                await supabase.table("campaigns")
+                .select(columns)
                 .eq("id", campaign_id)
                 .eq("is_open", True)
                 .execute()
@@ -125,26 +288,23 @@ class CampaignService:
         campaign = campaign_response.data[0]
 
         try:
-            brand_response = (
-                supabase.table("BrandProfile")
-                .select("companyName")
-                .eq("id", campaign["brand_id"])
-                .execute()
+            brand = await BrandProfileService.get_by_id(campaign.get("brand_id"))
+            campaign["brand_name"] = (
+                brand.get("companyName", "Unknown Brand") if brand else "Unknown Brand"
             )
-
-            if brand_response.data and len(brand_response.data) > 0:
-                campaign["brand_name"] = brand_response.data[0].get("companyName", "Unknown Brand")
-            else:
-                campaign["brand_name"] = "Unknown Brand"
         except Exception as e:
             logger.error(f"Error fetching brand information: {str(e)}")
             campaign["brand_name"] = "Unknown Brand"
+            return campaign
 
+        _response_cache.set(cache_key, campaign)
         return campaign
 
     @staticmethod
     async def create_campaign(brand_id: str, campaign: CampaignCreate) -> dict[str, Any]:
         """Create a new campaign for a specific brand."""
+        supabase = get_async_supabase()
+
         logger.info(f"Creating campaign for user ID {brand_id}: {campaign.title}")
 
         if not supabase:
@@ -155,23 +315,18 @@ class CampaignService:
         logger.info(f"Looking up brand profile for user ID: {brand_id}")
 
         try:
-            brand_profile_response = (
-                supabase.table("BrandProfile")
-                .select("id, userId, companyName")
-                .eq("userId", brand_id)
-                .execute()
-            )
+            brand_profile = await BrandProfileService.get_by_user_id(brand_id)
 
-            logger.info(f"Brand profile query response: {brand_profile_response}")
+            logger.info(f"Brand profile lookup result: {brand_profile}")
 
-            if not brand_profile_response.data or len(brand_profile_response.data) == 0:
+            if not brand_profile:
                 # Try to find if there are any brand profiles for debugging
                 logger.warning(f"No brand profile found for user ID: {brand_id}")
 
                 # Check if there are any brand profiles at all
                 try:
                     all_brands_response = (
-                        supabase.table("BrandProfile")
+                        await supabase.table("BrandProfile")
                         .select("id, userId, companyName")
                         .limit(5)
                         .execute()
@@ -182,24 +337,18 @@ class CampaignService:
 
                 # Check if the brand_id might actually be a brand profile ID instead of user ID
                 try:
-                    direct_brand_response = (
-                        supabase.table("BrandProfile")
-                        .select("id, userId, companyName")
-                        .eq("id", brand_id)
-                        .execute()
-                    )
+                    direct_brand_profile = await BrandProfileService.get_by_id(brand_id)
 
-                    if direct_brand_response.data and len(direct_brand_response.data) > 0:
+                    if direct_brand_profile:
                         logger.info(
-                            f"Found brand profile by ID instead of userId: {direct_brand_response.data[0]}"
+                            f"Found brand profile by ID instead of userId: {direct_brand_profile}"
                         )
                         actual_brand_id = brand_id  # Use the ID directly
-                        direct_brand_response.data[0]
                     else:
                         # Create a brand profile automatically if none exists
                         logger.info(f"Creating brand profile for user ID: {brand_id}")
                         create_response = (
-                            supabase.table("BrandProfile")
+                            await supabase.table("BrandProfile")
                             .insert(
                                 {
                                     "userId": brand_id,
@@ -209,6 +358,7 @@ class CampaignService:
                             )
                             .execute()
                         )
+                        BrandProfileService.invalidate(user_id=brand_id)
 
                         if create_response.data and len(create_response.data) > 0:
                             actual_brand_id = create_response.data[0]["id"]
@@ -225,8 +375,7 @@ class CampaignService:
                         detail=f"Brand profile not found for user ID: {brand_id}. Please create a brand profile first.",
                     )
             else:
-                actual_brand_id = brand_profile_response.data[0]["id"]
-                brand_profile_response.data[0]
+                actual_brand_id = brand_profile["id"]
                 logger.info(f"Found brand profile ID: {actual_brand_id} for user ID: {brand_id}")
 
         except Exception as lookup_error:
@@ -256,7 +405,8 @@ class CampaignService:
         campaign_data = {k: v for k, v in campaign_data.items() if v is not None and v != ""}
 
         try:
-            response = supabase.table("campaigns").insert(campaign_data).execute()
+            response = await supabase.table("campaigns").insert(campaign_data).execute()
+            CampaignService.invalidate_cache()
             logger.info(f"Campaign created successfully: {response}")
 
             if response.data:
@@ -278,24 +428,22 @@ class CampaignService:
         brand_id: str, campaign_id: str, campaign_update: CampaignCreate
     ) -> dict[str, Any]:
         """Update an existing campaign for a specific brand."""
+        supabase = get_async_supabase()
+
         logger.info(f"Updating campaign {campaign_id} for user ID {brand_id}")
 
         if not supabase:
             logger.warning("Supabase not configured, cannot update campaign")
             raise HTTPException(500, "Database not configured")
 
-        brand_profile_response = (
-            supabase.table("BrandProfile").select("id").eq("userId", brand_id).execute()
-        )
+        actual_brand_id = await BrandProfileService.resolve_brand_id(brand_id)
 
-        if not brand_profile_response.data or len(brand_profile_response.data) == 0:
+        if not actual_brand_id:
             logger.warning(f"Brand profile not found for user ID: {brand_id}")
             raise HTTPException(status_code=404, detail="Brand profile not found")
 
-        actual_brand_id = brand_profile_response.data[0]["id"]
-
         existing_campaign = (
-            supabase.table("campaigns")
+            await supabase.table("campaigns")
             .select("*")
             .eq("id", campaign_id)
             .eq("brand_id", actual_brand_id)
@@ -326,12 +474,13 @@ class CampaignService:
 
         try:
             response = (
-                supabase.table("campaigns")
+                await supabase.table("campaigns")
                 .update(campaign_data)
                 .eq("id", campaign_id)
                 .eq("brand_id", actual_brand_id)
                 .execute()
             )
+            CampaignService.invalidate_cache()
 
             if response.data:
                 return {
@@ -349,24 +498,22 @@ class CampaignService:
     @staticmethod
     async def delete_campaign(brand_id: str, campaign_id: str) -> dict[str, Any]:
         """Delete a campaign for a specific brand."""
+        supabase = get_async_supabase()
+
         logger.info(f"Deleting campaign {campaign_id} for user ID {brand_id}")
 
         if not supabase:
             logger.warning("Supabase not configured, cannot delete campaign")
             raise HTTPException(500, "Database not configured")
 
-        brand_profile_response = (
-            supabase.table("BrandProfile").select("id").eq("userId", brand_id).execute()
-        )
+        actual_brand_id = await BrandProfileService.resolve_brand_id(brand_id)
 
-        if not brand_profile_response.data or len(brand_profile_response.data) == 0:
+        if not actual_brand_id:
             logger.warning(f"Brand profile not found for user ID: {brand_id}")
             raise HTTPException(status_code=404, detail="Brand profile not found")
 
-        actual_brand_id = brand_profile_response.data[0]["id"]
-
         existing_campaign = (
-            supabase.table("campaigns")
+            await supabase.table("campaigns")
             .select("id")
             .eq("id", campaign_id)
             .eq("brand_id", actual_brand_id)
@@ -377,17 +524,18 @@ class CampaignService:
             raise HTTPException(404, "Campaign not found or access denied")
 
         try:
-            supabase.table("campaignclaims").delete().eq("campaign_id", campaign_id).execute()
+            await supabase.table("campaignclaims").delete().eq("campaign_id", campaign_id).execute()
         except Exception as e:
             logger.warning(f"Error deleting campaign claims: {str(e)}")
 
         (
-            supabase.table("campaigns")
+            await supabase.table("campaigns")
             .delete()
             .eq("id", campaign_id)
             .eq("brand_id", actual_brand_id)
             .execute()
         )
+        CampaignService.invalidate_cache()
 
         return {
             "success": True,
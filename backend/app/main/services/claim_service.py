@@ -1,39 +1,146 @@
 import logging
+import uuid
 from typing import Any
 
 from fastapi import HTTPException
 
-from ..database.connection import supabase
+from ..database.async_client import get_async_supabase
+from ..database.loaders import fetch_rows_by_ids
+from ..database.schemas import CAMPAIGN_COLUMNS, CAMPAIGN_PROJECTIONS
 from ..models.claim import CampaignClaimCreate
+from ..utils.projections import resolve_columns
 from ..utils.validators import validate_uuid
+from .brand_profile_service import BrandProfileService
+from .creator_profile_service import CreatorProfileService
 
 logger = logging.getLogger(__name__)
 
 
+# Campaign columns flattened onto each creator claim: result key -> (campaign column, default)
+CREATOR_CLAIM_CAMPAIGN_FIELDS: dict[str, tuple[str, Any]] = {
+    "campaign_title": ("title", "Unknown Campaign"),
+    "campaign_deadline": ("deadline", None),
+    "campaign_budget_range": ("budget_range", None),
+    "campaign_budget_unit": ("budget_unit", "total"),
+    "campaign_brief": ("brief", None),
+    "campaign_sample_video_url": ("sample_video_url", None),
+    **{
+        field: (field, None)
+        for field in (
+            "industry_category",
+            "primary_promotion_objectives",
+            "ad_placement",
+            "campaign_execution_mode",
+            "creator_profile_preferences_gender",
+            "creator_profile_preference_ethnicity",
+            "creator_profile_preference_content_niche",
+            "preferred_creator_location",
+            "language_requirement_for_creators",
+            "creator_tier_requirement",
+            "send_to_creator",
+            "approved_by_brand",
+            "kpi_reference_target",
+            "prohibited_content_warnings",
+            "posting_requirements",
+            "product_photo",
+            "script_required",
+            "product_name",
+            "product_highlight",
+            "product_price",
+            "product_sold_number",
+            "paid_promotion_type",
+            "video_buyout_budget_range",
+            "base_fee_budget_range",
+        )
+    },
+}
+
+CREATOR_CLAIM_CAMPAIGN_COLUMNS = ", ".join(
+    dict.fromkeys(
+        ["id", "brand_id", *(column for column, _ in CREATOR_CLAIM_CAMPAIGN_FIELDS.values())]
+    )
+)
+
+CREATOR_CLAIM_FIELDS = (
+    "id",
+    "campaign_id",
+    "creator_id",
+    "status",
+    "sample_text",
+    "sample_video_url",
+    "created_at",
+)
+
+
 class ClaimService:
+    @staticmethod
+    async def _load_claim_campaigns(
+        claims: list[dict[str, Any]], columns: str = CREATOR_CLAIM_CAMPAIGN_COLUMNS
+    ) -> dict[str, dict[str, Any]]:
+        """Load the campaigns referenced by the given claims in bulk, keyed by campaign ID."""
+        supabase = get_async_supabase()
+
+        try:
+            return await fetch_rows_by_ids(
+                supabase,
+                "campaigns",
+                [claim.get("campaign_id") for claim in claims],
+                columns,
+            )
+        except Exception as db_error:
+            logger.error(f"Error fetching campaigns for {len(claims)} claims: {str(db_error)}")
+            return {}
+
+    @staticmethod
+    def _build_creator_claim(
+        claim: dict[str, Any],
+        campaign_data: dict[str, Any],
+        brands: dict[str, dict[str, Any]],
+        campaign_fields: dict[str, tuple[str, Any]] = CREATOR_CLAIM_CAMPAIGN_FIELDS,
+    ) -> dict[str, Any]:
+        """Flatten a claim and its campaign into the creator-facing result item."""
+        result_item = {field: claim.get(field) for field in CREATOR_CLAIM_FIELDS}
+        # Convert UUID to string for JSON
+        result_item["campaign_id"] = str(claim.get("campaign_id"))
+
+        for result_key, (column, default) in campaign_fields.items():
+            result_item[result_key] = campaign_data.get(column, default)
+
+        brand_id = campaign_data.get("brand_id")
+        if not brand_id:
+            result_item["campaign_brand_name"] = "Unknown Brand"
+        elif str(brand_id) in brands:
+            result_item["campaign_brand_name"] = brands[str(brand_id)].get(
+                "companyName", "Unknown Brand"
+            )
+        else:
+            result_item["campaign_brand_name"] = f"Brand {brand_id}"
+
+        return result_item
+
     @staticmethod
     async def check_campaign_claim(creator_id: str, campaign_id: str) -> dict[str, bool]:
         """Check if a creator has already applied to a campaign."""
+        supabase = get_async_supabase()
+
         try:
             if not supabase:
                 return {"exists": False}
 
             logger.info(f"Looking up creator profile for userId: {creator_id}")
 
-            creator_profile = (
-                supabase.table("CreatorProfile").select("id").eq("userId", creator_id).execute()
-            )
+            user_id = creator_id
+            creator_id = await CreatorProfileService.resolve_creator_id(user_id)
 
-            if not creator_profile.data or len(creator_profile.data) == 0:
-                logger.warning(f"Creator profile not found for userId {creator_id}")
+            if not creator_id:
+                logger.warning(f"Creator profile not found for userId {user_id}")
                 return {"exists": False}
 
-            creator_id = creator_profile.data[0]["id"]
-            logger.info(f"Found creator ID: {creator_id} for userId: {creator_id}")
+            logger.info(f"Found creator ID: {creator_id} for userId: {user_id}")
 
             try:
                 response = (
-                    supabase.table("campaignclaims")
+                    await supabase.table("campaignclaims")
                     .select("id")
                     .eq("campaign_id", campaign_id)
                     .eq("creator_id", creator_id)
@@ -56,9 +163,71 @@ class ClaimService:
             logger.error(f"Error checking campaign claim: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Failed to check campaign claim: {str(e)}")
 
+    @staticmethod
+    async def check_campaign_claims(user_id: str, campaign_ids: list[str]) -> dict[str, Any]:
+        """Check a creator's claims on many campaigns with a single `in_()` query.
+
+        Ids are matched in canonical UUID form and reported back under the exact strings
+        the caller sent, so upper-case or braced ids still match.
+        """
+        supabase = get_async_supabase()
+
+        # canonical id -> every caller spelling of it
+        keys_by_id: dict[str, list[str]] = {}
+        invalid_ids = []
+        for campaign_id in campaign_ids:
+            try:
+                canonical = str(uuid.UUID(campaign_id))
+            except ValueError:
+                invalid_ids.append(campaign_id)
+                continue
+            keys_by_id.setdefault(canonical, []).append(campaign_id)
+
+        if invalid_ids:
+            raise HTTPException(
+                status_code=400,
+                detail={"message": "Invalid campaign ID format", "campaign_ids": invalid_ids},
+            )
+
+        claimed = dict.fromkeys(campaign_ids, False)
+
+        try:
+            if not supabase:
+                return {"claims": claimed}
+
+            creator_id = await CreatorProfileService.resolve_creator_id(user_id)
+            if not creator_id:
+                logger.warning(f"Creator profile not found for userId {user_id}")
+                return {"claims": claimed}
+
+            response = (
+                await supabase.table("campaignclaims")
+                .select("campaign_id")
+                .eq("creator_id", creator_id)
+                .in_("campaign_id", list(keys_by_id))
+                .execute()
+            )
+
+            for claim in response.data or []:
+                for key in keys_by_id.get(str(claim["campaign_id"]).lower(), ()):
+                    claimed[key] = True
+
+            logger.info(
+                f"Checked {len(claimed)} campaigns for creator {creator_id}: {sum(claimed.values())} claimed"
+            )
+            return {"claims": claimed}
+
+        except Exception as e:
+            logger.error(f"Error checking campaign claims: {str(e)}")
+            raise HTTPException(
+                status_code=500, detail=f"Failed to check campaign claims: {str(e)}"
+            )
+
     @staticmethod
     async def create_campaign_claim(campaign_claim: CampaignClaimCreate) -> dict[str, Any]:
         """Create a new campaign claim (application) from a creator."""
+        supabase = get_async_supabase()
+
         try:
             logger.info(
                 f"Creating campaign claim for user {campaign_claim.user_id} and campaign {campaign_claim.campaign_id}"
@@ -72,25 +241,19 @@ class ClaimService:
                 logger.error(f"Invalid UUID format for campaign_id: {campaign_claim.campaign_id}")
                 raise HTTPException(status_code=400, detail="Invalid campaign ID format")
 
-            creator_profile = (
-                supabase.table("CreatorProfile")
-                .select("id")
-                .eq("userId", campaign_claim.user_id)
-                .execute()
-            )
+            creator_id = await CreatorProfileService.resolve_creator_id(campaign_claim.user_id)
 
-            if not creator_profile.data or len(creator_profile.data) == 0:
+            if not creator_id:
                 logger.error(
                     f"Creator with userId {campaign_claim.user_id} not found in CreatorProfile table"
                 )
                 raise HTTPException(status_code=404, detail="Creator not found")
 
-            creator_id = creator_profile.data[0]["id"]
             logger.info(f"Found creator ID: {creator_id} for user ID: {campaign_claim.user_id}")
 
             try:
                 existing_claim = (
-                    supabase.table("campaignclaims")
+                    await supabase.table("campaignclaims")
                     .select("id")
                     .eq("campaign_id", campaign_claim.campaign_id)
                     .eq("creator_id", creator_id)
@@ -112,7 +275,7 @@ class ClaimService:
 
             try:
                 campaign = (
-                    supabase.table("campaigns")
+                    await supabase.table("campaigns")
                     .select("id")
                     .eq("id", campaign_claim.campaign_id)
                     .execute()
@@ -129,7 +292,7 @@ class ClaimService:
 
             try:
                 response = (
-                    supabase.table("campaignclaims")
+                    await supabase.table("campaignclaims")
                     .insert(
                         {
                             "campaign_id": campaign_claim.campaign_id,
@@ -163,8 +326,28 @@ class ClaimService:
             )
 
     @staticmethod
-    async def get_creator_campaign_claims(creator_id: str, limit: int = 10) -> list[dict[str, Any]]:
-        """Get campaign claims for a specific creator using database function."""
+    async def get_creator_campaign_claims(
+        creator_id: str, limit: int = 10, fields: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Get campaign claims for a specific creator using database function.
+
+        `fields` narrows the campaign columns flattened onto each claim.
+        """
+        supabase = get_async_supabase()
+
+        campaign_columns = CREATOR_CLAIM_CAMPAIGN_COLUMNS
+        campaign_fields = CREATOR_CLAIM_CAMPAIGN_FIELDS
+        if fields:
+            campaign_columns = resolve_columns(
+                fields, CAMPAIGN_COLUMNS, CAMPAIGN_PROJECTIONS, ("id", "brand_id")
+            )
+            selected = set(campaign_columns.split(", "))
+            campaign_fields = {
+                key: spec
+                for key, spec in CREATOR_CLAIM_CAMPAIGN_FIELDS.items()
+                if spec[0] in selected
+            }
+
         try:
             logger.info(f"Fetching campaign claims for creator with userId: {creator_id}")
 
@@ -173,23 +356,19 @@ class ClaimService:
                 return []
 
             # First look up the creator's actual ID from CreatorProfile using userId
-            creator_profile = (
-                supabase.table("CreatorProfile").select("id").eq("userId", creator_id).execute()
-            )
+            actual_creator_id = await CreatorProfileService.resolve_creator_id(creator_id)
 
-            if not creator_profile.data or len(creator_profile.data) == 0:
+            if not actual_creator_id:
                 logger.warning(f"Creator with userId {creator_id} not found")
                 return []
 
-            # Get the actual creator ID to use in queries
-            actual_creator_id = creator_profile.data[0]["id"]
             logger.info(f"Found actual creator ID: {actual_creator_id} for userId: {creator_id}")
 
             # Use direct query with UUID campaign_id handling
             try:
                 logger.info(f"Using direct query for creator claims with ID: {actual_creator_id}")
                 claims_response = (
-                    supabase.table("campaignclaims")
+                    await supabase.table("campaignclaims")
                     .select("*")
                     .eq("creator_id", actual_creator_id)
                     .order("created_at", desc=True)
@@ -201,116 +380,26 @@ class ClaimService:
                     logger.info(f"No campaign claims found for creator {creator_id}")
                     return []
 
-                # Process and format the results with campaign details including new fields
-                result = []
-                for claim in claims_response.data:
-                    # Query campaigns table using UUID campaign_id
-                    try:
-                        campaign_response = (
-                            supabase.table("campaigns")
-                            .select("*")
-                            .eq("id", claim.get("campaign_id"))
-                            .execute()
-                        )
-                    except Exception as db_error:
-                        logger.error(
-                            f"Error fetching campaign for claim {claim.get('id')}: {str(db_error)}"
-                        )
-                        campaign_response = None
-
-                    campaign_data = {}
-                    if (
-                        campaign_response
-                        and campaign_response.data
-                        and len(campaign_response.data) > 0
-                    ):
-                        campaign_data = campaign_response.data[0]
-
-                    # Create result item with all relevant fields including the new ones
-                    result_item = {
-                        "id": claim.get("id"),
-                        "campaign_id": str(
-                            claim.get("campaign_id")
-                        ),  # Convert UUID to string for JSON
-                        "creator_id": claim.get("creator_id"),
-                        "status": claim.get("status"),
-                        "sample_text": claim.get("sample_text"),
-                        "sample_video_url": claim.get("sample_video_url"),
-                        "created_at": claim.get("created_at"),
-                        # Basic campaign fields
-                        "campaign_title": campaign_data.get("title", "Unknown Campaign"),
-                        "campaign_brand_name": "Unknown Brand",  # Will be updated below
-                        "campaign_deadline": campaign_data.get("deadline"),
-                        "campaign_budget_range": campaign_data.get("budget_range"),
-                        "campaign_budget_unit": campaign_data.get("budget_unit", "total"),
-                        "campaign_brief": campaign_data.get("brief"),
-                        "campaign_sample_video_url": campaign_data.get("sample_video_url"),
-                        # Existing campaign fields
-                        "industry_category": campaign_data.get("industry_category"),
-                        "primary_promotion_objectives": campaign_data.get(
-                            "primary_promotion_objectives"
-                        ),
-                        "ad_placement": campaign_data.get("ad_placement"),
-                        "campaign_execution_mode": campaign_data.get("campaign_execution_mode"),
-                        "creator_profile_preferences_gender": campaign_data.get(
-                            "creator_profile_preferences_gender"
-                        ),
-                        "creator_profile_preference_ethnicity": campaign_data.get(
-                            "creator_profile_preference_ethnicity"
-                        ),
-                        "creator_profile_preference_content_niche": campaign_data.get(
-                            "creator_profile_preference_content_niche"
-                        ),
-                        "preferred_creator_location": campaign_data.get(
-                            "preferred_creator_location"
-                        ),
-                        "language_requirement_for_creators": campaign_data.get(
-                            "language_requirement_for_creators"
-                        ),
-                        "creator_tier_requirement": campaign_data.get("creator_tier_requirement"),
-                        "send_to_creator": campaign_data.get("send_to_creator"),
-                        "approved_by_brand": campaign_data.get("approved_by_brand"),
-                        "kpi_reference_target": campaign_data.get("kpi_reference_target"),
-                        "prohibited_content_warnings": campaign_data.get(
-                            "prohibited_content_warnings"
-                        ),
-                        "posting_requirements": campaign_data.get("posting_requirements"),
-                        "product_photo": campaign_data.get("product_photo"),
-                        # New frontend fields
-                        "script_required": campaign_data.get("script_required"),
-                        "product_name": campaign_data.get("product_name"),
-                        "product_highlight": campaign_data.get("product_highlight"),
-                        "product_price": campaign_data.get("product_price"),
-                        "product_sold_number": campaign_data.get("product_sold_number"),
-                        "paid_promotion_type": campaign_data.get("paid_promotion_type"),
-                        "video_buyout_budget_range": campaign_data.get("video_buyout_budget_range"),
-                        "base_fee_budget_range": campaign_data.get("base_fee_budget_range"),
-                    }
-
-                    result.append(result_item)
-
-                    # Try to get the brand name if brand_id exists
-                    if campaign_data.get("brand_id"):
-                        try:
-                            brand_response = (
-                                supabase.table("BrandProfile")
-                                .select("companyName")
-                                .eq("id", campaign_data["brand_id"])
-                                .execute()
-                            )
-                            if brand_response.data and len(brand_response.data) > 0:
-                                result_item["campaign_brand_name"] = brand_response.data[0].get(
-                                    "companyName", "Unknown Brand"
-                                )
-                            else:
-                                result_item["campaign_brand_name"] = (
-                                    f"Brand {campaign_data['brand_id']}"
-                                )
-                        except Exception as brand_error:
-                            logger.error(f"Error fetching brand name: {str(brand_error)}")
-                            result_item["campaign_brand_name"] = (
-                                f"Brand {campaign_data['brand_id']}"
-                            )
+                claims = claims_response.data
+                campaigns = await ClaimService._load_claim_campaigns(claims, campaign_columns)
+
+                try:
+                    brands = await BrandProfileService.get_many(
+                        campaign.get("brand_id") for campaign in campaigns.values()
+                    )
+                except Exception as brand_error:
+                    logger.error(f"Error fetching brand names: {str(brand_error)}")
+                    brands = {}
+
+                result = [
+                    ClaimService._build_creator_claim(
+                        claim,
+                        campaigns.get(str(claim.get("campaign_id")), {}),
+                        brands,
+                        campaign_fields,
+                    )
+                    for claim in claims
+                ]
 
                 logger.info(f"Retrieved {len(result)} campaign claims for creator {creator_id}")
                 return result
@@ -330,6 +419,8 @@ class ClaimService:
         claim_id: str, status: str, brand_id: str | None = None
     ) -> dict[str, Any]:
         """Update the status of a campaign claim."""
+        supabase = get_async_supabase()
+
         try:
             logger.info(f"Updating claim {claim_id} status to {status}")
 
@@ -356,7 +447,7 @@ class ClaimService:
                 .eq("id", claim_id)
             )
 
-            existing_claim = existing_claim_query.execute()
+            existing_claim = await existing_claim_query.execute()
 
             if not existing_claim.data or len(existing_claim.data) == 0:
                 logger.warning(f"Campaign claim {claim_id} not found")
@@ -368,7 +459,7 @@ class ClaimService:
             if brand_id:
                 try:
                     campaign_response = (
-                        supabase.table("campaigns")
+                        await supabase.table("campaigns")
                         .select("brand_id")
                         .eq("id", claim_data["campaign_id"])
                         .execute()
@@ -389,7 +480,7 @@ class ClaimService:
 
             # Update the status
             response = (
-                supabase.table("campaignclaims")
+                await supabase.table("campaignclaims")
                 .update({"status": status})
                 .eq("id", claim_id)
                 .execute()
@@ -1,16 +1,15 @@
+import html
 import logging
-import smtplib
 from datetime import datetime
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.utils import formataddr
 from typing import Any
 
 from fastapi import HTTPException
 
 from ..config.settings import settings
-from ..database.connection import supabase
+from ..database.async_client import get_async_supabase
 from ..models.contact import ContactFormData, ContactResponse
+from ..utils.email_templates import Markup, nl2br, render_email
+from .mail_service import MailMessage, mail_service
 
 logger = logging.getLogger(__name__)
 
@@ -22,178 +21,75 @@ class ContactService:
 
     @staticmethod
     async def send_email(
-        to_email: str, subject: str, html_content: str, from_email: str | None = None
+        to_email: str,
+        subject: str,
+        html_content: str,
+        from_email: str | None = None,
+        text_content: str | None = None,
     ) -> bool:
-        """Send email using SMTP configuration."""
-        try:
-            if not all([settings.SMTP_USER, settings.SMTP_PASSWORD]):
-                logger.error("SMTP configuration incomplete")
-                return False
-
-            msg = MIMEMultipart("alternative")
-            msg["Subject"] = subject
-            msg["From"] = formataddr(("Brand Creator Platform", from_email or settings.SMTP_USER))
-            msg["To"] = to_email
-
-            html_part = MIMEText(html_content, "html")
-            msg.attach(html_part)
-
-            logger.info(f"Connecting to SMTP server: {settings.SMTP_HOST}:{settings.SMTP_PORT}")
-
-            smtp_server: smtplib.SMTP_SSL | smtplib.SMTP
-            if settings.SMTP_SECURE:
-                smtp_server = smtplib.SMTP_SSL(settings.SMTP_HOST, settings.SMTP_PORT)
-            else:
-                smtp_server = smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT)
-                smtp_server.starttls()
+        """Send an email through the mail queue and wait for the delivery result."""
+        return await mail_service.send(
+            ContactService.create_message(to_email, subject, html_content, from_email, text_content)
+        )
 
-            smtp_server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
-            smtp_server.sendmail(settings.SMTP_USER, to_email, msg.as_string())
-            smtp_server.quit()
-
-            logger.info(f"Email sent successfully to {to_email}")
-            return True
-
-        except Exception as e:
-            logger.error(f"Failed to send email to {to_email}: {str(e)}")
-            return False
+    @staticmethod
+    def create_message(
+        to_email: str,
+        subject: str,
+        html_content: str,
+        from_email: str | None = None,
+        text_content: str | None = None,
+    ) -> MailMessage:
+        """Build a message sent under this service's sender name."""
+        return MailMessage(
+            to_email, subject, html_content, "Brand Creator Platform", from_email, text_content
+        )
 
     @staticmethod
     def create_admin_notification_email(
         contact_data: ContactFormData, contact_id: str | None = None
-    ) -> str:
-        """Create HTML email template for admin notification."""
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <title>New Contact Form Submission</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 0; padding: 20px; background-color: #f5f5f5; }}
-                .container {{ max-width: 600px; margin: 0 auto; background-color: white; padding: 30px; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-                .header {{ background-color: #6d28d9; color: white; padding: 20px; margin: -30px -30px 30px -30px; border-radius: 8px 8px 0 0; }}
-                .field {{ margin-bottom: 20px; }}
-                .label {{ font-weight: bold; color: #374151; margin-bottom: 5px; }}
-                .value {{ color: #1f2937; line-height: 1.5; }}
-                .message {{ background-color: #f9fafb; padding: 15px; border-left: 4px solid #6d28d9; border-radius: 4px; }}
-                .footer {{ margin-top: 30px; padding-top: 20px; border-top: 1px solid #e5e7eb; color: #6b7280; font-size: 12px; }}
-                .reference {{ background-color: #e0e7ff; padding: 10px; border-radius: 4px; margin-bottom: 20px; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1 style="margin: 0;">New Contact Form Submission</h1>
-                    <p style="margin: 5px 0 0 0; opacity: 0.9;">Brand Creator Platform</p>
-                </div>
-                
-                {f'<div class="reference"><strong>Reference ID:</strong> {contact_id}</div>' if contact_id else ''}
-                
-                <div class="field">
-                    <div class="label">Name:</div>
-                    <div class="value">{contact_data.name}</div>
-                </div>
-                
-                <div class="field">
-                    <div class="label">Email:</div>
-                    <div class="value"><a href="mailto:{contact_data.email}">{contact_data.email}</a></div>
-                </div>
-                
-                <div class="field">
-                    <div class="label">Subject:</div>
-                    <div class="value">{contact_data.subject}</div>
-                </div>
-                
-                <div class="field">
-                    <div class="label">Message:</div>
-                    <div class="message">{contact_data.message.replace(chr(10), '<br>')}</div>
-                </div>
-                
-                <div class="field">
-                    <div class="label">Submitted:</div>
-                    <div class="value">{contact_data.timestamp.strftime('%Y-%m-%d %H:%M:%S UTC') if contact_data.timestamp else 'Unknown'}</div>
-                </div>
-                
-                <div class="footer">
-                    <p>This message was sent from the Brand Creator Platform contact form.</p>
-                    <p>Reply directly to this email to respond to {contact_data.name}.</p>
-                    {f'<p>Database Reference: Contact ID #{contact_id}</p>' if contact_id else '<p>Note: Message was not stored in database.</p>'}
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+    ) -> tuple[str, str | None]:
+        """Render the admin notification email as (html, text)."""
+        return render_email(
+            "contact_admin_notification",
+            name=contact_data.name,
+            email=contact_data.email,
+            subject=contact_data.subject,
+            message=contact_data.message,
+            message_html=nl2br(contact_data.message),
+            submitted=contact_data.timestamp.strftime("%Y-%m-%d %H:%M:%S UTC")
+            if contact_data.timestamp
+            else "Unknown",
+            reference_block=Markup(
+                f'<div class="reference"><strong>Reference ID:</strong> {html.escape(contact_id)}</div>'
+            )
+            if contact_id
+            else Markup(""),
+            reference_line=f"Reference ID: {contact_id}\n" if contact_id else "",
+            database_note=f"Database Reference: Contact ID #{contact_id}"
+            if contact_id
+            else "Note: Message was not stored in database.",
+        )
 
     @staticmethod
-    def create_user_confirmation_email(contact_data: ContactFormData) -> str:
-        """Create HTML email template for user confirmation."""
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <title>Thank You for Contacting Us</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 0; padding: 20px; background-color: #f5f5f5; }}
-                .container {{ max-width: 600px; margin: 0 auto; background-color: white; padding: 30px; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-                .header {{ background-color: #6d28d9; color: white; padding: 20px; margin: -30px -30px 30px -30px; border-radius: 8px 8px 0 0; text-align: center; }}
-                .content {{ color: #1f2937; line-height: 1.6; }}
-                .highlight {{ background-color: #f3f4f6; padding: 15px; border-radius: 6px; margin: 20px 0; }}
-                .contact-info {{ background-color: #fef3c7; padding: 15px; border-radius: 6px; margin: 20px 0; }}
-                .footer {{ margin-top: 30px; padding-top: 20px; border-top: 1px solid #e5e7eb; color: #6b7280; font-size: 12px; text-align: center; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1 style="margin: 0;">Thank You!</h1>
-                    <p style="margin: 10px 0 0 0; opacity: 0.9;">We've received your message</p>
-                </div>
-                
-                <div class="content">
-                    <p>Hi {contact_data.name},</p>
-                    
-                    <p>Thank you for contacting Brand Creator Platform! We've successfully received your message and appreciate you taking the time to reach out to us.</p>
-                    
-                    <div class="highlight">
-                        <strong>Your Message Summary:</strong><br>
-                        <strong>Subject:</strong> {contact_data.subject}<br>
-                        <strong>Submitted:</strong> {contact_data.timestamp.strftime('%Y-%m-%d %H:%M:%S UTC') if contact_data.timestamp else 'Just now'}
-                    </div>
-                    
-                    <p><strong>What happens next?</strong></p>
-                    <ul>
-                        <li>Our team will review your message within 24 hours</li>
-                        <li>We'll respond to you at <strong>{contact_data.email}</strong></li>
-                        <li>For urgent matters, you can also reach us directly at the contact information below</li>
-                    </ul>
-                    
-                    <div class="contact-info">
-                        <strong>Other ways to reach us:</strong><br>
-                        📧 Support: info@borderxmedia.com<br>
-                        📧 Business Inquiries: sam@borderxmedia.com<br>
-                        🌐 Website: https://cricher.ai
-                    </div>
-                    
-                    <p>In the meantime, feel free to explore our platform and discover the exciting opportunities available for creators and brands!</p>
-                    
-                    <p>Best regards,<br>
-                    <strong>The Brand Creator Platform Team</strong></p>
-                </div>
-                
-                <div class="footer">
-                    <p>© {datetime.now().year} Brand Creator Platform. All rights reserved.</p>
-                    <p>You're receiving this email because you contacted us through our website.</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+    def create_user_confirmation_email(contact_data: ContactFormData) -> tuple[str, str | None]:
+        """Render the user confirmation email as (html, text)."""
+        return render_email(
+            "contact_user_confirmation",
+            name=contact_data.name,
+            email=contact_data.email,
+            subject=contact_data.subject,
+            submitted=contact_data.timestamp.strftime("%Y-%m-%d %H:%M:%S UTC")
+            if contact_data.timestamp
+            else "Just now",
+            year=datetime.now().year,
+        )
 
     @staticmethod
     async def store_contact_message(contact_data: ContactFormData) -> str | None:
         """Store contact message in Supabase database."""
+        supabase = get_async_supabase()
+
         try:
             if not supabase:
                 logger.warning("Supabase not available, skipping database storage")
@@ -212,7 +108,7 @@ class ContactService:
 
             logger.info(f"Storing contact message in database: {contact_data.email}")
 
-            response = supabase.table("Contact").insert(contact_record).execute()
+            response = await supabase.table("Contact").insert(contact_record).execute()
 
             if response.data and len(response.data) > 0:
                 contact_id = response.data[0]["id"]
@@ -243,43 +139,37 @@ class ContactService:
             stored_contact_id = await ContactService.store_contact_message(contact_data)
             database_stored = stored_contact_id is not None
 
-            # Send email notifications
-            email_success = True
+            contact_id = stored_contact_id or f"contact-{int(contact_data.timestamp.timestamp())}"
 
-            # Send notification to admin
-            admin_html = ContactService.create_admin_notification_email(
+            # Queue the admin notification and the user confirmation together; the mail
+            # workers deliver them concurrently over separate pooled SMTP sessions and the
+            # combined delivery result is logged once both have been sent
+            admin_html, admin_text = ContactService.create_admin_notification_email(
                 contact_data, stored_contact_id
             )
-            admin_subject = f"New Contact Form: {contact_data.subject}"
-
-            admin_sent = await ContactService.send_email(
-                to_email=ContactService.ADMIN_EMAIL, subject=admin_subject, html_content=admin_html
-            )
-
-            if not admin_sent:
-                logger.error("Failed to send admin notification email")
-                email_success = False
-
-            # Send confirmation to user
-            user_html = ContactService.create_user_confirmation_email(contact_data)
-            user_subject = "Thank you for contacting Brand Creator Platform"
-
-            user_sent = await ContactService.send_email(
-                to_email=contact_data.email,
-                subject=user_subject,
-                html_content=user_html,
-                from_email=ContactService.SUPPORT_EMAIL,
+            user_html, user_text = ContactService.create_user_confirmation_email(contact_data)
+
+            mail_service.dispatch(
+                ContactService.create_message(
+                    to_email=ContactService.ADMIN_EMAIL,
+                    subject=f"New Contact Form: {contact_data.subject}",
+                    html_content=admin_html,
+                    text_content=admin_text,
+                ),
+                ContactService.create_message(
+                    to_email=contact_data.email,
+                    subject="Thank you for contacting Brand Creator Platform",
+                    html_content=user_html,
+                    from_email=ContactService.SUPPORT_EMAIL,
+                    text_content=user_text,
+                ),
+                label=f"Contact {contact_id}",
             )
 
-            if not user_sent:
-                logger.error("Failed to send user confirmation email")
-                email_success = False
-
-            contact_id = stored_contact_id or f"contact-{int(contact_data.timestamp.timestamp())}"
             response_message = "Thank you for your message! We'll get back to you soon."
 
             logger.info(
-                f"Contact form processing complete - ID: {contact_id}, DB Stored: {database_stored}, Emails Sent: {email_success}"
+                f"Contact form processing complete - ID: {contact_id}, DB Stored: {database_stored}"
             )
 
             return ContactResponse(
@@ -298,11 +188,13 @@ class ContactService:
     @staticmethod
     async def get_health_status() -> dict[str, Any]:
         """Health check for contact API including database status."""
+        supabase = get_async_supabase()
+
         database_status = "connected" if supabase else "unavailable"
 
         if supabase:
             try:
-                supabase.table("Contact").select("id").limit(1).execute()
+                await supabase.table("Contact").select("id").limit(1).execute()
                 database_status = "connected"
             except Exception as e:
                 database_status = f"error: {str(e)}"
@@ -373,6 +265,8 @@ class ContactService:
         status: str | None = None, limit: int = 50, offset: int = 0
     ) -> dict[str, Any]:
         """Get contact messages from database (admin only)."""
+        supabase = get_async_supabase()
+
         try:
             if not supabase:
                 return {"error": "Database not available"}
@@ -383,7 +277,7 @@ class ContactService:
                 query = query.eq("status", status)
 
             query = query.order("created_at", desc=True).range(offset, offset + limit - 1)
-            response = query.execute()
+            response = await query.execute()
 
             return {
                 "success": True,
@@ -398,6 +292,8 @@ class ContactService:
     @staticmethod
     async def update_message_status(message_id: int, status: str) -> dict[str, Any]:
         """Update the status of a contact message."""
+        supabase = get_async_supabase()
+
         try:
             if not supabase:
                 return {"error": "Database not available"}
@@ -409,7 +305,10 @@ class ContactService:
                 )
 
             response = (
-                supabase.table("Contact").update({"status": status}).eq("id", message_id).execute()
+                await supabase.table("Contact")
+                .update({"status": status})
+                .eq("id", message_id)
+                .execute()
             )
 
             if response.data:
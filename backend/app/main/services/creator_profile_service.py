@@ -0,0 +1,47 @@
+import logging
+
+from ..config.settings import settings
+from ..database.async_client import get_async_supabase
+from ..utils.cache import get_cache
+
+logger = logging.getLogger(__name__)
+
+# userId -> CreatorProfile.id. The mapping never changes once a profile exists, so only
+# found profiles are cached; a user without a profile is looked up again next time.
+_creator_ids_by_user_id = get_cache(
+    "creator_profile_user_ids",
+    maxsize=settings.CREATOR_ID_CACHE_MAXSIZE,
+    ttl=settings.CREATOR_ID_CACHE_TTL,
+)
+
+
+class CreatorProfileService:
+    @staticmethod
+    async def resolve_creator_id(user_id: str) -> str | None:
+        """Map a creator's user id to their CreatorProfile id, or None if they have no profile."""
+        creator_id = _creator_ids_by_user_id.get(user_id)
+        if creator_id is not None:
+            return creator_id
+
+        response = (
+            await get_async_supabase()
+            .table("CreatorProfile")
+            .select("id")
+            .eq("userId", user_id)
+            .limit(1)
+            .execute()
+        )
+        if not response.data:
+            return None
+
+        creator_id = str(response.data[0]["id"])
+        _creator_ids_by_user_id.set(user_id, creator_id)
+        return creator_id
+
+    @staticmethod
+    def invalidate(user_id: str | None = None) -> None:
+        """Forget one user's cached creator id, or every cached mapping."""
+        if user_id is None:
+            _creator_ids_by_user_id.clear()
+        else:
+            _creator_ids_by_user_id.invalidate(user_id)
@@ -5,14 +5,30 @@ from typing import Any
 
 from fastapi import HTTPException
 
-from ..database.connection import supabase
+from ..config.settings import settings
+from ..database.async_client import get_async_supabase
 from ..models.entertainment_live import EntertainmentLiveCreate
+from ..utils.cache import get_cache, normalize_text
 from ..utils.validators import check_table_exists, validate_uuid
+from .brand_profile_service import BrandProfileService
 
 logger = logging.getLogger(__name__)
 
+# Public mission listing/detail responses, cleared whenever a mission is written
+_response_cache = get_cache(
+    "entertainment_live_responses",
+    maxsize=settings.RESPONSE_CACHE_MAXSIZE,
+    ttl=settings.RESPONSE_CACHE_TTL,
+    copy_values=True,
+)
+
 
 class EntertainmentLiveService:
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Drop every cached mission response after a write."""
+        _response_cache.clear()
+
     @staticmethod
     async def get_entertainment_live_missions(
         search: str | None = None,
@@ -22,6 +38,8 @@ class EntertainmentLiveService:
         limit: int = 50,
     ) -> list[dict[str, Any]]:
         """Get all entertainment live missions with optional filtering."""
+        supabase = get_async_supabase()
+
         logger.info(
             f"Getting entertainment live missions with params: search={search}, platform={platform}, region={region}, reward_model={reward_model}"
         )
@@ -30,6 +48,18 @@ class EntertainmentLiveService:
             logger.warning("Supabase client not available, returning empty list")
             return []
 
+        cache_key = (
+            "list",
+            normalize_text(search),
+            normalize_text(platform) if platform != "all" else None,
+            region if region != "all" else None,
+            reward_model if reward_model != "all" else None,
+            limit,
+        )
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             table_exists = await check_table_exists(supabase, "entertainment_live")
             if not table_exists:
@@ -63,32 +93,27 @@ class EntertainmentLiveService:
             query = query.limit(limit).order("created_at", desc=True)
 
             # Execute the optimized query
-            response = query.execute()
+            response = await query.execute()
             missions = response.data or []
             logger.info(f"Retrieved {len(missions)} entertainment live missions from Supabase")
 
             # Enrich with brand information (keep this as it requires a separate table)
+            try:
+                brands = await BrandProfileService.get_many(m.get("brand_id") for m in missions)
+            except Exception as e:
+                logger.error(f"Error fetching brand details: {str(e)}")
+                brands = None
+
             for mission in missions:
-                if mission.get("brand_id"):
-                    try:
-                        brand_response = (
-                            supabase.table("BrandProfile")
-                            .select("companyName")
-                            .eq("id", mission["brand_id"])
-                            .execute()
-                        )
-
-                        if brand_response.data and len(brand_response.data) > 0:
-                            mission["brand_name"] = brand_response.data[0].get(
-                                "companyName", "Unknown Brand"
-                            )
-                        else:
-                            mission["brand_name"] = "Unknown Brand"
-                    except Exception as e:
-                        logger.error(f"Error fetching brand details: {str(e)}")
-                        mission["brand_name"] = f"Brand {mission['brand_id']}"
-                else:
+                if not mission.get("brand_id"):
                     mission["brand_name"] = "Unknown Brand"
+                elif brands is None:
+                    mission["brand_name"] = f"Brand {mission['brand_id']}"
+                else:
+                    brand = brands.get(str(mission["brand_id"]))
+                    mission["brand_name"] = (
+                        brand.get("companyName", "Unknown Brand") if brand else "Unknown Brand"
+                    )
 
                 # Parse JSON fields safely
                 if mission.get("niche_tags"):
@@ -104,6 +129,9 @@ class EntertainmentLiveService:
                                 if tag.strip()
                             ]
 
+            # Placeholder brand names from a failed lookup are served once, never cached
+            if brands is not None:
+                _response_cache.set(cache_key, missions)
             return missions
 
         except Exception as e:
@@ -118,6 +146,8 @@ class EntertainmentLiveService:
     @staticmethod
     async def get_entertainment_live_mission_by_id(mission_id: str) -> dict[str, Any]:
         """Get a specific entertainment live mission by ID."""
+        supabase = get_async_supabase()
+
         logger.info(f"Fetching entertainment live mission details for ID: {mission_id}")
 
         if not supabase:
@@ -129,7 +159,10 @@ class EntertainmentLiveService:
 
         try:
             mission_response = (
-                supabase.table("entertainment_live").select("*").eq("id", mission_id).execute()
+                await supabase.table("entertainment_live")
+                .select("*")
+                .eq("id", mission_id)
+                .execute()
             )
         except Exception as db_error:
             logger.error(f"Database error fetching mission: {str(db_error)}")
@@ -145,17 +178,10 @@ class EntertainmentLiveService:
 
         # Get brand information
         try:
-            brand_response = (
-                supabase.table("BrandProfile")
-                .select("companyName")
-                .eq("id", mission["brand_id"])
-                .execute()
+            brand = await BrandProfileService.get_by_id(mission.get("brand_id"))
+            mission["brand_name"] = (
+                brand.get("companyName", "Unknown Brand") if brand else "Unknown Brand"
             )
-
-            if brand_response.data and len(brand_response.data) > 0:
-                mission["brand_name"] = brand_response.data[0].get("companyName", "Unknown Brand")
-            else:
-                mission["brand_name"] = "Unknown Brand"
         except Exception as e:
             logger.error(f"Error fetching brand information: {str(e)}")
             mission["brand_name"] = "Unknown Brand"
@@ -178,6 +204,8 @@ class EntertainmentLiveService:
         brand_id: str, mission: EntertainmentLiveCreate
     ) -> dict[str, Any]:
         """Create a new entertainment live mission for a specific brand."""
+        supabase = get_async_supabase()
+
         logger.info(
             f"Creating entertainment live mission for brand ID {brand_id}: {mission.task_title}"
         )
@@ -190,32 +218,15 @@ class EntertainmentLiveService:
         logger.info(f"Looking up brand profile for brand ID: {brand_id}")
 
         try:
-            brand_profile_response = (
-                supabase.table("BrandProfile")
-                .select("id, userId, companyName")
-                .eq("id", brand_id)
-                .execute()
-            )
+            # Accept either a brand profile ID or the brand owner's user ID
+            actual_brand_id = await BrandProfileService.resolve_profile_or_user_id(brand_id)
 
-            if not brand_profile_response.data or len(brand_profile_response.data) == 0:
-                # Try with userId
-                brand_profile_response = (
-                    supabase.table("BrandProfile")
-                    .select("id, userId, companyName")
-                    .eq("userId", brand_id)
-                    .execute()
+            if not actual_brand_id:
+                logger.warning(f"Brand profile not found for ID: {brand_id}")
+                raise HTTPException(
+                    status_code=404, detail=f"Brand profile not found for ID: {brand_id}"
                 )
 
-                if not brand_profile_response.data or len(brand_profile_response.data) == 0:
-                    logger.warning(f"Brand profile not found for ID: {brand_id}")
-                    raise HTTPException(
-                        status_code=404, detail=f"Brand profile not found for ID: {brand_id}"
-                    )
-
-                actual_brand_id = brand_profile_response.data[0]["id"]
-            else:
-                actual_brand_id = brand_id
-
             logger.info(f"Found brand profile ID: {actual_brand_id}")
 
         except Exception as lookup_error:
@@ -238,7 +249,8 @@ class EntertainmentLiveService:
         mission_data = {k: v for k, v in mission_data.items() if v is not None and v != ""}
 
         try:
-            response = supabase.table("entertainment_live").insert(mission_data).execute()
+            response = await supabase.table("entertainment_live").insert(mission_data).execute()
+            EntertainmentLiveService.invalidate_cache()
             logger.info(f"Entertainment live mission created successfully: {response}")
 
             if response.data:
@@ -260,6 +272,8 @@ class EntertainmentLiveService:
         brand_id: str, mission_id: str, mission_update: EntertainmentLiveCreate
     ) -> dict[str, Any]:
         """Update an existing entertainment live mission for a specific brand."""
+        supabase = get_async_supabase()
+
         logger.info(f"Updating entertainment live mission {mission_id} for brand ID {brand_id}")
 
         if not supabase:
@@ -267,18 +281,14 @@ class EntertainmentLiveService:
             raise HTTPException(500, "Database not configured")
 
         # Verify brand profile and mission ownership
-        brand_profile_response = (
-            supabase.table("BrandProfile").select("id").eq("userId", brand_id).execute()
-        )
+        actual_brand_id = await BrandProfileService.resolve_brand_id(brand_id)
 
-        if not brand_profile_response.data or len(brand_profile_response.data) == 0:
+        if not actual_brand_id:
             logger.warning(f"Brand profile not found for user ID: {brand_id}")
             raise HTTPException(status_code=404, detail="Brand profile not found")
 
-        actual_brand_id = brand_profile_response.data[0]["id"]
-
         existing_mission = (
-            supabase.table("entertainment_live")
+            await supabase.table("entertainment_live")
             .select("*")
             .eq("id", mission_id)
             .eq("brand_id", actual_brand_id)
@@ -302,12 +312,13 @@ class EntertainmentLiveService:
 
         try:
             response = (
-                supabase.table("entertainment_live")
+                await supabase.table("entertainment_live")
                 .update(mission_data)
                 .eq("id", mission_id)
                 .eq("brand_id", actual_brand_id)
                 .execute()
             )
+            EntertainmentLiveService.invalidate_cache()
 
             if response.data:
                 return {
@@ -325,24 +336,22 @@ class EntertainmentLiveService:
     @staticmethod
     async def delete_entertainment_live_mission(brand_id: str, mission_id: str) -> dict[str, Any]:
         """Delete an entertainment live mission for a specific brand."""
+        supabase = get_async_supabase()
+
         logger.info(f"Deleting entertainment live mission {mission_id} for brand ID {brand_id}")
 
         if not supabase:
             logger.warning("Supabase not configured, cannot delete mission")
             raise HTTPException(500, "Database not configured")
 
-        brand_profile_response = (
-            supabase.table("BrandProfile").select("id").eq("userId", brand_id).execute()
-        )
+        actual_brand_id = await BrandProfileService.resolve_brand_id(brand_id)
 
-        if not brand_profile_response.data or len(brand_profile_response.data) == 0:
+        if not actual_brand_id:
             logger.warning(f"Brand profile not found for user ID: {brand_id}")
             raise HTTPException(status_code=404, detail="Brand profile not found")
 
-        actual_brand_id = brand_profile_response.data[0]["id"]
-
         existing_mission = (
-            supabase.table("entertainment_live")
+            await supabase.table("entertainment_live")
             .select("id, task_title")
             .eq("id", mission_id)
             .eq("brand_id", actual_brand_id)
@@ -353,12 +362,13 @@ class EntertainmentLiveService:
             raise HTTPException(404, "Mission not found or access denied")
 
         (
-            supabase.table("entertainment_live")
+            await supabase.table("entertainment_live")
             .delete()
             .eq("id", mission_id)
             .eq("brand_id", actual_brand_id)
             .execute()
         )
+        EntertainmentLiveService.invalidate_cache()
 
         return {
             "success": True,
@@ -0,0 +1,315 @@
+import asyncio
+import contextlib
+import logging
+import smtplib
+import time
+from dataclasses import dataclass
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from email.utils import formataddr
+from typing import Any
+
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# 5xx replies (bad recipient, rejected auth, policy blocks) will not succeed on retry
+_PERMANENT_SMTP_ERRORS = (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused)
+
+
+@dataclass
+class MailMessage:
+    to_email: str
+    subject: str
+    html_content: str
+    from_name: str
+    from_email: str | None = None
+    text_content: str | None = None
+
+
+class _SmtpConnection:
+    """One persistent SMTP session; only ever used from a single worker at a time."""
+
+    def __init__(self) -> None:
+        self._smtp: smtplib.SMTP | None = None
+        self._last_used = 0.0
+
+    @property
+    def connected(self) -> bool:
+        return self._smtp is not None
+
+    def sendmail(self, to_email: str, payload: str) -> None:
+        smtp = self._connection()
+        smtp.sendmail(settings.SMTP_USER, to_email, payload)
+        self._last_used = time.monotonic()
+
+    def _connection(self) -> smtplib.SMTP:
+        """Return the open SMTP session, reconnecting if it has sat idle too long."""
+        if self._smtp and time.monotonic() - self._last_used > settings.SMTP_IDLE_TIMEOUT:
+            self.close()
+        if self._smtp:
+            return self._smtp
+
+        logger.info(f"Connecting to SMTP server: {settings.SMTP_HOST}:{settings.SMTP_PORT}")
+
+        smtp: smtplib.SMTP_SSL | smtplib.SMTP
+        if settings.SMTP_SECURE:
+            smtp = smtplib.SMTP_SSL(
+                settings.SMTP_HOST, settings.SMTP_PORT, timeout=settings.SMTP_TIMEOUT
+            )
+        else:
+            smtp = smtplib.SMTP(
+                settings.SMTP_HOST, settings.SMTP_PORT, timeout=settings.SMTP_TIMEOUT
+            )
+
+        try:
+            if not settings.SMTP_SECURE and settings.SMTP_STARTTLS:
+                smtp.starttls()
+            smtp.ehlo_or_helo_if_needed()
+            # Local relays and test stubs (e.g. aiosmtpd) may not offer AUTH at all
+            if smtp.has_extn("auth"):
+                smtp.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
+        except Exception:
+            smtp.close()
+            raise
+
+        self._smtp = smtp
+        self._last_used = time.monotonic()
+        return smtp
+
+    def close(self) -> None:
+        smtp, self._smtp = self._smtp, None
+        if not smtp:
+            return
+        try:
+            smtp.quit()
+        except Exception:
+            smtp.close()
+
+
+class MailService:
+    """Background mail queue delivered by a small pool of SMTP workers.
+
+    Producers enqueue and return immediately. Each of the MAIL_WORKERS worker tasks keeps
+    its own persistent SMTP session and runs every blocking smtplib call in a thread, so
+    queued messages (e.g. the admin and user emails of one form) go out concurrently and
+    the event loop is never held up.
+    """
+
+    def __init__(self) -> None:
+        self._queue: asyncio.Queue[tuple[MailMessage, asyncio.Future | None]] | None = None
+        self._queue_loop: asyncio.AbstractEventLoop | None = None
+        self._workers: list[asyncio.Task] = []
+        self._connections: list[_SmtpConnection] = []
+        self._stats = {"queued": 0, "sent": 0, "failed": 0, "retries": 0, "dropped": 0}
+        self._send_ms_total = 0.0
+        self._send_ms_max = 0.0
+        # Delivery watchers returned by dispatch(), referenced until they finish
+        self._watchers: set[asyncio.Task] = set()
+
+    @staticmethod
+    def is_configured() -> bool:
+        return all([settings.SMTP_USER, settings.SMTP_PASSWORD])
+
+    async def start(self) -> None:
+        """Start the dispatch workers on the running loop (idempotent)."""
+        self._ensure_workers()
+
+    async def stop(self, timeout: float | None = None) -> None:
+        """Drain pending mail (bounded by `timeout`), then stop the workers and disconnect."""
+        if not self._workers:
+            return
+
+        if self._queue and not self._queue.empty():
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout or settings.MAIL_DRAIN_TIMEOUT)
+            except TimeoutError:
+                logger.warning(f"Mail queue not drained on shutdown: {self._queue.qsize()} pending")
+
+        for worker in self._workers:
+            worker.cancel()
+        for worker in self._workers:
+            with contextlib.suppress(asyncio.CancelledError):
+                await worker
+        self._workers = []
+
+        # Anything left after the drain timeout is reported as not sent to waiting callers
+        while not self._queue.empty():
+            message, future = self._queue.get_nowait()
+            self._stats["dropped"] += 1
+            if future and not future.done():
+                future.set_result(False)
+        self._queue = None
+        self._queue_loop = None
+
+        await asyncio.gather(
+            *(asyncio.to_thread(connection.close) for connection in self._connections)
+        )
+        self._connections = []
+        logger.info("Mail dispatch workers stopped")
+
+    def enqueue(self, message: MailMessage) -> bool:
+        """Queue a message for background delivery; False if it cannot be accepted."""
+        return self._put(message, None)
+
+    async def send(self, message: MailMessage) -> bool:
+        """Queue a message and wait for its delivery result."""
+        future = asyncio.get_running_loop().create_future()
+        if not self._put(message, future):
+            return False
+        return await future
+
+    def dispatch(self, *messages: MailMessage, label: str = "Mail") -> asyncio.Task:
+        """Queue messages together without waiting on SMTP.
+
+        Returns a task resolving to True once every message has been delivered; the
+        aggregated outcome is also logged under `label`, so callers may ignore the task.
+        """
+        loop = asyncio.get_running_loop()
+        futures = []
+        for message in messages:
+            future = loop.create_future()
+            if not self._put(message, future):
+                future.set_result(False)
+            futures.append(future)
+
+        watcher = loop.create_task(self._delivery_result(futures, label))
+        self._watchers.add(watcher)
+        watcher.add_done_callback(self._watchers.discard)
+        return watcher
+
+    def stats(self) -> dict[str, Any]:
+        delivered = self._stats["sent"] + self._stats["failed"]
+        return {
+            **self._stats,
+            "pending": self._queue.qsize() if self._queue else 0,
+            "workers": len(self._workers),
+            "connected": sum(connection.connected for connection in self._connections),
+            "avg_send_ms": round(self._send_ms_total / delivered, 1) if delivered else 0.0,
+            "max_send_ms": round(self._send_ms_max, 1),
+        }
+
+    @staticmethod
+    async def _delivery_result(futures: list[asyncio.Future], label: str) -> bool:
+        results = await asyncio.gather(*futures)
+        email_success = all(results)
+        logger.info(
+            f"{label} email delivery complete - Email Success: {email_success} ({sum(results)}/{len(results)} sent)"
+        )
+        return email_success
+
+    def _put(self, message: MailMessage, future: asyncio.Future | None) -> bool:
+        if not self.is_configured():
+            logger.error("SMTP configuration incomplete")
+            return False
+
+        self._ensure_workers()
+        try:
+            self._queue.put_nowait((message, future))
+        except asyncio.QueueFull:
+            self._stats["dropped"] += 1
+            logger.error(f"Mail queue full, dropping email to {message.to_email}")
+            return False
+
+        self._stats["queued"] += 1
+        return True
+
+    def _ensure_workers(self) -> None:
+        if self._workers and not all(worker.done() for worker in self._workers):
+            return
+        worker_count = max(1, settings.MAIL_WORKERS)
+        # Respawned workers pick up whatever is still queued; asyncio queues are bound to
+        # one loop, so a new queue is only built when there is none or the loop changed
+        if self._queue is None or self._queue_loop is not asyncio.get_running_loop():
+            self._queue = asyncio.Queue(maxsize=settings.MAIL_QUEUE_MAXSIZE)
+            self._queue_loop = asyncio.get_running_loop()
+        self._connections = [_SmtpConnection() for _ in range(worker_count)]
+        self._workers = [
+            asyncio.create_task(self._run(connection), name=f"mail-dispatch-{index}")
+            for index, connection in enumerate(self._connections)
+        ]
+        logger.info(f"Started {worker_count} mail dispatch workers")
+
+    async def _run(self, connection: _SmtpConnection) -> None:
+        queue = self._queue
+        while True:
+            message, future = await queue.get()
+            try:
+                sent = await self._deliver(connection, message)
+                if future and not future.done():
+                    future.set_result(sent)
+            except asyncio.CancelledError:
+                # Stopped mid-delivery: the caller awaiting send() must not hang
+                self._stats["dropped"] += 1
+                if future and not future.done():
+                    future.set_result(False)
+                raise
+            except Exception as e:
+                logger.error(f"Mail worker error for {message.to_email}: {str(e)}")
+                if future and not future.done():
+                    future.set_result(False)
+            finally:
+                queue.task_done()
+
+    async def _deliver(self, connection: _SmtpConnection, message: MailMessage) -> bool:
+        """Send one message, reconnecting and backing off on transient failures."""
+        started = time.perf_counter()
+        payload = self._build(message)
+
+        for attempt in range(settings.MAIL_MAX_RETRIES + 1):
+            try:
+                await asyncio.to_thread(connection.sendmail, message.to_email, payload)
+                elapsed_ms = self._record_timing(started)
+                self._stats["sent"] += 1
+                logger.info(
+                    f"Email sent successfully to {message.to_email} in {elapsed_ms:.0f}ms (attempt {attempt + 1})"
+                )
+                return True
+            except _PERMANENT_SMTP_ERRORS as e:
+                logger.error(f"Email to {message.to_email} rejected: {str(e)}")
+                break
+            except smtplib.SMTPResponseException as e:
+                await asyncio.to_thread(connection.close)
+                if e.smtp_code >= 500:
+                    logger.error(f"Email to {message.to_email} rejected: {str(e)}")
+                    break
+                error = e
+            except (smtplib.SMTPException, OSError) as e:
+                await asyncio.to_thread(connection.close)
+                error = e
+
+            if attempt < settings.MAIL_MAX_RETRIES:
+                delay = settings.MAIL_RETRY_BACKOFF * 2**attempt
+                self._stats["retries"] += 1
+                logger.warning(
+                    f"Failed to send email to {message.to_email} (attempt {attempt + 1}): {str(error)}; retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+            else:
+                logger.error(f"Failed to send email to {message.to_email}: {str(error)}")
+
+        elapsed_ms = self._record_timing(started)
+        self._stats["failed"] += 1
+        logger.info(f"Gave up on email to {message.to_email} after {elapsed_ms:.0f}ms")
+        return False
+
+    def _record_timing(self, started: float) -> float:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self._send_ms_total += elapsed_ms
+        self._send_ms_max = max(self._send_ms_max, elapsed_ms)
+        return elapsed_ms
+
+    @staticmethod
+    def _build(message: MailMessage) -> str:
+        msg = MIMEMultipart("alternative")
+        msg["Subject"] = message.subject
+        msg["From"] = formataddr((message.from_name, message.from_email or settings.SMTP_USER))
+        msg["To"] = message.to_email
+        # Clients show the last alternative they support, so plain text goes first
+        if message.text_content:
+            msg.attach(MIMEText(message.text_content, "plain"))
+        msg.attach(MIMEText(message.html_content, "html"))
+        return msg.as_string()
+
+
+mail_service = MailService()
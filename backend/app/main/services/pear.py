@@ -14,9 +14,9 @@ class PearService:
             logger.info(f"Starting get_all_stores with search='{search}', limit={limit}")
 
             # Import here to avoid circular imports
-            from ..database.supabase_client import get_supabase_client
+            from ..database.supabase_client import get_async_supabase
 
-            supabase = get_supabase_client()
+            supabase = get_async_supabase()
             logger.info("Successfully got Supabase client")
 
             # Build query
@@ -32,7 +32,7 @@ class PearService:
 
             # Execute query
             logger.info("Executing Supabase query...")
-            response = query.execute()
+            response = await query.execute()
             logger.info(f"Supabase response: {response}")
 
             if response.data:
@@ -54,11 +54,11 @@ class PearService:
         try:
             logger.info(f"Getting store by ID: {store_id}")
 
-            from ..database.supabase_client import get_supabase_client
+            from ..database.supabase_client import get_async_supabase
 
-            supabase = get_supabase_client()
+            supabase = get_async_supabase()
 
-            response = supabase.table("pear_brand").select("*").eq("id", store_id).execute()
+            response = await supabase.table("pear_brand").select("*").eq("id", store_id).execute()
 
             if response.data and len(response.data) > 0:
                 logger.info(f"Retrieved pear brand store: {store_id}")
@@ -79,9 +79,9 @@ class PearService:
         try:
             logger.info(f"Creating store: {store_data.store_name}")
 
-            from ..database.supabase_client import get_supabase_client
+            from ..database.supabase_client import get_async_supabase
 
-            supabase = get_supabase_client()
+            supabase = get_async_supabase()
 
             # Prepare store data including store_logo
             store_dict = {
@@ -95,7 +95,7 @@ class PearService:
                 store_dict["store_logo"] = store_data.store_logo
 
             # Insert into database
-            response = supabase.table("pear_brand").insert(store_dict).execute()
+            response = await supabase.table("pear_brand").insert(store_dict).execute()
 
             if response.data and len(response.data) > 0:
                 store_id = response.data[0]["id"]
@@ -0,0 +1,147 @@
+import asyncio
+import contextlib
+import logging
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from typing import Any
+
+from ..config.settings import settings
+from ..utils.cache import get_cache
+
+logger = logging.getLogger(__name__)
+
+# Job states: queued -> uploading -> processing -> completed | failed
+JOB_FINAL_STATES = frozenset({"completed", "failed"})
+
+JobRunner = Callable[[dict[str, Any]], Awaitable[None]]
+
+_jobs = get_cache("tiktok_publish_jobs", maxsize=4096, ttl=settings.TIKTOK_JOB_TTL)
+
+
+class TikTokJobService:
+    """Background queue of TikTok publish jobs run by a small worker pool.
+
+    Callers enqueue a runner coroutine and get a job id back immediately; the runner
+    does the actual relay and status polling and reports progress through `update`.
+    Job records live in an in-process TTL cache and never hold the access token, which
+    only exists in the queued runner itself.
+    """
+
+    def __init__(self) -> None:
+        self._queue: asyncio.Queue[tuple[str, JobRunner]] | None = None
+        self._queue_loop: asyncio.AbstractEventLoop | None = None
+        self._workers: list[asyncio.Task] = []
+        self._stats = {"queued": 0, "completed": 0, "failed": 0, "rejected": 0}
+
+    async def start(self) -> None:
+        """Start the job workers on the running loop (idempotent)."""
+        self._ensure_workers()
+
+    async def stop(self) -> None:
+        """Stop the workers; jobs still queued or running are marked failed.
+
+        Transfers can take minutes, so they are not drained. Interrupted chunked uploads
+        stay resumable through the upload resume endpoint while this process lives.
+        """
+        if not self._workers:
+            return
+
+        for worker in self._workers:
+            worker.cancel()
+        for worker in self._workers:
+            with contextlib.suppress(asyncio.CancelledError):
+                await worker
+        self._workers = []
+
+        while not self._queue.empty():
+            job_id, _ = self._queue.get_nowait()
+            self._finish(job_id, "failed", error="Server shut down before the job started")
+        self._queue = None
+        self._queue_loop = None
+        logger.info("TikTok job workers stopped")
+
+    def enqueue(self, runner: JobRunner, **fields: Any) -> dict[str, Any] | None:
+        """Register a job and queue its runner; None if the queue is full."""
+        self._ensure_workers()
+        now = datetime.now(UTC).isoformat()
+        job = {
+            **fields,
+            "job_id": str(uuid.uuid4()),
+            "status": "queued",
+            "error": None,
+            "created_at": now,
+            "updated_at": now,
+        }
+        try:
+            self._queue.put_nowait((job["job_id"], runner))
+        except asyncio.QueueFull:
+            self._stats["rejected"] += 1
+            logger.error("TikTok job queue full, rejecting job")
+            return None
+
+        _jobs.set(job["job_id"], job)
+        self._stats["queued"] += 1
+        return job
+
+    @staticmethod
+    def get(job_id: str) -> dict[str, Any] | None:
+        return _jobs.get(job_id)
+
+    @staticmethod
+    def update(job_id: str, **fields: Any) -> dict[str, Any] | None:
+        """Merge `fields` into a job record and refresh its TTL."""
+        job = _jobs.get(job_id)
+        if job is None:
+            return None
+        job.update(fields, updated_at=datetime.now(UTC).isoformat())
+        _jobs.set(job_id, job)
+        return job
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **self._stats,
+            "pending": self._queue.qsize() if self._queue else 0,
+            "workers": len(self._workers),
+        }
+
+    def _finish(self, job_id: str, status: str, **fields: Any) -> None:
+        self.update(job_id, status=status, **fields)
+        self._stats["completed" if status == "completed" else "failed"] += 1
+
+    def _ensure_workers(self) -> None:
+        if self._workers and not all(worker.done() for worker in self._workers):
+            return
+        worker_count = max(1, settings.TIKTOK_JOB_WORKERS)
+        # Respawned workers pick up jobs already queued; a new queue is only needed on a new loop
+        if self._queue is None or self._queue_loop is not asyncio.get_running_loop():
+            self._queue = asyncio.Queue(maxsize=settings.TIKTOK_JOB_QUEUE_MAXSIZE)
+            self._queue_loop = asyncio.get_running_loop()
+        self._workers = [
+            asyncio.create_task(self._run(), name=f"tiktok-job-{index}")
+            for index in range(worker_count)
+        ]
+        logger.info(f"Started {worker_count} TikTok job workers")
+
+    async def _run(self) -> None:
+        queue = self._queue
+        while True:
+            job_id, runner = await queue.get()
+            job = self.get(job_id)
+            try:
+                if job is None:
+                    continue
+                await runner(job)
+                status = job["status"] if job["status"] in JOB_FINAL_STATES else "completed"
+                self._finish(job_id, status)
+            except asyncio.CancelledError:
+                self._finish(job_id, "failed", error="Server shut down while the job was running")
+                raise
+            except Exception as exc:
+                logger.error(f"TikTok job {job_id} failed: {str(exc)}")
+                self._finish(job_id, "failed", error="Unexpected server error")
+            finally:
+                queue.task_done()
+
+
+tiktok_job_service = TikTokJobService()
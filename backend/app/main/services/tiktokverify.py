@@ -1,69 +1,54 @@
-import io
+import asyncio
 import logging
 from datetime import datetime
 
 from fastapi import HTTPException, UploadFile
 
+from ..database.async_client import get_async_supabase
 from ..database.connection import supabase
+from ..database.storage import remove_objects, upload_object
 from ..models.tiktokverify import TikTokVerificationCreate
+from ..utils.uploads import upload_body, upload_size
 
 logger = logging.getLogger(__name__)
 
+# (form field, file_paths key, storage file name) for each verification upload
+VERIFICATION_FILES = (
+    ("id_front_file", "id_front_path", "id_front"),
+    ("handheld_id_file", "handheld_id_path", "id_handheld"),
+    ("backend_ss_file", "backend_ss_path", "backend_ss"),
+    ("signed_auth_file", "authorization_path", "authorization"),
+    ("identity_video_file", "identity_video_path", "identity_video"),
+)
+
 
 class TikTokVerificationService:
     def __init__(self):
         self.supabase = supabase
 
-    def _upload_to_bucket(self, path: str, file: UploadFile) -> bool:
+    @property
+    def db(self):
+        """Pooled async client used for table queries"""
+        return get_async_supabase()
+
+    async def _upload_to_bucket(self, path: str, file: UploadFile) -> bool:
         """Upload file to Supabase storage bucket"""
         try:
             logger.info(f"Uploading file to path: {path}")
-            content = io.BytesIO(file.file.read())
-
-            # Try to upload with correct parameter format
-            try:
-                # Combine file options into a single parameter
-                file_options = {"content-type": file.content_type, "upsert": True}
-
-                # Use file_options as the third argument
-                resp = self.supabase.storage.from_("verification-assets").upload(
-                    path, content.getvalue(), file_options
+            async with upload_body(file) as content:
+                await upload_object(
+                    self.supabase, "verification-assets", path, content, file.content_type
                 )
-                logger.info(f"Upload response: {resp}")
-                return True
-            except Exception as upload_err:
-                logger.error(f"Upload error details: {str(upload_err)}")
-
-                # Try alternate approach if first one fails
-                try:
-                    # First remove the file if it exists
-                    try:
-                        self.supabase.storage.from_("verification-assets").remove([path])
-                        logger.info(f"Removed existing file at {path}")
-                    except Exception:
-                        # Ignore removal errors
-                        pass
-
-                    # Then try simpler upload without upsert option
-                    resp = self.supabase.storage.from_("verification-assets").upload(
-                        path, content.getvalue()
-                    )
-                    logger.info(f"Second upload response: {resp}")
-                    return True
-                except Exception as second_err:
-                    logger.error(f"Second upload attempt failed: {str(second_err)}")
-                    raise HTTPException(
-                        500, f"File upload error after second attempt: {str(second_err)}"
-                    )
+            return True
         except Exception as e:
             logger.error(f"Upload error: {str(e)}")
             raise HTTPException(500, f"Storage upload error: {str(e)}")
 
-    def check_id_exists(self, id_number: str) -> bool:
+    async def check_id_exists(self, id_number: str) -> bool:
         """Check if ID number already exists in database"""
         try:
-            existing = (
-                self.supabase.table("influencer_verifications")
+            existing = await (
+                self.db.table("influencer_verifications")
                 .select("id")
                 .eq("id_number", id_number)
                 .execute()
@@ -73,53 +58,52 @@ class TikTokVerificationService:
             logger.error(f"Error checking ID existence: {str(e)}")
             return False
 
-    def upload_files(self, id_number: str, files: dict) -> dict:
-        """Upload all verification files and return their paths"""
+    async def upload_files(self, id_number: str, files: dict) -> dict:
+        """Upload all verification files concurrently and return their paths"""
         folder = f"{id_number}"
-        file_paths: dict[str, str] = {}
 
+        # identity_video_path is absent (not set) when no video file is provided
+        planned: dict[str, tuple[str, UploadFile]] = {}
+        for file_key, path_key, name in VERIFICATION_FILES:
+            file = files.get(file_key)
+            if file:
+                planned[path_key] = (f"{folder}/{name}.{file.filename.split('.')[-1]}", file)
+
+        # The storage gateway bounds how many of these run at once; start the largest
+        # (usually the identity video) first so it is never queued behind the images
+        order = sorted(planned, key=lambda key: upload_size(planned[key][1]) or 0, reverse=True)
+        results = await asyncio.gather(
+            *(self._upload_to_bucket(*planned[key]) for key in order), return_exceptions=True
+        )
+
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures:
+            uploaded = [
+                planned[key][0]
+                for key, result in zip(order, results, strict=False)
+                if result is True
+            ]
+            await self._remove_uploaded(uploaded)
+
+            error = failures[0]
+            detail = error.detail if isinstance(error, HTTPException) else str(error)
+            logger.error(f"File upload error: {detail}")
+            raise HTTPException(500, f"File upload error: {detail}")
+
+        logger.info("All files uploaded successfully")
+        return {key: path for key, (path, _) in planned.items()}
+
+    async def _remove_uploaded(self, paths: list[str]) -> None:
+        """Best-effort cleanup of files from a submission that failed part-way"""
+        if not paths:
+            return
         try:
-            # Upload each file with better error handling
-            if files.get("id_front_file"):
-                file_paths["id_front_path"] = (
-                    f"{folder}/id_front.{files['id_front_file'].filename.split('.')[-1]}"
-                )
-                self._upload_to_bucket(file_paths["id_front_path"], files["id_front_file"])
-
-            if files.get("handheld_id_file"):
-                file_paths["handheld_id_path"] = (
-                    f"{folder}/id_handheld.{files['handheld_id_file'].filename.split('.')[-1]}"
-                )
-                self._upload_to_bucket(file_paths["handheld_id_path"], files["handheld_id_file"])
-
-            if files.get("backend_ss_file"):
-                file_paths["backend_ss_path"] = (
-                    f"{folder}/backend_ss.{files['backend_ss_file'].filename.split('.')[-1]}"
-                )
-                self._upload_to_bucket(file_paths["backend_ss_path"], files["backend_ss_file"])
-
-            if files.get("signed_auth_file"):
-                file_paths["authorization_path"] = (
-                    f"{folder}/authorization.{files['signed_auth_file'].filename.split('.')[-1]}"
-                )
-                self._upload_to_bucket(file_paths["authorization_path"], files["signed_auth_file"])
-
-            if files.get("identity_video_file"):
-                file_paths["identity_video_path"] = (
-                    f"{folder}/identity_video.{files['identity_video_file'].filename.split('.')[-1]}"
-                )
-                self._upload_to_bucket(
-                    file_paths["identity_video_path"], files["identity_video_file"]
-                )
-            # identity_video_path is absent (not set) when no video file is provided
-
-            logger.info("All files uploaded successfully")
-            return file_paths
-        except Exception as upload_error:
-            logger.error(f"File upload error: {str(upload_error)}")
-            raise HTTPException(500, f"File upload error: {str(upload_error)}")
+            await remove_objects(self.supabase, "verification-assets", paths)
+            logger.info(f"Removed {len(paths)} partially uploaded verification files")
+        except Exception as e:
+            logger.error(f"Failed to clean up uploaded files {paths}: {str(e)}")
 
-    def create_verification(
+    async def create_verification(
         self, verification_data: TikTokVerificationCreate, file_paths: dict
     ) -> dict:
         """Create a new verification record in the database"""
@@ -149,7 +133,7 @@ class TikTokVerificationService:
 
             # Insert into database
             insert_response = (
-                self.supabase.table("influencer_verifications").insert(record).execute()
+                await self.db.table("influencer_verifications").insert(record).execute()
             )
             logger.info(f"Record inserted successfully: {insert_response}")
 
@@ -163,11 +147,11 @@ class TikTokVerificationService:
             logger.error(f"Database insert error: {str(e)}")
             raise HTTPException(500, f"Failed to save verification data: {str(e)}")
 
-    def get_verification_by_id(self, verification_id: str) -> dict | None:
+    async def get_verification_by_id(self, verification_id: str) -> dict | None:
         """Get verification by ID"""
         try:
-            result = (
-                self.supabase.table("influencer_verifications")
+            result = await (
+                self.db.table("influencer_verifications")
                 .select("*")
                 .eq("id", verification_id)
                 .execute()
@@ -180,11 +164,11 @@ class TikTokVerificationService:
             logger.error(f"Error fetching verification: {str(e)}")
             return None
 
-    def get_verifications(self, limit: int = 50, offset: int = 0) -> list:
+    async def get_verifications(self, limit: int = 50, offset: int = 0) -> list:
         """Get all verifications with pagination"""
         try:
-            result = (
-                self.supabase.table("influencer_verifications")
+            result = await (
+                self.db.table("influencer_verifications")
                 .select("*")
                 .order("created_at", desc=True)
                 .range(offset, offset + limit - 1)
@@ -230,12 +214,12 @@ class TikTokVerificationService:
             logger.error(f"Error in setup-storage: {str(e)}")
             raise HTTPException(500, f"Failed to set up storage: {str(e)}")
 
-    def diagnose_database(self) -> dict:
+    async def diagnose_database(self) -> dict:
         """Diagnose database and storage status"""
         try:
             # Check if table exists by trying a simple query
             try:
-                (self.supabase.table("influencer_verifications").select("id").limit(1).execute())
+                await self.db.table("influencer_verifications").select("id").limit(1).execute()
                 table_exists = True
                 table_structure = "Table accessible via Supabase API"
             except Exception as table_error:
@@ -336,7 +320,7 @@ class TikTokVerificationService:
             logger.error(f"Error generating upload URLs: {str(e)}")
             raise HTTPException(500, f"Failed to generate upload URLs: {str(e)}")
 
-    def create_verification_with_paths(self, verification_data) -> dict:
+    async def create_verification_with_paths(self, verification_data) -> dict:
         """Create a new verification record using pre-uploaded file paths"""
         try:
             logger.info("Creating verification record with file paths...")
@@ -373,7 +357,7 @@ class TikTokVerificationService:
 
             # Insert into database
             insert_response = (
-                self.supabase.table("influencer_verifications").insert(record).execute()
+                await self.db.table("influencer_verifications").insert(record).execute()
             )
             logger.info(f"Record inserted successfully: {insert_response}")
 
@@ -8,11 +8,17 @@ from fastapi import HTTPException, UploadFile
 
 from ..config.settings import settings
 from ..database.connection import supabase
+from ..database.storage import upload_object
 from ..models.upload import UploadResponse
+from ..utils.uploads import upload_body
 
 logger = logging.getLogger(__name__)
 
 
+# Campaign images are capped at 5MB
+MAX_UPLOAD_BYTES = 5 * 1024 * 1024
+
+
 class UploadService:
     @staticmethod
     def _validate_file(file: UploadFile) -> None:
@@ -25,63 +31,22 @@ class UploadService:
             )
 
         # Validate file size (5MB limit)
-        if hasattr(file, "size") and file.size and file.size > 5 * 1024 * 1024:
+        if hasattr(file, "size") and file.size and file.size > MAX_UPLOAD_BYTES:
             raise HTTPException(400, "File size must be less than 5MB")
 
     @staticmethod
-    def _upload_to_campaigns_bucket(path: str, file: UploadFile) -> bool:
-        """Upload file to campaigns bucket in Supabase storage."""
-        try:
-            logger.info(f"Uploading file to campaigns bucket at path: {path}")
-
-            if not supabase:
-                raise HTTPException(500, "Database connection not available")
-
-            # Validate file size by reading content
-            file.file.seek(0, 2)  # Seek to end
-            file_size = file.file.tell()
-            file.file.seek(0)  # Reset to beginning
+    async def _upload_to_campaigns_bucket(
+        path: str, content: bytes | io.BufferedReader, content_type: str | None
+    ) -> bool:
+        """Upload file content (bytes or a spooled-file stream) to the campaigns bucket."""
+        logger.info(f"Uploading file to campaigns bucket at path: {path}")
 
-            max_size = 5 * 1024 * 1024  # 5MB
-            if file_size > max_size:
-                raise HTTPException(
-                    400, f"File too large. Maximum size is {max_size // (1024*1024)}MB"
-                )
-
-            # Read file content
-            content = io.BytesIO(file.file.read())
-
-            try:
-                # Upload with file options
-                file_options = {"content-type": file.content_type, "upsert": True}
-
-                resp = supabase.storage.from_("campaigns").upload(
-                    path, content.getvalue(), file_options
-                )
-                logger.info(f"Upload response: {resp}")
-                return True
-
-            except Exception as upload_err:
-                logger.error(f"Upload error details: {str(upload_err)}")
-
-                # Try alternate approach if first one fails
-                try:
-                    # Remove existing file if it exists
-                    try:
-                        supabase.storage.from_("campaigns").remove([path])
-                        logger.info(f"Removed existing file at {path}")
-                    except Exception:
-                        pass
-
-                    # Try simpler upload
-                    resp = supabase.storage.from_("campaigns").upload(path, content.getvalue())
-                    logger.info(f"Second upload response: {resp}")
-                    return True
-
-                except Exception as second_err:
-                    logger.error(f"Second upload attempt failed: {str(second_err)}")
-                    raise HTTPException(500, f"File upload failed: {str(second_err)}")
+        if not supabase:
+            raise HTTPException(500, "Database connection not available")
 
+        try:
+            await upload_object(supabase, "campaigns", path, content, content_type)
+            return True
         except Exception as e:
             logger.error(f"Upload error: {str(e)}")
             raise HTTPException(500, f"Storage upload error: {str(e)}")
@@ -116,8 +81,11 @@ class UploadService:
             # Simple path for general uploads
             file_path = f"general/{unique_filename}"
 
-            # Upload file
-            UploadService._upload_to_campaigns_bucket(file_path, file)
+            # Upload file straight from its spooled buffer (size-bounded, no copies)
+            async with upload_body(file, MAX_UPLOAD_BYTES) as content:
+                await UploadService._upload_to_campaigns_bucket(
+                    file_path, content, file.content_type
+                )
 
             # Get public URL
             public_url = UploadService._get_public_url(file_path)
@@ -159,8 +127,11 @@ class UploadService:
             # Create folder structure: campaigns/{brand_id}/{campaign_id}/{filename}
             file_path = f"{brand_id}/{campaign_id}/{unique_filename}"
 
-            # Upload file
-            UploadService._upload_to_campaigns_bucket(file_path, file)
+            # Upload file straight from its spooled buffer (size-bounded, no copies)
+            async with upload_body(file, MAX_UPLOAD_BYTES) as content:
+                await UploadService._upload_to_campaigns_bucket(
+                    file_path, content, file.content_type
+                )
 
             # Get public URL
             public_url = UploadService._get_public_url(file_path)
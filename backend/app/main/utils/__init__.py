@@ -2,6 +2,22 @@
 Utility functions for Campaign API
 """
 
-from .validators import check_table_exists, validate_supabase_connection, validate_uuid
+from .cache import TTLCache, cache_stats, get_cache
+from .validators import (
+    check_table_exists,
+    invalidate_table_exists_cache,
+    validate_supabase_connection,
+    validate_uuid,
+    warm_table_exists_cache,
+)
 
-__all__ = ["validate_uuid", "check_table_exists", "validate_supabase_connection"]
+__all__ = [
+    "validate_uuid",
+    "check_table_exists",
+    "invalidate_table_exists_cache",
+    "warm_table_exists_cache",
+    "validate_supabase_connection",
+    "TTLCache",
+    "get_cache",
+    "cache_stats",
+]
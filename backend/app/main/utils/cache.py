@@ -0,0 +1,118 @@
+"""
+In-process TTL caches with LRU eviction
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe mapping whose entries expire after `ttl` seconds.
+
+    Once `maxsize` entries are stored, the least recently used entry is evicted.
+    Hit, miss and eviction counters are kept so the cache can be tuned.
+
+    With `copy_values`, values are deep-copied on the way in and out, so callers that
+    mutate what they get (e.g. while building a response) cannot corrupt the cached data.
+    """
+
+    def __init__(self, name: str, maxsize: int = 256, ttl: float = 60.0, copy_values: bool = False):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.copy_values = copy_values
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for `key`, or `default` if it is missing or expired."""
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return copy.deepcopy(value) if self.copy_values else value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """Store `value` under `key`, evicting the least recently used entry if full."""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        if self.copy_values:
+            value = copy.deepcopy(value)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single entry."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def invalidate_where(self, predicate) -> int:
+        """Drop every entry whose key satisfies `predicate` and return how many were removed."""
+        with self._lock:
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Return size and hit/miss counters for monitoring."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+def normalize_text(value: str | None) -> str | None:
+    """Collapse whitespace and case in a free-text parameter so equivalent queries share a key."""
+    if value is None:
+        return None
+    return " ".join(value.split()).lower() or None
+
+
+_registry: dict[str, TTLCache] = {}
+
+
+def get_cache(
+    name: str, maxsize: int = 256, ttl: float = 60.0, copy_values: bool = False
+) -> TTLCache:
+    """Return the named cache, creating it on first use."""
+    cache = _registry.get(name)
+    if cache is None:
+        cache = _registry[name] = TTLCache(name, maxsize=maxsize, ttl=ttl, copy_values=copy_values)
+    return cache
+
+
+def cache_stats() -> dict[str, dict[str, Any]]:
+    """Return statistics for every registered cache."""
+    return {name: cache.stats() for name, cache in _registry.items()}
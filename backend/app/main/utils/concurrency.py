@@ -0,0 +1,20 @@
+"""
+Process-wide concurrency limits shared across requests
+"""
+
+import asyncio
+
+_semaphores: dict[str, tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = {}
+
+
+def loop_semaphore(name: str, limit: int) -> asyncio.Semaphore:
+    """Return the semaphore registered under `name` for the running event loop.
+
+    asyncio primitives are bound to one loop, so the semaphore is recreated if the
+    worker's loop changes (e.g. between test clients).
+    """
+    loop = asyncio.get_running_loop()
+    entry = _semaphores.get(name)
+    if entry is None or entry[0] is not loop:
+        entry = _semaphores[name] = (loop, asyncio.Semaphore(max(1, limit)))
+    return entry[1]
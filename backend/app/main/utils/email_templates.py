@@ -0,0 +1,121 @@
+"""
+Precompiled email templates with plain-text alternates
+
+Templates use `string.Template` placeholders (`$name`) but are split into literal chunks
+once at load time, so rendering is a dict lookup per placeholder and one `str.join`.
+"""
+
+import html
+import logging
+import os
+from string import Template
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+EMAIL_TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "templates", "emails")
+
+
+class Markup(str):
+    """A value that is already safe HTML and is substituted without escaping."""
+
+
+def nl2br(value: str) -> Markup:
+    """Escape `value` and turn its line breaks into <br> tags."""
+    return Markup(html.escape(value).replace("\n", "<br>"))
+
+
+def _compile(source: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Split a template into literal chunks and the placeholder names between them."""
+    chunks: list[str] = []
+    fields: list[str] = []
+    literal = ""
+    position = 0
+
+    for match in Template.pattern.finditer(source):
+        literal += source[position : match.start()]
+        position = match.end()
+
+        if match.group("escaped") is not None:
+            literal += "$"
+            continue
+        field = match.group("named") or match.group("braced")
+        if field is None:
+            raise ValueError(f"Invalid placeholder in email template at offset {match.start()}")
+        chunks.append(literal)
+        fields.append(field)
+        literal = ""
+
+    chunks.append(literal + source[position:])
+    return tuple(chunks), tuple(fields)
+
+
+def _fill(compiled: tuple[tuple[str, ...], tuple[str, ...]], values: dict[str, str]) -> str:
+    chunks, fields = compiled
+    parts: list[str] = [""] * (len(chunks) + len(fields))
+    parts[::2] = chunks
+    parts[1::2] = [values[field] for field in fields]
+    return "".join(parts)
+
+
+class EmailTemplate:
+    """An HTML template and optional plain-text alternate, compiled once."""
+
+    def __init__(self, name: str, html_source: str, text_source: str | None = None):
+        self.name = name
+        self._html = _compile(html_source)
+        self._text = _compile(text_source) if text_source is not None else None
+
+    def render(self, **context: Any) -> tuple[str, str | None]:
+        """Return (html, text). Values are HTML-escaped unless wrapped in Markup."""
+        html_values = {
+            key: value if isinstance(value, Markup) else html.escape(str(value))
+            for key, value in context.items()
+        }
+        rendered_html = _fill(self._html, html_values)
+
+        rendered_text = None
+        if self._text:
+            rendered_text = _fill(self._text, {key: str(value) for key, value in context.items()})
+        return rendered_html, rendered_text
+
+
+_templates: dict[str, EmailTemplate] = {}
+
+
+def load_email_templates(directory: str = EMAIL_TEMPLATE_DIR) -> int:
+    """Read and compile every `<name>.html` (plus `<name>.txt` if present) in `directory`."""
+    loaded: dict[str, EmailTemplate] = {}
+
+    for filename in sorted(os.listdir(directory)):
+        name, extension = os.path.splitext(filename)
+        if extension != ".html":
+            continue
+
+        with open(os.path.join(directory, filename), encoding="utf-8") as f:
+            html_source = f.read()
+
+        text_source = None
+        text_path = os.path.join(directory, f"{name}.txt")
+        if os.path.exists(text_path):
+            with open(text_path, encoding="utf-8") as f:
+                text_source = f.read()
+
+        loaded[name] = EmailTemplate(name, html_source, text_source)
+
+    _templates.clear()
+    _templates.update(loaded)
+    logger.info(f"Loaded {len(loaded)} email templates from {directory}")
+    return len(loaded)
+
+
+def get_email_template(name: str) -> EmailTemplate:
+    """Return a compiled template, loading the template directory on first use."""
+    if not _templates:
+        load_email_templates()
+    return _templates[name]
+
+
+def render_email(template_name: str, /, **context: Any) -> tuple[str, str | None]:
+    """Render a named template to (html, text)."""
+    return get_email_template(template_name).render(**context)
@@ -0,0 +1,51 @@
+"""
+Shared outbound HTTP client for third-party APIs
+"""
+
+import importlib.util
+import logging
+
+import httpx
+
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_http_client: httpx.AsyncClient | None = None
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Build a keep-alive (and HTTP/2 when available) client with bounded pools."""
+    http2 = settings.HTTP_CLIENT_HTTP2 and importlib.util.find_spec("h2") is not None
+    if settings.HTTP_CLIENT_HTTP2 and not http2:
+        logger.warning("HTTP_CLIENT_HTTP2 is enabled but 'h2' is not installed, using HTTP/1.1")
+
+    return httpx.AsyncClient(
+        timeout=settings.HTTP_CLIENT_TIMEOUT,
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=settings.HTTP_CLIENT_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_CLIENT_MAX_KEEPALIVE,
+            keepalive_expiry=settings.HTTP_CLIENT_KEEPALIVE_EXPIRY,
+        ),
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = create_http_client()
+        logger.info(
+            f"Shared HTTP client initialized (max_connections={settings.HTTP_CLIENT_MAX_CONNECTIONS})"
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the pooled connections of the shared client."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        logger.info("Shared HTTP client closed")
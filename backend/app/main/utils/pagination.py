@@ -0,0 +1,64 @@
+"""
+Keyset (cursor) pagination helpers
+"""
+
+import base64
+import binascii
+import json
+from typing import Any
+
+from fastapi import HTTPException
+
+
+def encode_cursor(row: dict[str, Any], sort_column: str = "created_at") -> str:
+    """Build an opaque cursor pointing just past `row` in (sort_column, id) order."""
+    payload = json.dumps([row.get(sort_column), row.get("id")], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str | None, str]:
+    """Return the (sort value, id) pair stored in a cursor; the sort value may be null."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+    if not isinstance(sort_value, str | None) or not isinstance(row_id, str):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+    return sort_value, row_id
+
+
+def apply_keyset(query, cursor: str | None, sort_column: str = "created_at"):
+    """Order `query` newest-first by (sort_column, id) and start after `cursor`.
+
+    Rows with a null sort value come last (ordered by id), so they are still reachable.
+    Callers should fetch one extra row and pass it to `paginate` to detect further pages.
+    """
+    # postgrest-py adds a separate `order` param per .order() call and has no or_() builder,
+    # so the compound ordering and the row-comparison filter are set on the params directly.
+    query.params = query.params.add("order", f"{sort_column}.desc.nullslast,id.desc")
+    if not cursor:
+        return query
+
+    sort_value, row_id = decode_cursor(cursor)
+    if sort_value is None:
+        keyset = f'and({sort_column}.is.null,id.lt."{row_id}")'
+    else:
+        keyset = (
+            f'{sort_column}.lt."{sort_value}",'
+            f'and({sort_column}.eq."{sort_value}",id.lt."{row_id}"),'
+            f"{sort_column}.is.null"
+        )
+    query.params = query.params.add("or", f"({keyset})")
+    return query
+
+
+def paginate(
+    rows: list[dict[str, Any]], limit: int, sort_column: str = "created_at"
+) -> tuple[list[dict[str, Any]], str | None]:
+    """Trim `limit + 1` fetched rows to a page and return it with the next cursor."""
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    return page, encode_cursor(page[-1], sort_column)
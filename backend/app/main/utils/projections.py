@@ -0,0 +1,50 @@
+"""
+Sparse fieldsets: translate a `fields` query parameter into an explicit select list
+"""
+
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+
+def resolve_columns(
+    fields: str | None,
+    allowed: Iterable[str],
+    projections: Mapping[str, Iterable[str]] | None = None,
+    required: Iterable[str] = ("id",),
+) -> str:
+    """Return the select list for `fields`.
+
+    `fields` is either the name of a projection (e.g. "card") or a comma-separated list
+    of column names. Columns in `required` are always included because the service needs
+    them. Without `fields`, every column ("*") is selected.
+    """
+    if not fields or not fields.strip():
+        return "*"
+
+    name = fields.strip()
+    if projections and name in projections:
+        columns = list(projections[name])
+    else:
+        columns = [column.strip() for column in name.split(",") if column.strip()]
+        allowed_columns = set(allowed)
+        unknown = [column for column in columns if column not in allowed_columns]
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown fields: {', '.join(unknown)}. Use column names"
+                + (f" or one of: {', '.join(projections)}" if projections else ""),
+            )
+
+    return ", ".join(dict.fromkeys([*required, *columns]))
+
+
+def projected_response(payload: Any) -> JSONResponse:
+    """Serialize a projected payload as-is.
+
+    Going through the response model would fill every unselected field with its default.
+    """
+    return JSONResponse(content=jsonable_encoder(payload))
@@ -0,0 +1,81 @@
+"""
+Size-bounded, copy-free access to multipart uploads
+"""
+
+import contextlib
+import io
+import os
+from collections.abc import AsyncIterator
+from typing import Any
+
+from fastapi import HTTPException, UploadFile
+
+
+def upload_size(file: UploadFile) -> int | None:
+    """Size of an upload in bytes without reading it, if it can be determined."""
+    if file.size is not None:
+        return file.size
+    try:
+        position = file.file.tell()
+        file.file.seek(0, 2)
+        size = file.file.tell()
+        file.file.seek(position)
+        return size
+    except (AttributeError, OSError):
+        return None
+
+
+def disk_fileno(fileobj: Any) -> int | None:
+    """Descriptor of the on-disk file holding an upload, or None while it is in memory.
+
+    Uploads are SpooledTemporaryFiles, whose fileno() would force an in-memory buffer
+    out to disk, so the wrapped file (`_file`, a BytesIO until rollover) is inspected
+    instead. Plain file objects are asked directly.
+    """
+    buffer = getattr(fileobj, "_file", fileobj)
+    if isinstance(buffer, io.BytesIO | io.StringIO):
+        return None
+    try:
+        return buffer.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+
+def _too_large(max_size: int) -> HTTPException:
+    return HTTPException(400, f"File too large. Maximum size is {max_size // (1024 * 1024)}MB")
+
+
+@contextlib.asynccontextmanager
+async def upload_body(
+    file: UploadFile, max_size: int | None = None
+) -> AsyncIterator[bytes | io.BufferedReader]:
+    """Yield an upload's content in a form the storage client can send without copying it.
+
+    Starlette spools uploads over 1MB to a temporary file; those are handed over as a
+    read-only stream on the same file, which httpx sends in 64KB chunks, so request
+    memory stays flat regardless of file size. Small in-memory uploads are passed as
+    bytes. Oversized files are refused from their reported size before anything is read.
+    """
+    size = upload_size(file)
+    if max_size is not None and size is not None and size > max_size:
+        raise _too_large(max_size)
+
+    fileno = disk_fileno(file.file)
+    if size is not None and fileno is not None:
+        stream = os.fdopen(os.dup(fileno), "rb")
+        try:
+            stream.seek(0)
+            yield stream
+        finally:
+            stream.close()
+        return
+
+    await file.seek(0)
+    if max_size is None:
+        yield await file.read()
+        return
+
+    content = await file.read(max_size + 1)
+    if len(content) > max_size:
+        raise _too_large(max_size)
+    yield content
@@ -1,10 +1,21 @@
+import asyncio
 import logging
 import uuid
+from collections.abc import Iterable
 
-from supabase import Client
+from postgrest import AsyncPostgrestClient
+
+from ..config.settings import settings
+from .cache import get_cache
 
 logger = logging.getLogger(__name__)
 
+# Tables probed by list endpoints before querying; warmed into the cache at startup.
+LISTING_TABLES = ("campaigns", "entertainment_live")
+
+# Only positive results are cached so a missing table (or a transient error) is re-probed.
+_table_exists_cache = get_cache("table_exists", maxsize=64, ttl=settings.TABLE_EXISTS_CACHE_TTL)
+
 
 def validate_uuid(uuid_string: str) -> bool:
     """Validate if a string is a valid UUID format."""
@@ -15,24 +26,49 @@ def validate_uuid(uuid_string: str) -> bool:
         return False
 
 
-async def check_table_exists(supabase_client: Client, table_name: str) -> bool:
-    """Check if a table exists in Supabase."""
+async def check_table_exists(supabase_client: AsyncPostgrestClient, table_name: str) -> bool:
+    """Check if a table exists in Supabase, answering from cache once it has been seen."""
+    if _table_exists_cache.get(table_name):
+        return True
+
     try:
-        supabase_client.table(table_name).select("id").limit(1).execute()
+        await supabase_client.table(table_name).select("id").limit(1).execute()
+        _table_exists_cache.set(table_name, True)
         return True
     except Exception as e:
         logger.error(f"Error checking if table '{table_name}' exists: {str(e)}")
         return False
 
 
-async def validate_supabase_connection(supabase_client: Client) -> tuple[bool, str]:
+def invalidate_table_exists_cache(table_name: str | None = None) -> None:
+    """Forget cached table presence for one table, or for all tables."""
+    if table_name is None:
+        _table_exists_cache.clear()
+    else:
+        _table_exists_cache.invalidate(table_name)
+
+
+async def warm_table_exists_cache(
+    supabase_client: AsyncPostgrestClient, table_names: Iterable[str] = LISTING_TABLES
+) -> dict[str, bool]:
+    """Probe the given tables concurrently so the first list requests skip the round trip."""
+    table_names = list(table_names)
+    results = await asyncio.gather(
+        *(check_table_exists(supabase_client, name) for name in table_names)
+    )
+    status = dict(zip(table_names, results, strict=True))
+    logger.info(f"Warmed table existence cache: {status}")
+    return status
+
+
+async def validate_supabase_connection(supabase_client: AsyncPostgrestClient) -> tuple[bool, str]:
     """Test the Supabase connection and check permissions."""
     if not supabase_client:
         return False, "Supabase client not initialized"
 
     try:
         # Try a simple query that should work with minimal permissions
-        supabase_client.table("campaigns").select("id").limit(1).execute()
+        await supabase_client.table("campaigns").select("id").limit(1).execute()
         logger.info("Supabase connection test successful")
         return True, "Connection successful"
     except Exception as e:
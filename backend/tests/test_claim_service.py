@@ -0,0 +1,54 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import HTTPException
+from main.services import claim_service
+from main.services.claim_service import ClaimService
+from postgrest import AsyncPostgrestClient
+
+CLAIMED_ID = "3f2b8c1e-9d4a-4e6b-8a7c-1b2c3d4e5f60"
+OTHER_ID = "7a1d2e3f-4b5c-4d6e-9f80-a1b2c3d4e5f6"
+
+
+@pytest.fixture
+def claims_table(monkeypatch):
+    """Serve campaignclaims from a mock PostgREST that returns canonical (lowercase) ids."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=[{"campaign_id": CLAIMED_ID}])
+
+    client = AsyncPostgrestClient("http://supabase.test/rest/v1")
+    client.session = httpx.AsyncClient(
+        base_url="http://supabase.test/rest/v1", transport=httpx.MockTransport(handler)
+    )
+
+    async def resolve_creator_id(user_id):
+        return "creator-1"
+
+    monkeypatch.setattr(claim_service, "get_async_supabase", lambda: client)
+    monkeypatch.setattr(
+        claim_service.CreatorProfileService, "resolve_creator_id", resolve_creator_id
+    )
+    return requests
+
+
+def test_check_campaign_claims_matches_mixed_case_ids(claims_table):
+    mixed_case_id = CLAIMED_ID.upper()
+
+    result = asyncio.run(ClaimService.check_campaign_claims("user-1", [mixed_case_id, OTHER_ID]))
+
+    assert result == {"claims": {mixed_case_id: True, OTHER_ID: False}}
+    # The query uses canonical ids, whatever spelling the caller sent
+    assert CLAIMED_ID in claims_table[0].url.params["campaign_id"]
+
+
+def test_check_campaign_claims_rejects_malformed_ids(claims_table):
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(ClaimService.check_campaign_claims("user-1", [CLAIMED_ID, "not-a-uuid"]))
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail["campaign_ids"] == ["not-a-uuid"]
+    assert claims_table == []
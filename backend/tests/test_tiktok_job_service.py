@@ -0,0 +1,43 @@
+import asyncio
+
+from main.services import tiktok_job_service as job_module
+from main.services.tiktok_job_service import TikTokJobService
+
+
+def test_respawned_workers_run_jobs_left_in_the_queue(monkeypatch):
+    monkeypatch.setattr(job_module.settings, "TIKTOK_JOB_WORKERS", 1)
+
+    async def scenario():
+        service = TikTokJobService()
+        started = asyncio.Event()
+        ran: list[str] = []
+
+        async def blocking(job):
+            started.set()
+            await asyncio.Event().wait()
+
+        async def quick(job):
+            ran.append(job["job_id"])
+
+        running = service.enqueue(blocking)
+        waiting = service.enqueue(quick)
+        await started.wait()
+
+        # The only worker dies mid-job while the second job is still queued
+        service._workers[0].cancel()
+        await asyncio.gather(*service._workers, return_exceptions=True)
+        assert service.stats()["pending"] == 1
+
+        await service.start()
+        for _ in range(100):
+            if ran:
+                break
+            await asyncio.sleep(0)
+        await service.stop()
+        return running, waiting, ran
+
+    running, waiting, ran = asyncio.run(scenario())
+
+    assert ran == [waiting["job_id"]]
+    assert TikTokJobService.get(waiting["job_id"])["status"] == "completed"
+    assert TikTokJobService.get(running["job_id"])["status"] == "failed"
@@ -0,0 +1,70 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import HTTPException
+from main.routes import tiktok_upload
+
+SOURCE_URL = "https://storage.test/video.mp4"
+UPLOAD_URL = "https://tiktok.test/upload/p1"
+VIDEO = bytes(range(256)) * 64
+
+
+@pytest.fixture
+def relay(monkeypatch):
+    """Route chunk relays through a mock transport; `source_failures` queues GET statuses."""
+    state = {"source_failures": [], "puts": []}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            if state["source_failures"]:
+                return httpx.Response(state["source_failures"].pop(0), text="storage error")
+            start, end = map(int, request.headers["Range"].removeprefix("bytes=").split("-"))
+            return httpx.Response(206, content=VIDEO[start : end + 1])
+        state["puts"].append(request.headers["Content-Range"])
+        return httpx.Response(201)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(tiktok_upload, "get_http_client", lambda: client)
+    monkeypatch.setattr(tiktok_upload.settings, "TIKTOK_CHUNK_RETRIES", 1)
+    real_sleep = asyncio.sleep
+    monkeypatch.setattr(tiktok_upload.asyncio, "sleep", lambda delay: real_sleep(0))
+    return state
+
+
+def _progress() -> dict:
+    return {
+        "publish_id": "p1",
+        "upload_url": UPLOAD_URL,
+        "video_size": len(VIDEO),
+        "chunk_size": len(VIDEO) // 2,
+        "total_chunk_count": 2,
+        "next_byte": 0,
+        "status": "initialized",
+    }
+
+
+def test_transient_source_error_is_retried(relay):
+    relay["source_failures"] = [503]
+    progress = _progress()
+
+    asyncio.run(tiktok_upload._upload_chunks(SOURCE_URL, progress))
+
+    assert progress["status"] == "uploaded"
+    assert progress["next_byte"] == len(VIDEO)
+    assert len(relay["puts"]) == 2
+
+
+def test_permanent_source_error_leaves_upload_resumable(relay):
+    relay["source_failures"] = [403]
+    progress = _progress()
+    progress["next_byte"] = len(VIDEO) // 2
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(tiktok_upload._upload_chunks(SOURCE_URL, progress))
+
+    assert exc_info.value.detail["status"] == 403
+    assert exc_info.value.detail["resumable"] is True
+    assert exc_info.value.detail["next_byte"] == len(VIDEO) // 2
+    assert progress["status"] == "interrupted"
+    assert relay["puts"] == []
@@ -0,0 +1,49 @@
+import asyncio
+import io
+import tempfile
+
+from fastapi import UploadFile
+from main.utils.uploads import disk_fileno, upload_body
+
+
+def _spooled_upload(content: bytes, max_size: int) -> UploadFile:
+    spooled = tempfile.SpooledTemporaryFile(max_size=max_size)
+    spooled.write(content)
+    spooled.seek(0)
+    return UploadFile(spooled, size=len(content), filename="video.mp4")
+
+
+async def _read_body(file: UploadFile) -> tuple[type, bytes]:
+    async with upload_body(file, max_size=1024 * 1024) as body:
+        data = body if isinstance(body, bytes) else body.read()
+        return type(body), data
+
+
+def test_in_memory_upload_is_read_as_bytes():
+    file = _spooled_upload(b"small video", max_size=1024)
+
+    assert disk_fileno(file.file) is None
+    body_type, data = asyncio.run(_read_body(file))
+
+    assert body_type is bytes
+    assert data == b"small video"
+    # Inspecting the upload must not have forced it onto disk
+    assert disk_fileno(file.file) is None
+
+
+def test_on_disk_upload_is_streamed_from_its_file():
+    content = b"x" * 4096
+    file = _spooled_upload(content, max_size=1024)
+
+    assert disk_fileno(file.file) is not None
+    body_type, data = asyncio.run(_read_body(file))
+
+    assert issubclass(body_type, io.BufferedReader)
+    assert data == content
+    # The dup'd stream is closed on exit; the upload itself stays readable
+    file.file.seek(0)
+    assert file.file.read() == content
+
+
+def test_plain_in_memory_file_has_no_descriptor():
+    assert disk_fileno(io.BytesIO(b"data")) is None
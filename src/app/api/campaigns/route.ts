@@ -33,7 +33,7 @@ export async function GET(request: NextRequest) {
     const campaigns = await response.json();
     console.log(
       "Retrieved campaigns:",
-      Array.isArray(campaigns) ? campaigns.length : "not an array"
+      Array.isArray(campaigns?.items) ? campaigns.items.length : "no items"
     );
 
     return NextResponse.json(campaigns);
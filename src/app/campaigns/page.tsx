@@ -32,7 +32,9 @@ export default function Campaigns() {
   const [platformFilter, setPlatformFilter] = useState("all");
   const [categoryFilter, setCategoryFilter] = useState("all");
   const [campaigns, setCampaigns] = useState<Campaign[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [error, setError] = useState<string | null>(null);
   const [applyingTo, setApplyingTo] = useState<string | null>(null);
   const [applicationSuccess, setApplicationSuccess] = useState<boolean | null>(null);
@@ -69,12 +71,15 @@ export default function Campaigns() {
         }
 
         const data = await response.json();
-        console.log(`Received ${data.length} campaigns from API`);
-        setCampaigns(Array.isArray(data) ? data : []);
+        const items = Array.isArray(data) ? data : data.items || [];
+        console.log(`Received ${items.length} campaigns from API`);
+        setCampaigns(items);
+        setNextCursor(Array.isArray(data) ? null : data.next_cursor || null);
       } catch (err: any) {
         console.error("Error fetching campaigns:", err);
         setError(err.message || "Failed to load campaigns. Please try again later.");
         setCampaigns([]);
+        setNextCursor(null);
       } finally {
         setLoading(false);
       }
@@ -83,6 +88,34 @@ export default function Campaigns() {
     fetchCampaigns();
   }, [searchTerm, platformFilter]);
 
+  // Fetch the next page of campaigns using the cursor from the previous response
+  const loadMoreCampaigns = async () => {
+    if (!nextCursor || loadingMore) return;
+
+    try {
+      setLoadingMore(true);
+
+      const params = new URLSearchParams();
+      if (searchTerm) params.append("search", searchTerm);
+      if (platformFilter !== "all") params.append("platform", platformFilter);
+      params.append("cursor", nextCursor);
+
+      const response = await fetch(`/api/campaigns?${params.toString()}`);
+      if (!response.ok) {
+        throw new Error(`Failed to fetch more campaigns (status: ${response.status})`);
+      }
+
+      const data = await response.json();
+      setCampaigns((prev) => [...prev, ...(data.items || [])]);
+      setNextCursor(data.next_cursor || null);
+    } catch (err: any) {
+      console.error("Error fetching more campaigns:", err);
+      setError(err.message || "Failed to load more campaigns. Please try again later.");
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   // Filter campaigns based on search term and platform
   const filteredCampaigns = campaigns.filter((campaign) => {
     const matchesSearch =
@@ -525,6 +558,18 @@ export default function Campaigns() {
             ))}
           </div>
         )}
+
+        {!loading && !error && nextCursor && (
+          <div className="text-center mt-8">
+            <button
+              onClick={loadMoreCampaigns}
+              disabled={loadingMore}
+              className="inline-flex items-center px-4 py-2 border border-gray-300 text-sm font-medium rounded-md shadow-sm text-gray-700 bg-white hover:bg-gray-50 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-purple-500 disabled:opacity-50"
+            >
+              {loadingMore ? "Loading..." : "Load more campaigns"}
+            </button>
+          </div>
+        )}
       </div>
 
       {/* Application Modal - Ensure it's properly rendered with high z-index */}